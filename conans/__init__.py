@@ -17,7 +17,8 @@ CHECKSUM_DEPLOY = "checksum_deploy"  # Only when v2
 REVISIONS = "revisions"  # Only when enabled in config, not by default look at server_launcher.py
 ONLY_V2 = "only_v2"  # Remotes and virtuals from Artifactory returns this capability
 OAUTH_TOKEN = "oauth_token"
-SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS]  # Server is always with revisions
+# Server is always with revisions, and skips the upload of the files it already has
+SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS, CHECKSUM_DEPLOY]
 DEFAULT_REVISION_V1 = "0"
 
 __version__ = '1.20.0-dev'
@@ -3,30 +3,43 @@ import json
 import os
 
 from conans.build_info.conan_build_info import get_build_info
-from conans.util.files import save
+from conans.build_info.model import BuildInfo
+from conans.util.files import load, save
 
 
 def run():
 
-    parser = argparse.ArgumentParser(description='Extracts build-info from a specified '
-                                                 'conan trace log and return a valid JSON')
-    parser.add_argument('trace_path', help='Path to the conan trace log file e.g.: '
-                                           '/tmp/conan_trace.log')
+    parser = argparse.ArgumentParser(description='Extracts build-info from the specified '
+                                                 'conan trace logs and return a valid JSON')
+    parser.add_argument('trace_path', nargs="+",
+                        help='Path to the conan trace log file e.g.: /tmp/conan_trace.log. '
+                             'Several of them, like the ones of different CI jobs, are merged '
+                             'in a single build-info')
     parser.add_argument("--output", default=False,
                         help='Optional file to output the JSON contents, if not specified the JSON'
                              ' will be printed to stdout')
+    parser.add_argument("--incremental", default=False, action="store_true",
+                        help='Add the modules of the trace logs to the build-info of the --output '
+                             'file, if it exists, instead of replacing it')
 
     args = parser.parse_args()
 
-    if not os.path.exists(args.trace_path):
-        print("Error, conan trace log not found! '%s'" % args.trace_path)
-        exit(1)
+    for trace_path in args.trace_path:
+        if not os.path.exists(trace_path):
+            print("Error, conan trace log not found! '%s'" % trace_path)
+            exit(1)
     if args.output and not os.path.exists(os.path.dirname(args.output)):
-        print("Error, output file directory not found! '%s'" % args.trace_path)
+        print("Error, output file directory not found! '%s'" % args.output)
+        exit(1)
+    if args.incremental and not args.output:
+        print("Error, --incremental requires an --output file")
         exit(1)
 
     try:
-        info = get_build_info(args.trace_path)
+        build_info = None
+        if args.incremental and os.path.exists(args.output):
+            build_info = BuildInfo.deserialize(json.loads(load(args.output)))
+        info = get_build_info(args.trace_path, build_info)
         the_json = json.dumps(info.serialize())
         if args.output:
             save(args.output, the_json)
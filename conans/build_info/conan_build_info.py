@@ -2,39 +2,61 @@ import json
 import os
 from collections import defaultdict
 
+import six
+
 from conans.build_info.model import BuildInfo, BuildInfoModule, BuildInfoModuleArtifact, \
     BuildInfoModuleDependency
-from conans.model.info import ConanInfo, PackageReference
+from conans.model.info import PackageReference
 from conans.model.ref import ConanFileReference
-from conans.util.files import load
 
 
-def _extract_uploads_from_conan_trace(path):
-    modules = defaultdict(dict)
-    try:
+def _extract_from_conan_traces(trace_paths):
+    """ reads the trace files line by line, decoding only the uploads and downloads, that are
+    the only traces kept in memory. Returns the uploaded modules
+    {id: {"remote": remote, "files": [], "type": "recipe"|"package"}} and the downloaded ones
+    {id: {"remote": remote, "files": []}}
+    """
+    uploaded_modules = {}
+    downloaded_modules = {}
+    for path in trace_paths:
         with open(path, "r") as traces:
-            for line in traces.readlines():
-                doc = json.loads(line)
-                if doc["_action"] in ("UPLOADED_RECIPE", "UPLOADED_PACKAGE"):
-                    module_type = "recipe" if doc["_action"] == "UPLOADED_RECIPE" else "package"
-                    modules[doc["_id"]] = {"remote": doc["remote"],
-                                           "files": [], "type": module_type}
-                    modules[doc["_id"]]["files"].extend(doc["files"])
-    except ValueError as exc:
-        raise Exception("INVALID TRACE FILE! %s" % exc)
-
-    return modules
-
-
-def _extract_downloads_from_conan_trace(path):
-    downloaded_modules = defaultdict(dict)  # dict of {reference: {"files": [], "remote": remote }}
-
-    with open(path, "r") as traces:
-        for line in traces.readlines():
-            doc = json.loads(line)
-            if doc["_action"] in ["DOWNLOADED_PACKAGE", "DOWNLOADED_RECIPE"]:
-                downloaded_modules[doc["_id"]] = {"files": doc["files"], "remote": doc["remote"]}
-    return downloaded_modules
+            for line in traces:
+                # Most of the traces are REST API calls, not decoded
+                if '"UPLOADED_' not in line and '"DOWNLOADED_' not in line:
+                    if line.strip() and not line.startswith("{"):
+                        raise Exception("INVALID TRACE FILE! %s: %s" % (path, line[:100]))
+                    continue
+                try:
+                    doc = json.loads(line)
+                except ValueError as exc:
+                    raise Exception("INVALID TRACE FILE! %s" % exc)
+                action = doc["_action"]
+                if action in ("UPLOADED_RECIPE", "UPLOADED_PACKAGE"):
+                    module_type = "recipe" if action == "UPLOADED_RECIPE" else "package"
+                    uploaded_modules[doc["_id"]] = {"remote": doc["remote"],
+                                                    "files": doc["files"], "type": module_type}
+                elif action in ("DOWNLOADED_PACKAGE", "DOWNLOADED_RECIPE"):
+                    downloaded_modules[doc["_id"]] = {"files": doc["files"],
+                                                      "remote": doc["remote"]}
+    return uploaded_modules, downloaded_modules
+
+
+def _load_full_requires(conaninfo_path):
+    """ the PackageReferences of the [full_requires] of a conaninfo.txt, without reading the rest
+    of the file
+    """
+    result = []
+    with open(conaninfo_path, "r") as conaninfo:
+        in_section = False
+        for line in conaninfo:
+            line = line.strip()
+            if line.startswith("["):
+                if in_section:
+                    break
+                in_section = line == "[full_requires]"
+            elif in_section and line:
+                result.append(PackageReference.loads(line))
+    return result
 
 
 def _get_type(file_path):
@@ -66,9 +88,7 @@ def _get_upload_modules_with_deps(uploaded_files, downloaded_files):
             conan_infos = [file_doc for file_doc in mod_doc["files"]
                            if file_doc["name"] == "conaninfo.txt"]
             if conan_infos:
-                conan_info = conan_infos[0]["path"]
-                info = ConanInfo.loads(load(conan_info))
-                for pref in info.full_requires:
+                for pref in _load_full_requires(conan_infos[0]["path"]):
                     clear_pref = pref.copy_clear_revs()
                     deps[repr(ref_or_pref.ref.copy_clear_rev())].add(repr(clear_pref.ref))
                     deps[repr(ref_or_pref.copy_clear_revs())].add(repr(clear_pref))
@@ -114,17 +134,24 @@ def _get_only_downloads_module(downloaded_files):
     return ret
 
 
-def _build_modules(trace_path):
-    uploaded_files = _extract_uploads_from_conan_trace(trace_path)
-    downloaded_files = _extract_downloads_from_conan_trace(trace_path)
+def _build_modules(trace_paths):
+    uploaded_files, downloaded_files = _extract_from_conan_traces(trace_paths)
     if uploaded_files:
         return _get_upload_modules_with_deps(uploaded_files, downloaded_files)
     else:
         return [_get_only_downloads_module(downloaded_files)]
 
 
-def get_build_info(trace_path):
-    bi = BuildInfo()
-    modules = _build_modules(trace_path)
-    bi.modules.extend(modules)
+def get_build_info(trace_paths, build_info=None):
+    """ the BuildInfo of the uploads, with their dependencies, and downloads of the traces
+    :param trace_paths: a trace file, or a list of them, like the ones of different CI jobs,
+    that are merged, the same as if they were a single file
+    :param build_info: an existing BuildInfo to add the modules of the traces to, merging the
+    ones with the same ID
+    """
+    if isinstance(trace_paths, six.string_types):
+        trace_paths = [trace_paths]
+    bi = build_info or BuildInfo()
+    for module in _build_modules(trace_paths):
+        bi.add_module(module)
     return bi
@@ -12,6 +12,21 @@ class BuildInfo(object):
         return {"modules": [module.serialize() for module in self.modules],
                 "buildAgent": {"name": "Conan", "version": conans.__version__}}
 
+    @staticmethod
+    def deserialize(data):
+        result = BuildInfo()
+        result.modules = [BuildInfoModule.deserialize(module) for module in data["modules"]]
+        return result
+
+    def add_module(self, module):
+        """ adds the module, or merges it with the existing one with the same ID
+        """
+        for existing in self.modules:
+            if existing.id == module.id:
+                existing.merge(module)
+                return
+        self.modules.append(module)
+
 
 class BuildInfoModule(object):
 
@@ -26,6 +41,22 @@ class BuildInfoModule(object):
                 "artifacts": [ar._asdict() for ar in self.artifacts],
                 "dependencies": [dep._asdict() for dep in self.dependencies]}
 
+    @staticmethod
+    def deserialize(data):
+        result = BuildInfoModule()
+        result.id = data["id"]
+        result.artifacts = [BuildInfoModuleArtifact(**ar) for ar in data["artifacts"]]
+        result.dependencies = [BuildInfoModuleDependency(**dep) for dep in data["dependencies"]]
+        return result
+
+    def merge(self, other):
+        """ adds the artifacts and dependencies of the other module that this one doesn't have
+        """
+        for field in ("artifacts", "dependencies"):
+            items = getattr(self, field)
+            existing = set(items)
+            items.extend(item for item in getattr(other, field) if item not in existing)
+
 
 BuildInfoModuleArtifact = namedtuple("BuildInfoModuleArtifact", ['type', 'sha1', 'md5', 'name'])
 BuildInfoModuleDependency = namedtuple('BuildInfoModuleDependency', ['id', 'type', 'sha1', 'md5'])
@@ -6,6 +6,7 @@ from os.path import join
 
 from conans.client.cache.editable import EditablePackages
 from conans.client.cache.remote_registry import RemoteRegistry
+from conans.client.cache.trash import Trash
 from conans.client.conf import ConanClientConfigParser, default_client_conf, default_settings_yml
 from conans.client.conf.detect import detect_defaults_settings
 from conans.client.output import Color
@@ -28,6 +29,7 @@ LOCALDB = ".conan.db"
 REMOTES = "remotes.json"
 PROFILES_FOLDER = "profiles"
 HOOKS_FOLDER = "hooks"
+TRASH_FOLDER = "trash"
 
 
 def is_case_insensitive_os():
@@ -83,6 +85,9 @@ class ClientCache(object):
     def store(self):
         return self._store_folder
 
+    def trash(self):
+        return Trash(os.path.join(self.cache_folder, TRASH_FOLDER))
+
     def package(self, pref, short_paths=False):
         # TODO: This is deprecated, only used in testing
         return self.package_layout(pref.ref, short_paths).package(pref)
@@ -105,7 +110,8 @@ class ClientCache(object):
             check_ref_case(ref, self.store)
             base_folder = os.path.normpath(os.path.join(self.store, ref.dir_repr()))
             return PackageCacheLayout(base_folder=base_folder, ref=ref,
-                                      short_paths=short_paths, no_lock=self._no_locks())
+                                      short_paths=short_paths, no_lock=self._no_locks(),
+                                      shared_store=self.config.shared_package_store)
 
     @property
     def registry_path(self):
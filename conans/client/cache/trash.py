@@ -0,0 +1,105 @@
+import errno
+import os
+import subprocess
+import sys
+import uuid
+from multiprocessing.pool import ThreadPool
+
+from conans.client.tools.oss import cpu_count
+from conans.util.files import load, mkdir, rmdir
+from conans.util.log import logger
+from conans.util.windows import CONAN_LINK
+
+
+class Trash(object):
+    """ Folder of the cache where the removed folders are moved (renamed) first, so they
+    disappear from the cache instantly, and then deleted, with several threads or in a
+    background process. If their deletion is interrupted, the next empty() deletes them
+    """
+
+    def __init__(self, folder):
+        self._folder = folder
+        self.moved = []  # The folders moved to the trash by this instance
+
+    @property
+    def folder(self):
+        return self._folder
+
+    def move(self, path):
+        """ moves the path to the trash. A path that cannot be renamed there (another
+        filesystem) is deleted in place
+        """
+        if os.path.islink(path):  # e.g. a package folder linked to the shared package store
+            os.unlink(path)
+            return
+        if not os.path.exists(path):
+            return
+        link = os.path.join(path, CONAN_LINK)
+        if os.path.exists(link):  # Short paths folder
+            self.move(os.path.dirname(load(link)))
+        mkdir(self._folder)
+        trashed = os.path.join(self._folder, uuid.uuid4().hex)
+        try:
+            os.rename(path, trashed)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            rmdir(path)
+        else:
+            self.moved.append(trashed)
+
+    def empty(self, folders=None, jobs=None):
+        """ deletes the given folders of the trash, all of them if None. Returns the ones that
+        could not be deleted
+        """
+        if folders is None:
+            if not os.path.isdir(self._folder):
+                return []
+            folders = [os.path.join(self._folder, f) for f in os.listdir(self._folder)]
+        if not folders:
+            return []
+        jobs = min(jobs or cpu_count(), len(folders))
+        if jobs > 1:
+            pool = ThreadPool(jobs)
+            try:
+                deleted = pool.map(_delete, folders)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            deleted = [_delete(f) for f in folders]
+        return [f for f, ok in zip(folders, deleted) if not ok]
+
+    def empty_in_background(self, cache_folder):
+        """ launches a 'conan remove --trash-gc' process to empty the trash, that keeps running
+        after this one finishes. Returns False if it could not be launched
+        """
+        if os.path.basename(cache_folder) != ".conan":  # Not reachable with CONAN_USER_HOME
+            return False
+        if getattr(sys, "frozen", False):  # Conan installers
+            command = [sys.executable, "remove", "--trash-gc"]
+        else:
+            command = [sys.executable, "-m", "conans.conan", "remove", "--trash-gc"]
+        env = os.environ.copy()
+        env["CONAN_USER_HOME"] = os.path.dirname(cache_folder)
+        if os.name == "nt":
+            kwargs = {"creationflags": 0x00000008}  # DETACHED_PROCESS
+        else:
+            kwargs = {"close_fds": True}
+        try:
+            with open(os.devnull, "w") as devnull:
+                subprocess.Popen(command, env=env, stdin=devnull, stdout=devnull,
+                                 stderr=devnull, **kwargs)
+        except OSError as e:
+            logger.error("Cannot empty the trash in background: %s" % str(e))
+            return False
+        return True
+
+
+def _delete(folder):
+    try:
+        rmdir(folder)
+    except OSError as e:
+        logger.error("Cannot remove %s from the trash: %s" % (folder, str(e)))
+        return False
+    return True
@@ -0,0 +1,92 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from conans.client.cmd.uploader import CmdUpload
+from conans.client.manager import deps_install
+from conans.client.recorder.action_recorder import ActionRecorder
+from conans.client.recorder.upload_recoder import UploadRecorder
+from conans.model.graph_info import GraphInfo
+from conans.model.ref import ConanFileReference
+
+
+@contextmanager
+def _heartbeat(queue, node_id, worker):
+    """ updates the claim of the node while it is being built, so the other workers don't
+    claim it again. Yields an Event, set if the claim is lost (taken by other worker)
+    """
+    stop, lost = threading.Event(), threading.Event()
+
+    def beat():
+        while not stop.wait(queue.claim_timeout / 3.0):
+            if not queue.heartbeat(node_id, worker):
+                lost.set()
+                break
+
+    thread = threading.Thread(target=beat)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield lost
+    finally:
+        stop.set()
+        thread.join()
+
+
+def cmd_build_worker(app, queue, remotes, worker, poll_interval=1):
+    """ builds the packages of the BuildQueue as soon as they are ready, until all of them are
+    built. Every package is built against the lockfile of the queue, with the packages built so
+    far, uploaded to the remote so the other workers can use it, and reported back to the queue.
+    Returns the PackageReferences built by this worker
+    """
+    out = app.out
+    built = []
+    while True:
+        node_id = queue.claim(worker)
+        if node_id is None:
+            if queue.finished():
+                break
+            time.sleep(poll_interval)
+            continue
+
+        ref = queue.pref(node_id).ref
+        if not app.config.revisions_enabled:
+            ref = ref.copy_clear_rev()
+        out.highlight("Building %s from the build queue" % str(ref))
+        graph_lock_file = queue.load_lock(app.config.revisions_enabled)
+        graph_info = GraphInfo(profile_host=graph_lock_file.profile_host,
+                               root_ref=ConanFileReference(None, None, None, None, validate=False))
+        graph_info.profile_host.process_settings(app.cache, preprocess=False)
+        graph_info.graph_lock = graph_lock_file.graph_lock
+        lost_claim = "The claim of %s was taken by other worker, discarding its build" % str(ref)
+        try:
+            with _heartbeat(queue, node_id, worker) as lost:
+                deps_install(app, ref_or_path=ref, install_folder=None, graph_info=graph_info,
+                             remotes=remotes, build_modes=[repr(ref.copy_clear_rev())],
+                             recorder=ActionRecorder())
+                # The package ID can change with the dependencies built, as in
+                # package_revision_mode
+                pref = graph_info.graph_lock.pref(node_id)
+                if lost.is_set() or not queue.heartbeat(node_id, worker):
+                    lost.set()  # Other worker builds it, it is not uploaded
+                else:
+                    uploader = CmdUpload(app.cache, app.user_io, app.remote_manager, app.loader,
+                                         app.hook_manager)
+                    uploader.upload(repr(pref.ref.copy_clear_rev()), remotes, UploadRecorder(),
+                                    package_id=pref.id, confirm=True)
+        except Exception as exc:
+            # Any error fails the node, otherwise it is claimed forever and the workers wait
+            error = str(exc) or exc.__class__.__name__
+            out.error("Failed to build %s: %s" % (str(ref), error))
+            if not queue.failed(node_id, worker, error):
+                out.warn(lost_claim)
+            continue
+        except BaseException:
+            # Interrupted (KeyboardInterrupt, SystemExit), other worker can build it
+            queue.release(node_id, worker)
+            raise
+        if lost.is_set() or not queue.built(node_id, worker, graph_info.graph_lock):
+            out.warn(lost_claim)
+            continue
+        built.append(pref)
+    return built
@@ -28,7 +28,7 @@ def _get_test_conanfile_path(tf, conanfile_path):
 
 def create(app, ref, graph_info, remotes, update, build_modes,
            manifest_folder, manifest_verify, manifest_interactive, keep_build, test_build_folder,
-           test_folder, conanfile_path, recorder):
+           test_folder, conanfile_path, recorder, build_jobs=None):
     assert isinstance(ref, ConanFileReference), "ref needed"
     test_conanfile_path = _get_test_conanfile_path(test_folder, conanfile_path)
 
@@ -40,7 +40,8 @@ def create(app, ref, graph_info, remotes, update, build_modes,
                                manifest_interactive=manifest_interactive,
                                keep_build=keep_build,
                                test_build_folder=test_build_folder,
-                               recorder=recorder)
+                               recorder=recorder,
+                               build_jobs=build_jobs)
     else:
         deps_install(app=app,
                      ref_or_path=ref,
@@ -54,4 +55,5 @@ def create(app, ref, graph_info, remotes, update, build_modes,
                      build_modes=build_modes,
                      update=update,
                      keep_build=keep_build,
-                     recorder=recorder)
+                     recorder=recorder,
+                     build_jobs=build_jobs)
@@ -5,7 +5,7 @@ import shutil
 import six
 
 from conans.client.cmd.export_linter import conan_linter
-from conans.client.file_copier import FileCopier
+from conans.client.file_copier import FileCopier, copy_strategies
 from conans.client.output import ScopedOutput
 from conans.client.remover import DiskRemover
 from conans.errors import ConanException
@@ -17,6 +17,7 @@ from conans.search.search import search_recipes, search_packages
 from conans.util.files import is_dirty, load, rmdir, save, set_dirty, remove, mkdir, \
     merge_directories
 from conans.util.log import logger
+from conans.util.perf import perf_traced
 
 
 def export_alias(package_layout, target_ref, output, revisions_enabled):
@@ -49,6 +50,7 @@ def check_casing_conflict(cache, ref):
                              % (str(ref), " ".join(str(s) for s in refs)))
 
 
+@perf_traced("export", "recipe")
 def cmd_export(app, conanfile_path, name, version, user, channel, keep_source,
                export=True, graph_lock=None, ignore_dirty=False):
 
@@ -381,7 +383,8 @@ def _export_scm(scm_data, origin_folder, scm_sources_folder, output):
     excluded = SCM(scm_data, origin_folder, output).excluded_files
     excluded.append("conanfile.py")
     output.info("SCM: Getting sources from folder: %s" % origin_folder)
-    merge_directories(origin_folder, scm_sources_folder, excluded=excluded)
+    merge_directories(origin_folder, scm_sources_folder, excluded=excluded,
+                      strategies=copy_strategies())
 
 
 def export_source(conanfile, origin_folder, destination_source_folder):
@@ -16,7 +16,8 @@ from conans.search.search import search_packages, search_recipes
 from conans.util.files import (load, clean_dirty, is_dirty,
                                gzopen_without_timestamps, set_dirty_context_manager)
 from conans.util.log import logger
-from conans.util.tracer import (log_recipe_upload, log_compressed_files,
+from conans.util.perf import perf_traced
+from conans.util.tracer import (ChecksumsCalculator, log_recipe_upload, log_compressed_files,
                                 log_package_upload)
 
 
@@ -74,10 +75,10 @@ class CmdUpload(object):
         self._loader = loader
         self._hook_manager = hook_manager
 
+    @perf_traced("upload", "upload")
     def upload(self, reference_or_pattern, remotes, upload_recorder, package_id=None,
                all_packages=None, confirm=False, retry=None, retry_wait=None, integrity_check=False,
                policy=None, query=None):
-        t1 = time.time()
         refs, confirm = self._collects_refs_to_upload(package_id, reference_or_pattern, confirm)
         refs_by_remote = self._collect_packages_to_upload(refs, confirm, remotes, all_packages,
                                                           query, package_id)
@@ -88,8 +89,6 @@ class CmdUpload(object):
                 self._upload_ref(conanfile, ref, prefs, retry, retry_wait,
                                  integrity_check, policy, remote, upload_recorder, remotes)
 
-        logger.debug("UPLOAD: Time manager upload: %f" % (time.time() - t1))
-
     def _collects_refs_to_upload(self, package_id, reference_or_pattern, confirm):
         """ validate inputs and compute the refs (without revisions) to be uploaded
         """
@@ -207,6 +206,7 @@ class CmdUpload(object):
         self._hook_manager.execute("post_upload", conanfile_path=conanfile_path, reference=ref,
                                    remote=recipe_remote)
 
+    @perf_traced("upload recipe", "upload")
     def _upload_recipe(self, ref, conanfile, retry, retry_wait, policy, remote, remotes):
 
         current_remote_name = self._cache.package_layout(ref).load_metadata().recipe.remote
@@ -259,6 +259,7 @@ class CmdUpload(object):
 
         return ref
 
+    @perf_traced("upload package", "upload")
     def _upload_package(self, pref, retry=None, retry_wait=None, integrity_check=False,
                         policy=None, p_remote=None):
 
@@ -507,6 +508,7 @@ def _compress_package_files(files, symlinks, dest_folder, output):
             CONAN_MANIFEST: files[CONAN_MANIFEST]}
 
 
+@perf_traced("compress", "upload")
 def compress_files(files, symlinks, name, dest_dir, output=None):
     t1 = time.time()
     # FIXME, better write to disk sequentially and not keep tgz contents in memory
@@ -534,8 +536,10 @@ def compress_files(files, symlinks, name, dest_dir, output=None):
                     info.linkname = os.readlink(abs_path)  # @UndefinedVariable
                     tgz.addfile(tarinfo=info)
                 else:
+                    checksums = ChecksumsCalculator(abs_path)
                     with open(abs_path, 'rb') as file_handler:
-                        tgz.addfile(tarinfo=info, fileobj=file_handler)
+                        tgz.addfile(tarinfo=info, fileobj=checksums.reader(file_handler))
+                    checksums.save()
         tgz.close()
 
     duration = time.time() - t1
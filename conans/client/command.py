@@ -24,6 +24,8 @@ from conans.util.config_parser import get_bool_from_text
 from conans.util.files import exception_message_safe
 from conans.util.files import save
 from conans.util.log import logger
+from conans.util.perf import TRACE_PERF_ARG, extract_trace_perf_arg, perf_span, \
+    start_perf_tracer, stop_perf_tracer
 
 # Exit codes for conan command:
 SUCCESS = 0                         # 0: Success (done)
@@ -91,6 +93,8 @@ _BUILD_FOLDER_HELP = ("Directory for the build process. Defaulted to the current
                       "relative path to current directory can also be specified")
 _INSTALL_FOLDER_HELP = ("Directory containing the conaninfo.txt and conanbuildinfo.txt files "
                         "(from previous 'conan install'). Defaulted to --build-folder")
+_BUILD_JOBS_HELP = ("Number of packages built from sources at the same time, each one in its "
+                    "own process with its share of the CPUs. Defaults to CONAN_BUILD_JOBS, or 1")
 _KEEP_SOURCE_HELP = ("Do not remove the source folder in local cache, even if the recipe changed. "
                      "Use this for testing purposes only")
 _PATTERN_OR_REFERENCE_HELP = ("Pattern or package recipe reference, e.g., '%s', "
@@ -316,6 +320,8 @@ class Command(object):
                             help='Do not remove the build folder in local cache. '
                                  'Implies --keep-source. '
                                  'Use this for testing purposes only')
+        parser.add_argument("--build-jobs", default=None, type=int, action=OnceArgument,
+                            help=_BUILD_JOBS_HELP)
         parser.add_argument("-ne", "--not-export", default=False, action='store_true',
                             help='Do not export the conanfile.py')
         parser.add_argument("-tbf", "--test-build-folder", action=OnceArgument,
@@ -356,7 +362,8 @@ class Command(object):
                                       args.manifests, args.manifests_interactive,
                                       args.remote, args.update,
                                       test_build_folder=args.test_build_folder,
-                                      lockfile=args.lockfile, ignore_dirty=args.ignore_dirty)
+                                      lockfile=args.lockfile, ignore_dirty=args.ignore_dirty,
+                                      build_jobs=args.build_jobs)
         except ConanException as exc:
             info = exc.info
             raise
@@ -445,6 +452,8 @@ class Command(object):
 
         parser.add_argument("--no-imports", action='store_true', default=False,
                             help='Install specified packages but avoid running imports')
+        parser.add_argument("--build-jobs", default=None, type=int, action=OnceArgument,
+                            help=_BUILD_JOBS_HELP)
         parser.add_argument("-j", "--json", default=None, action=OnceArgument,
                             help='Path to a json file where the install information will be '
                             'written')
@@ -473,7 +482,8 @@ class Command(object):
                                            update=args.update, generators=args.generator,
                                            no_imports=args.no_imports,
                                            install_folder=args.install_folder,
-                                           lockfile=args.lockfile)
+                                           lockfile=args.lockfile,
+                                           build_jobs=args.build_jobs)
             else:
                 if args.reference:
                     raise ConanException("A full reference was provided as first argument, second "
@@ -491,7 +501,8 @@ class Command(object):
                                                      update=args.update,
                                                      generators=args.generator,
                                                      install_folder=args.install_folder,
-                                                     lockfile=args.lockfile)
+                                                     lockfile=args.lockfile,
+                                                     build_jobs=args.build_jobs)
 
         except ConanException as exc:
             info = exc.info
@@ -1019,6 +1030,9 @@ class Command(object):
                             help='Remove source folders')
         parser.add_argument('-t', '--system-reqs', default=False, action="store_true",
                             help='Remove system_reqs folders')
+        parser.add_argument("--trash-gc", default=False, action="store_true",
+                            help="Delete the removed folders left in the trash of the cache "
+                                 "by interrupted removals")
         args = parser.parse_args(*args)
 
         self._warn_python_version()
@@ -1038,6 +1052,12 @@ class Command(object):
             self._conan.remove_locks()
             self._out.info("Cache locks removed")
             return
+        elif args.trash_gc:
+            if args.pattern_or_reference:
+                raise ConanException("Specifying a pattern is not supported when emptying the "
+                                     "trash")
+            self._conan.remove_trash()
+            return
         elif args.system_reqs:
             if args.packages:
                 raise ConanException("'-t' and '-p' parameters can't be used at the same time")
@@ -1766,6 +1786,23 @@ class Command(object):
         build_order_cmd.add_argument("--json", action=OnceArgument,
                                      help="generate output file in json format")
 
+        queue_cmd = subparsers.add_parser('queue', help='Creates a queue of the packages to '
+                                          'build of a lockfile, for "conan graph worker"')
+        queue_cmd.add_argument('lockfile', help='lockfile folder')
+        queue_cmd.add_argument('queue_folder', help='folder of the queue, shared by the workers')
+        queue_cmd.add_argument("-b", "--build", action=Extender, nargs="?",
+                               help="nodes to build")
+
+        worker_cmd = subparsers.add_parser('worker', help='Builds the packages of a queue as '
+                                           'soon as their dependencies are built, and uploads '
+                                           'them, until all of them are built')
+        worker_cmd.add_argument('queue_folder', help='folder of the queue, shared by the workers')
+        worker_cmd.add_argument("-r", "--remote", action=OnceArgument,
+                                help='remote to download the dependencies from and upload the '
+                                     'packages built to')
+        worker_cmd.add_argument("-n", "--name", action=OnceArgument,
+                                help='name of the worker, hostname-pid by default')
+
         lock_cmd = subparsers.add_parser('lock', help='create a lockfile')
         lock_cmd.add_argument("path_or_reference", help="Path to a folder containing a recipe"
                               " (conanfile.py or conanfile.txt) or to a recipe file. e.g., "
@@ -1787,6 +1824,13 @@ class Command(object):
             if args.json:
                 json_file = _make_abs_path(args.json)
                 save(json_file, json.dumps(build_order, indent=True))
+        elif args.subcommand == "queue":
+            queued = self._conan.build_queue(args.lockfile, args.queue_folder, args.build)
+            self._out.info("%d packages to build queued in %s" % (queued, args.queue_folder))
+        elif args.subcommand == "worker":
+            built = self._conan.build_worker(args.queue_folder, remote_name=args.remote,
+                                             worker_name=args.name)
+            self._out.info("Packages built by this worker: %s" % ", ".join(built))
         elif args.subcommand == "lock":
             self._conan.create_lock(args.path_or_reference,
                                     remote_name=args.remote,
@@ -1847,6 +1891,8 @@ class Command(object):
 
         self._out.writeln("")
         self._out.writeln('Conan commands. Type "conan <command> -h" for help', Color.BRIGHT_YELLOW)
+        self._out.writeln('Add "%s <file>" to any command to save a Chrome trace of its '
+                          'performance' % TRACE_PERF_ARG)
 
     def _commands(self):
         """ returns a list of available commands
@@ -1903,9 +1949,11 @@ class Command(object):
         methods
         """
         ret_code = SUCCESS
+        tracer = None
         try:
             try:
-                command = args[0][0]
+                argv, trace_perf_file = extract_trace_perf_arg(args[0])
+                command = argv[0]
                 commands = self._commands()
                 method = commands[command]
             except KeyError as exc:
@@ -1929,7 +1977,11 @@ class Command(object):
             except IndexError:  # No parameters
                 self._show_help()
                 return False
-            method(args[0][1:])
+            if trace_perf_file:
+                trace_perf_file = os.path.abspath(trace_perf_file)
+                tracer = start_perf_tracer()
+            with perf_span("conan %s" % command, "command"):
+                method(argv[1:])
         except KeyboardInterrupt as exc:
             logger.error(exc)
             ret_code = SUCCESS
@@ -1950,6 +2002,12 @@ class Command(object):
             ret_code = ERROR_GENERAL
             msg = exception_message_safe(exc)
             self._out.error(msg)
+        finally:
+            if tracer:
+                stop_perf_tracer()
+                tracer.save(trace_perf_file)
+                tracer.print_hotspots(self._out)
+                self._out.info("Performance trace saved in %s" % trace_perf_file)
 
         return ret_code
 
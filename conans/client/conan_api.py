@@ -1,4 +1,5 @@
 import os
+import socket
 import sys
 from collections import OrderedDict
 
@@ -9,6 +10,7 @@ from conans import __version__ as client_version
 from conans.client import packager, tools
 from conans.client.cache.cache import ClientCache
 from conans.client.cmd.build import cmd_build
+from conans.client.cmd.build_worker import cmd_build_worker
 from conans.client.cmd.create import create
 from conans.client.cmd.download import download
 from conans.client.cmd.export import cmd_export, export_alias
@@ -20,6 +22,7 @@ from conans.client.cmd.test import install_build_and_test
 from conans.client.cmd.uploader import CmdUpload
 from conans.client.cmd.user import user_set, users_clean, users_list, token_present
 from conans.client.conf import ConanClientConfigParser
+from conans.client.graph.build_queue import BuildQueue
 from conans.client.graph.graph import RECIPE_EDITABLE
 from conans.client.graph.graph_binaries import GraphBinariesAnalyzer
 from conans.client.graph.graph_manager import GraphManager
@@ -63,7 +66,7 @@ from conans.tools import set_global_instances
 from conans.unicode import get_cwd
 from conans.util.files import exception_message_safe, mkdir, save_files
 from conans.util.log import configure_logger
-from conans.util.tracer import log_command, log_exception
+from conans.util.tracer import flush_traces, log_command, log_exception
 
 default_manifest_folder = '.conan_manifests'
 
@@ -91,6 +94,7 @@ def api_method(f):
             raise
         finally:
             os.chdir(old_curdir)
+            flush_traces()
     return wrapper
 
 
@@ -313,13 +317,14 @@ class ConanAPIV1(object):
                keep_source=False, keep_build=False, verify=None,
                manifests=None, manifests_interactive=None,
                remote_name=None, update=False, cwd=None, test_build_folder=None,
-               lockfile=None, ignore_dirty=False):
+               lockfile=None, ignore_dirty=False, build_jobs=None):
         """
         API method to create a conan package
 
         :param test_folder: default None   - looks for default 'test' or 'test_package' folder),
                                     string - test_folder path
                                     False  - disabling tests
+        :param build_jobs: number of packages built in parallel, CONAN_BUILD_JOBS by default
         """
         settings = settings or []
         options = options or []
@@ -357,7 +362,8 @@ class ConanAPIV1(object):
             recorder.add_recipe_being_developed(ref)
             create(self.app, ref, graph_info, remotes, update, build_modes,
                    manifest_folder, manifest_verify, manifest_interactive, keep_build,
-                   test_build_folder, test_folder, conanfile_path, recorder=recorder)
+                   test_build_folder, test_folder, conanfile_path, recorder=recorder,
+                   build_jobs=build_jobs)
 
             if lockfile:
                 graph_info.save_lock(lockfile)
@@ -487,7 +493,7 @@ class ConanAPIV1(object):
                           remote_name=None, verify=None, manifests=None,
                           manifests_interactive=None, build=None, profile_names=None,
                           update=False, generators=None, install_folder=None, cwd=None,
-                          lockfile=None):
+                          lockfile=None, build_jobs=None):
 
         try:
             recorder = ActionRecorder()
@@ -512,7 +518,8 @@ class ConanAPIV1(object):
                          update=update, manifest_folder=manifest_folder,
                          manifest_verify=manifest_verify,
                          manifest_interactive=manifest_interactive,
-                         generators=generators, use_lock=lockfile, recorder=recorder)
+                         generators=generators, use_lock=lockfile, recorder=recorder,
+                         build_jobs=build_jobs)
             return recorder.get_info(self.app.config.revisions_enabled)
         except ConanException as exc:
             recorder.error = True
@@ -525,7 +532,7 @@ class ConanAPIV1(object):
                 remote_name=None, verify=None, manifests=None,
                 manifests_interactive=None, build=None, profile_names=None,
                 update=False, generators=None, no_imports=False, install_folder=None, cwd=None,
-                lockfile=None):
+                lockfile=None, build_jobs=None):
 
         try:
             recorder = ActionRecorder()
@@ -555,7 +562,8 @@ class ConanAPIV1(object):
                          manifest_interactive=manifest_interactive,
                          generators=generators,
                          no_imports=no_imports,
-                         recorder=recorder)
+                         recorder=recorder,
+                         build_jobs=build_jobs)
             return recorder.get_info(self.app.config.revisions_enabled)
         except ConanException as exc:
             recorder.error = True
@@ -994,6 +1002,14 @@ class ConanAPIV1(object):
     def remove_locks(self):
         self.app.cache.remove_locks()
 
+    @api_method
+    def remove_trash(self):
+        trash = self.app.cache.trash()
+        not_removed = trash.empty()
+        if not_removed:
+            raise ConanException("Unable to remove from the trash:\n%s" % "\n".join(not_removed))
+        self.app.out.info("Cache trash emptied")
+
     @api_method
     def profile_list(self):
         return cmd_profile_list(self.app.cache.profiles_path, self.app.out)
@@ -1194,8 +1210,7 @@ class ConanAPIV1(object):
         old_lock.graph_lock.update_lock(new_lock.graph_lock)
         old_lock.save(old_lockfile)
 
-    @api_method
-    def build_order(self, lockfile, build=None, cwd=None):
+    def _lock_build_order(self, lockfile, build, cwd):
         cwd = cwd or os.getcwd()
         lockfile = _make_abs_path(lockfile, cwd)
 
@@ -1213,12 +1228,44 @@ class ConanAPIV1(object):
 
         print_graph(deps_graph, self.app.out)
         graph_info.save_lock(lockfile)
-        build_order = deps_graph.new_build_order()
+        return graph_info, deps_graph.new_build_order()
+
+    @api_method
+    def build_order(self, lockfile, build=None, cwd=None):
+        _, build_order = self._lock_build_order(lockfile, build, cwd)
         # Build order returns refs, we need to convert to flat python primitives
         for level in build_order:
             level[:] = [(id_, repr(pref)) for id_, pref in level]
         return build_order
 
+    @api_method
+    def build_queue(self, lockfile, queue_folder, build=None, cwd=None):
+        """ creates in queue_folder a queue of the packages to build of the lockfile, to be built
+        by the workers of build_worker(), and returns their number
+        """
+        graph_info, build_order = self._lock_build_order(lockfile, build, cwd)
+        queue_folder = _make_abs_path(queue_folder, cwd)
+        lock_file = GraphLockFile(graph_info.profile_host, graph_info.graph_lock)
+        BuildQueue.create(queue_folder, lock_file, build_order)
+        return sum(len(level) for level in build_order)
+
+    @api_method
+    def build_worker(self, queue_folder, remote_name=None, worker_name=None, cwd=None):
+        """ builds the packages of the queue in queue_folder as soon as they are ready, and
+        uploads them to the remote, until all of them are built. Returns the package references
+        built by this worker
+        """
+        queue = BuildQueue(_make_abs_path(queue_folder, cwd))
+        remotes = self.app.load_remotes(remote_name=remote_name)
+        worker_name = worker_name or "%s-%s" % (socket.gethostname(), os.getpid())
+        built = cmd_build_worker(self.app, queue, remotes, worker_name)
+        failures = queue.failures()
+        if failures:
+            raise ConanException("Some packages of the build queue failed:\n%s" % "\n".join(
+                "%s: %s" % (queue.pref(node_id).ref, error.splitlines()[0] if error else "")
+                for node_id, error in sorted(failures.items())))
+        return [repr(pref) for pref in built]
+
     @api_method
     def create_lock(self, reference, remote_name=None, settings=None, options=None, env=None,
                     profile_names=None, update=False, lockfile=None, build=None,):
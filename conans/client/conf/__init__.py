@@ -110,6 +110,10 @@ request_timeout = 60                  # environment CONAN_REQUEST_TIMEOUT (secon
 default_package_id_mode = semver_direct_mode # environment CONAN_DEFAULT_PACKAGE_ID_MODE
 # retry = 2                             # environment CONAN_RETRY
 # retry_wait = 5                        # environment CONAN_RETRY_WAIT (seconds)
+# upload_chunk_size = 1048576         # environment CONAN_UPLOAD_CHUNK_SIZE (bytes)
+# copy_strategy = reflink, copy       # environment CONAN_COPY_STRATEGY (reflink, hardlink, copy)
+# download_cache = /path/to/cache     # environment CONAN_DOWNLOAD_CACHE (shared by Conan caches and users)
+# download_cache_max_size = 10240     # environment CONAN_DOWNLOAD_CACHE_MAX_SIZE (MB)
 # sysrequires_mode = enabled          # environment CONAN_SYSREQUIRES_MODE (allowed modes enabled/verify/disabled)
 # vs_installation_preference = Enterprise, Professional, Community, BuildTools # environment CONAN_VS_INSTALLATION_PREFERENCE
 # verbose_traceback = False           # environment CONAN_VERBOSE_TRACEBACK
@@ -117,6 +121,12 @@ default_package_id_mode = semver_direct_mode # environment CONAN_DEFAULT_PACKAGE
 # bash_path = ""                      # environment CONAN_BASH_PATH (only windows)
 # recipe_linter = False               # environment CONAN_RECIPE_LINTER
 # read_only_cache = True              # environment CONAN_READ_ONLY_CACHE
+# shared_package_store = /path/to/store # environment CONAN_SHARED_PACKAGE_STORE (packages linked by several caches)
+# generators_digest = False           # environment CONAN_GENERATORS_DIGEST (skip generators if their inputs didn't change)
+# generators_jobs = 1                # environment CONAN_GENERATORS_JOBS (generators run in parallel threads)
+# background_remove = False          # environment CONAN_BACKGROUND_REMOVE (removed folders are deleted by a background process)
+# resolved_graph_cache = False       # environment CONAN_RESOLVED_GRAPH_CACHE (reuse the graph of the previous install if its inputs didn't change)
+# build_jobs = 1                     # environment CONAN_BUILD_JOBS (packages built in parallel processes, as --build-jobs)
 # pylintrc = path/to/pylintrc_file    # environment CONAN_PYLINTRC
 # cache_no_locks = True               # environment CONAN_CACHE_NO_LOCKS
 # user_home_short = your_path         # environment CONAN_USER_HOME_SHORT
@@ -207,10 +217,20 @@ class ConanClientConfigParser(ConfigParser, object):
                "CONAN_REQUEST_TIMEOUT": self._env_c("general.request_timeout", "CONAN_REQUEST_TIMEOUT", None),
                "CONAN_RETRY": self._env_c("general.retry", "CONAN_RETRY", None),
                "CONAN_RETRY_WAIT": self._env_c("general.retry_wait", "CONAN_RETRY_WAIT", None),
+               "CONAN_UPLOAD_CHUNK_SIZE": self._env_c("general.upload_chunk_size", "CONAN_UPLOAD_CHUNK_SIZE", None),
+               "CONAN_COPY_STRATEGY": self._env_c("general.copy_strategy", "CONAN_COPY_STRATEGY", None),
+               "CONAN_DOWNLOAD_CACHE": self._env_c("general.download_cache", "CONAN_DOWNLOAD_CACHE", None),
+               "CONAN_DOWNLOAD_CACHE_MAX_SIZE": self._env_c("general.download_cache_max_size", "CONAN_DOWNLOAD_CACHE_MAX_SIZE", None),
                "CONAN_VS_INSTALLATION_PREFERENCE": self._env_c("general.vs_installation_preference", "CONAN_VS_INSTALLATION_PREFERENCE", None),
                "CONAN_RECIPE_LINTER": self._env_c("general.recipe_linter", "CONAN_RECIPE_LINTER", "True"),
                "CONAN_CPU_COUNT": self._env_c("general.cpu_count", "CONAN_CPU_COUNT", None),
                "CONAN_READ_ONLY_CACHE": self._env_c("general.read_only_cache", "CONAN_READ_ONLY_CACHE", None),
+               "CONAN_SHARED_PACKAGE_STORE": self._env_c("general.shared_package_store", "CONAN_SHARED_PACKAGE_STORE", None),
+               "CONAN_GENERATORS_DIGEST": self._env_c("general.generators_digest", "CONAN_GENERATORS_DIGEST", None),
+               "CONAN_GENERATORS_JOBS": self._env_c("general.generators_jobs", "CONAN_GENERATORS_JOBS", None),
+               "CONAN_BACKGROUND_REMOVE": self._env_c("general.background_remove", "CONAN_BACKGROUND_REMOVE", None),
+               "CONAN_RESOLVED_GRAPH_CACHE": self._env_c("general.resolved_graph_cache", "CONAN_RESOLVED_GRAPH_CACHE", None),
+               "CONAN_BUILD_JOBS": self._env_c("general.build_jobs", "CONAN_BUILD_JOBS", None),
                "CONAN_USER_HOME_SHORT": self._env_c("general.user_home_short", "CONAN_USER_HOME_SHORT", None),
                "CONAN_USE_ALWAYS_SHORT_PATHS": self._env_c("general.use_always_short_paths", "CONAN_USE_ALWAYS_SHORT_PATHS", None),
                "CONAN_VERBOSE_TRACEBACK": self._env_c("general.verbose_traceback", "CONAN_VERBOSE_TRACEBACK", None),
@@ -412,6 +432,12 @@ class ConanClientConfigParser(ConfigParser, object):
                                      "the conan cache '{}'.".format(short_paths_home, current_dir))
         return short_paths_home
 
+    @property
+    def shared_package_store(self):
+        """Folder of the downloaded packages shared by several caches, None if not enabled"""
+        store = get_env("CONAN_SHARED_PACKAGE_STORE")
+        return os.path.abspath(conan_expand_user(store)) if store else None
+
     @property
     def storage_path(self):
         # Try with CONAN_STORAGE_PATH
@@ -1,9 +1,127 @@
 import fnmatch
 import os
-import shutil
+import re
+import time
 from collections import defaultdict
 
-from conans.util.files import mkdir, walk
+from conans.errors import ConanException
+from conans.util.files import COPY_STRATEGIES, DEFAULT_COPY_STRATEGIES, copy_file, mkdir, walk
+
+# Folders modified less than this before being walked could change again without changing
+# their modification time, in file systems with low resolution timestamps
+_RACY_SECONDS = 2
+
+
+def copy_strategies():
+    """ The copy strategies to try in order, defined by general.copy_strategy in conan.conf
+    or CONAN_COPY_STRATEGY, a comma separated list of 'reflink', 'hardlink' and 'copy', to be
+    resolved once for all the files of a copy
+    """
+    value = os.getenv("CONAN_COPY_STRATEGY") or "reflink, copy"
+    strategies = tuple(s.strip() for s in value.split(",") if s.strip())
+    for strategy in strategies:
+        if strategy not in COPY_STRATEGIES:
+            raise ConanException("Invalid copy strategy '%s', use any of: %s"
+                                 % (strategy, ", ".join(COPY_STRATEGIES)))
+    return strategies
+
+
+def _compile_pattern(pattern):
+    """ returns a function matching names with the fnmatch pattern, like fnmatch.fnmatch()
+    but compiling the pattern only once
+    """
+    regex = re.compile(fnmatch.translate(os.path.normcase(pattern)))
+    if os.path.normcase("A") == "A":
+        return regex.match
+    return lambda name: regex.match(os.path.normcase(name))
+
+
+class _FolderSnapshot(object):
+    """ The result of walking a source folder, as the relative folders and their files,
+    skipping the same folders FileCopier always skips. It is still valid while no file or
+    folder is added, removed or renamed, checked by the modification time of its folders
+    """
+    def __init__(self, src, links, excluded_folders, entries=None, folders=None):
+        self.src = os.path.normpath(src)
+        if entries is None:
+            entries, folders = self._walk(src, links, excluded_folders)
+        # [(relative_folder, [relative_files])], None files for linked folders (links=True)
+        self.entries = entries
+        # {abs_folder: [mtime, names]}, names is the content of the folders modified just
+        # before the walk, to compare them as the mtime might not change
+        self._folders = folders
+
+    @staticmethod
+    def _walk(src, links, excluded_folders):
+        entries = []
+        folders = {}
+        racy_time = time.time() - _RACY_SECONDS
+        for root, subfolders, files in walk(src, followlinks=True):
+            if os.path.normpath(root) in excluded_folders:
+                subfolders[:] = []
+                continue
+
+            if links and os.path.islink(root):
+                entries.append((os.path.relpath(root, src), None))
+                subfolders[:] = []
+                continue
+            basename = os.path.basename(root)
+            # Skip git or svn subfolders
+            if basename in [".git", ".svn"]:
+                subfolders[:] = []
+                continue
+            try:
+                mtime = os.stat(root).st_mtime
+            except OSError:
+                mtime = None
+            names = set(subfolders).union(files) if mtime is None or mtime >= racy_time else None
+            folders[os.path.normpath(root)] = [mtime, names]
+            if basename == "test_package":  # DO NOT export test_package/build folder
+                try:
+                    subfolders.remove("build")
+                except ValueError:
+                    pass
+
+            relative_path = os.path.relpath(root, src)
+            entries.append((relative_path,
+                            [os.path.normpath(os.path.join(relative_path, f)) for f in files]))
+        return entries, folders
+
+    def subtree(self, folder):
+        """ the snapshot of a subfolder, if it was walked
+        """
+        if folder not in self._folders:
+            return None
+        relative = os.path.relpath(folder, self.src)
+        if relative == ".":
+            return self
+        prefix = relative + os.sep
+        entries = []
+        strip = len(prefix)
+        for relative_path, files in self.entries:
+            if relative_path == relative or relative_path.startswith(prefix):
+                if files is not None:
+                    files = [f[strip:] for f in files]
+                entries.append((relative_path[strip:] or ".", files))
+        folders = {f: v for f, v in self._folders.items()
+                   if f == folder or f.startswith(folder + os.sep)}
+        return _FolderSnapshot(folder, None, None, entries, folders)
+
+    def is_valid(self):
+        racy_time = time.time() - _RACY_SECONDS
+        for folder, data in self._folders.items():
+            mtime, names = data
+            try:
+                if mtime is None or os.stat(folder).st_mtime != mtime:
+                    return False
+                if names is not None:
+                    if set(os.listdir(folder)) != names:
+                        return False
+                    if mtime < racy_time:  # Any later change will modify the mtime
+                        data[1] = None
+            except OSError:
+                return False
+        return True
 
 
 def report_copied_files(copied, output, message_suffix="Copied"):
@@ -32,7 +150,7 @@ class FileCopier(object):
     imports: package folder -> user folder
     export: user folder -> store "export" folder
     """
-    def __init__(self, source_folders, root_destination_folder):
+    def __init__(self, source_folders, root_destination_folder, hardlinks=False):
         """
         Takes the base folders to copy resources src -> dst. These folders names
         will not be used in the relative names while copying
@@ -40,11 +158,16 @@ class FileCopier(object):
                                   store build folder
         param root_destination_folder: The base folder to copy things to, typically the
                                        store package folder
+        param hardlinks: the copied files can be hardlinks of the source ones (if enabled
+                         in the copy strategy), as none of them will be modified in place
         """
         assert isinstance(source_folders, list), "source folders must be a list"
         self._src_folders = source_folders
         self._dst_folder = root_destination_folder
         self._copied = []
+        self._hardlinks = hardlinks
+        self._strategies = copy_strategies()
+        self._snapshots = {}  # Walked trees of the source folders, to be reused
 
     def report(self, output):
         return report_copied_files(self._copied, output)
@@ -96,13 +219,13 @@ class FileCopier(object):
 
         files_to_copy, link_folders = self._filter_files(src, pattern, symlinks, excludes,
                                                          ignore_case, excluded_folders)
-        copied_files = self._copy_files(files_to_copy, src, dst, keep_path, symlinks)
+        copied_files = self._copy_files(files_to_copy, src, dst, keep_path, symlinks,
+                                        self._hardlinks, self._strategies)
         self.link_folders(src, dst, link_folders)
         self._copied.extend(files_to_copy)
         return copied_files
 
-    @staticmethod
-    def _filter_files(src, pattern, links, excludes, ignore_case, excluded_folders):
+    def _filter_files(self, src, pattern, links, excludes, ignore_case, excluded_folders):
 
         """ return a list of the files matching the patterns
         The list will be relative path names wrt to the root src folder
@@ -117,50 +240,56 @@ class FileCopier(object):
                 excludes = [e.lower() for e in excludes]
         else:
             excludes = []
+        excludes = [_compile_pattern(e) for e in excludes]
 
-        for root, subfolders, files in walk(src, followlinks=True):
-            if root in excluded_folders:
-                subfolders[:] = []
+        pruned = []  # Relative folders excluded, with their subfolders
+        for relative_path, files in self._snapshot(src, links, excluded_folders).entries:
+            if pruned and any(relative_path.startswith(p) for p in pruned):
                 continue
-
-            if links and os.path.islink(root):
-                linked_folders.append(os.path.relpath(root, src))
-                subfolders[:] = []
+            if files is None:  # A linked folder
+                linked_folders.append(relative_path)
                 continue
-            basename = os.path.basename(root)
-            # Skip git or svn subfolders
-            if basename in [".git", ".svn"]:
-                subfolders[:] = []
-                continue
-            if basename == "test_package":  # DO NOT export test_package/build folder
-                try:
-                    subfolders.remove("build")
-                except ValueError:
-                    pass
-
-            relative_path = os.path.relpath(root, src)
-            for exclude in excludes:
-                if fnmatch.fnmatch(relative_path, exclude):
-                    subfolders[:] = []
-                    files = []
+            if any(exclude(relative_path) for exclude in excludes):
+                if relative_path == ".":
                     break
-            for f in files:
-                relative_name = os.path.normpath(os.path.join(relative_path, f))
-                filenames.append(relative_name)
+                pruned.append(relative_path + os.sep)
+                continue
+            filenames.extend(files)
 
         if ignore_case:
             filenames = {f.lower(): f for f in filenames}
             pattern = pattern.lower()
 
-        files_to_copy = fnmatch.filter(filenames, pattern)
+        match = _compile_pattern(pattern)
+        files_to_copy = [f for f in filenames if match(f)]
         for exclude in excludes:
-            files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatch(f, exclude)]
+            files_to_copy = [f for f in files_to_copy if not exclude(f)]
 
         if ignore_case:
             files_to_copy = [filenames[f] for f in files_to_copy]
 
         return files_to_copy, linked_folders
 
+    def _snapshot(self, src, links, excluded_folders):
+        """ The tree of the src folder is walked once, and reused by the following copies
+        from it, or from any of its subfolders, while it doesn't change
+        """
+        excluded_folders = tuple(sorted(set(os.path.normpath(f) for f in excluded_folders)))
+        key = (src, links, excluded_folders)
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            for (_, tree_links, tree_excluded), tree in self._snapshots.items():
+                if tree_links == links and tree_excluded == excluded_folders:
+                    snapshot = tree.subtree(os.path.normpath(src))
+                    if snapshot is not None:
+                        break
+        if snapshot is not None and snapshot.is_valid():
+            self._snapshots[key] = snapshot
+            return snapshot
+        snapshot = _FolderSnapshot(src, links, excluded_folders)
+        self._snapshots[key] = snapshot
+        return snapshot
+
     @staticmethod
     def link_folders(src, dst, linked_folders):
         created_links = []
@@ -203,7 +332,8 @@ class FileCopier(object):
                     base_path = os.path.dirname(base_path)
 
     @staticmethod
-    def _copy_files(files, src, dst, keep_path, symlinks):
+    def _copy_files(files, src, dst, keep_path, symlinks, hardlinks=False,
+                    strategies=DEFAULT_COPY_STRATEGIES):
         """ executes a multiple file copy from [(src_file, dst_file), (..)]
         managing symlinks if necessary
         """
@@ -224,6 +354,7 @@ class FileCopier(object):
                     pass
                 os.symlink(linkto, abs_dst_name)  # @UndefinedVariable
             else:
-                shutil.copy2(abs_src_name, abs_dst_name)
+                copy_file(abs_src_name, abs_dst_name, allow_hardlink=hardlinks,
+                          strategies=strategies)
             copied_files.append(abs_dst_name)
         return copied_files
@@ -1,13 +1,23 @@
+import hashlib
+import json
+import os
+import sys
 import traceback
+from multiprocessing.pool import ThreadPool
 from os.path import join
 
+import six
+
 from conans.client.generators.cmake_find_package import CMakeFindPackageGenerator
 from conans.client.generators.cmake_find_package_multi import CMakeFindPackageMultiGenerator
 from conans.client.generators.compiler_args import CompilerArgsGenerator
 from conans.client.generators.pkg_config import PkgConfigGenerator
+from conans.client.graph.graph import RECIPE_EDITABLE
 from conans.errors import ConanException
+from conans.paths import CONAN_MANIFEST, GENERATORS_DIGEST
 from conans.util.env_reader import get_env
-from conans.util.files import normalize, save
+from conans.util.files import load, normalize, save
+from conans.util.perf import perf_traced
 from .b2 import B2Generator
 from .boostbuild import BoostBuildGenerator
 from .cmake import CMakeGenerator
@@ -83,9 +93,88 @@ registered_generators.add("make", MakeGenerator)
 registered_generators.add("deploy", DeployGenerator)
 
 
-def write_generators(conanfile, path, output):
-    """ produces auxiliary files, required to build a project or a package.
+def generators_digest(conanfile, deps_graph):
+    """ hash of everything the generators of the consumer conanfile depend on: the generators,
+    its settings, options and environment and the recipe and package contents of every
+    dependency and python_requires. None if it cannot be known (editable packages, deploy
+    generator, virtualenv generators)
     """
+    if "deploy" in conanfile.generators:  # It copies files that the user can change
+        return None
+    for generator_name in conanfile.generators:
+        if (generator_name in registered_generators and
+                issubclass(registered_generators[generator_name], VirtualEnvGenerator)):
+            # The deactivate scripts restore the values of the current environment
+            return None
+    from conans import __version__ as client_version
+    items = [client_version, repr(conanfile.generators), conanfile.settings.values.dumps(),
+             conanfile.options.values.dumps(), repr(sorted(conanfile.env.items()))]
+    for node in sorted(deps_graph.nodes, key=lambda n: n.id):
+        if node.recipe == RECIPE_EDITABLE:
+            return None
+        # The python_requires can define generators too, they are not nodes of the graph
+        python_requires = getattr(node.conanfile, "python_requires", None) or {}
+        items.extend(sorted(repr(r.ref) for r in python_requires.values()))
+        if node is deps_graph.root:
+            # A conanfile.py can define and register its own generators
+            if node.path and os.path.isfile(node.path):
+                items.append(load(node.path))
+            continue
+        items.append(repr(node.pref))
+        package_folder = node.conanfile.package_folder
+        manifest = join(package_folder, CONAN_MANIFEST) if package_folder else None
+        # The manifest identifies the package contents, also without revisions
+        items.append(package_folder or "")
+        items.append(load(manifest) if manifest and os.path.isfile(manifest) else "")
+    sha = hashlib.sha1()
+    for item in items:
+        sha.update(item.encode("utf-8"))
+        sha.update(b"\0")
+    return sha.hexdigest()
+
+
+def _generated_files(digest_path, digest):
+    """ files generated for the same digest by the previous write_generators() call, None if
+    they were generated for other inputs or any of them no longer exists
+    """
+    try:
+        previous = json.loads(load(digest_path))
+    except (IOError, OSError, ValueError):
+        return None
+    if previous.get("digest") != digest:
+        return None
+    folder = os.path.dirname(digest_path)
+    files = previous.get("files", [])
+    if not all(os.path.exists(join(folder, f)) for f in files):
+        return None
+    return files
+
+
+def _generator_content(generator):
+    """ the content of the generator and the sys.exc_info() of its error, if any
+    """
+    try:
+        return generator.content, None
+    except Exception:
+        return None, sys.exc_info()
+
+
+@perf_traced("generators", "install")
+def write_generators(conanfile, path, output, digest=None):
+    """ produces auxiliary files, required to build a project or a package. Files whose content
+    didn't change are not written, so their timestamps don't change. If the digest (see
+    generators_digest()) is the one of the previous call for the same path, nothing is
+    generated. Returns the written files. The generators run in CONAN_GENERATORS_JOBS threads
+    """
+    digest_path = join(path, GENERATORS_DIGEST)
+    if digest:
+        if _generated_files(digest_path, digest) is not None:
+            output.info("Generators skipped, their inputs didn't change")
+            return []
+    if os.path.exists(digest_path):
+        os.remove(digest_path)
+
+    generators = []
     for generator_name in conanfile.generators:
         try:
             generator_class = registered_generators[generator_name]
@@ -98,25 +187,50 @@ def write_generators(conanfile, path, output):
             # To allow old-style generator packages to work (e.g. premake)
             output.warn("Generator %s failed with new __init__(), trying old one")
             generator = generator_class(conanfile.deps_cpp_info, conanfile.cpp_info)
+        generator.output_path = path
+        generators.append((generator_name, generator))
 
+    jobs = get_env("CONAN_GENERATORS_JOBS", 1)
+    if jobs > 1 and len(generators) > 1:
+        # The contents are computed in parallel, but written and reported in order
+        pool = ThreadPool(min(jobs, len(generators)))
         try:
-            generator.output_path = path
-            content = generator.content
+            contents = pool.map(_generator_content, [g for _, g in generators])
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        contents = (_generator_content(g) for _, g in generators)
+
+    generated, changed = [], []
+    for (generator_name, generator), (content, error) in zip(generators, contents):
+        try:
+            if error:
+                six.reraise(*error)
             if isinstance(content, dict):
                 if generator.filename:
                     output.warn("Generator %s is multifile. Property 'filename' not used"
                                 % (generator_name,))
-                for k, v in content.items():
-                    v = normalize(v)
-                    output.info("Generator %s created %s" % (generator_name, k))
-                    save(join(path, k), v, only_if_modified=True)
+                files = content.items()
             else:
-                content = normalize(content)
-                output.info("Generator %s created %s" % (generator_name, generator.filename))
-                save(join(path, generator.filename), content, only_if_modified=True)
+                files = [(generator.filename, content)]
+            for filename, file_content in files:
+                output.info("Generator %s created %s" % (generator_name, filename))
+                generated.append(filename)
+                if save(join(path, filename), normalize(file_content), only_if_modified=True):
+                    changed.append(filename)
         except Exception as e:
             if get_env("CONAN_VERBOSE_TRACEBACK", False):
                 output.error(traceback.format_exc())
             output.error("Generator %s(file:%s) failed\n%s"
                          % (generator_name, generator.filename, str(e)))
             raise ConanException(e)
+
+    if generated:
+        if changed:
+            output.info("Generated files changed: %s" % ", ".join(changed))
+        else:
+            output.info("Generated files didn't change")
+    if digest:
+        save(digest_path, json.dumps({"digest": digest, "files": generated}))
+    return changed
@@ -0,0 +1,188 @@
+import json
+import os
+import time
+
+from conans.errors import ConanException
+from conans.model.graph_lock import GraphLockFile, LOCKFILE
+from conans.model.ref import PackageReference
+from conans.util.files import load, mkdir, save
+from conans.util.locks import SimpleLock
+
+QUEUE_FILE = "queue.json"
+CLAIMED, BUILT, FAILED = "claimed", "built", "failed"
+# Seconds without a heartbeat of the worker building a node before other workers claim it again
+CLAIM_TIMEOUT = 300
+
+
+class BuildQueue(object):
+    """ The packages of a lockfile to be built from sources, in a folder shared by the workers
+    that build them, a network drive when they run in different machines. It contains the
+    lockfile, updated with every package built, the nodes to build with the nodes to build they
+    depend on, and a file for every node claimed, built or failed by a worker. A node can be
+    built as soon as all the nodes it depends on are built, the workers don't wait for all the
+    packages of the previous level of the build-order. The workers update the time of their
+    claims while building, the claims not updated in claim_timeout seconds (e.g. the worker
+    was killed) can be claimed by other workers
+    """
+
+    def __init__(self, folder, claim_timeout=CLAIM_TIMEOUT):
+        self._folder = folder
+        self._claim_timeout = claim_timeout
+        self._lockfile = os.path.join(folder, LOCKFILE)
+        self._mutex = SimpleLock(os.path.join(folder, "queue.lock"))
+        try:
+            data = json.loads(load(os.path.join(folder, QUEUE_FILE)))
+        except IOError:
+            raise ConanException("There is no build queue in '%s'" % folder)
+        self._nodes = data["nodes"]
+        self._order = data["order"]
+
+    @property
+    def claim_timeout(self):
+        return self._claim_timeout
+
+    @staticmethod
+    def create(folder, graph_lock_file, build_order):
+        """ creates the queue for the build_order, the [[(node_id, pref)]] of the nodes of
+        graph_lock_file to build, as returned by DepsGraph.new_build_order()
+        """
+        graph_lock = graph_lock_file.graph_lock
+        items = [item for level in build_order for item in level]
+        # The nodes with the same PREF of a node in the build-order are not built again
+        prefs = {pref: node_id for node_id, pref in items}
+        nodes = {}
+        for node_id, pref in items:
+            requires = set()
+            for dep_id in graph_lock.dependencies(node_id):
+                dep_pref = graph_lock.pref(dep_id)
+                dep_id = prefs.get(dep_pref.copy_clear_prev()) if dep_pref else None
+                if dep_id is not None:
+                    requires.add(dep_id)
+            nodes[node_id] = {"pref": repr(pref), "requires": sorted(requires)}
+
+        mkdir(folder)
+        for state in (CLAIMED, BUILT, FAILED):
+            mkdir(os.path.join(folder, state))
+        graph_lock_file.save(os.path.join(folder, LOCKFILE))
+        order = [node_id for node_id, _ in items]
+        save(os.path.join(folder, QUEUE_FILE), json.dumps({"nodes": nodes, "order": order},
+                                                          indent=True))
+        return BuildQueue(folder)
+
+    def _states(self):
+        return {state: set(os.listdir(os.path.join(self._folder, state)))
+                for state in (CLAIMED, BUILT, FAILED)}
+
+    def _blocked(self, states):
+        """ the nodes that will never be built, because some node they depend on failed
+        """
+        failed = states[FAILED]
+        return set(node_id for node_id, node in self._nodes.items()
+                   if node_id not in failed and any(r in failed for r in node["requires"]))
+
+    def _stale(self, node_id):
+        """ the claimed node is not being built anymore, its worker stopped updating the claim
+        """
+        try:
+            claim = json.loads(load(os.path.join(self._folder, CLAIMED, node_id)))
+            return time.time() - claim["time"] > self._claim_timeout
+        except (IOError, OSError, ValueError, KeyError):  # Removed or being written
+            return False
+
+    def _save_claim(self, node_id, worker):
+        save(os.path.join(self._folder, CLAIMED, node_id),
+             json.dumps({"worker": worker, "time": time.time()}))
+
+    def pref(self, node_id):
+        return PackageReference.loads(self._nodes[node_id]["pref"])
+
+    def claim(self, worker):
+        """ returns the ID of a node, not claimed by other worker, whose dependencies are
+        already built, or None if there isn't any (yet)
+        """
+        with self._mutex:
+            states = self._states()
+            for node_id in self._order:
+                if node_id in states[BUILT] or node_id in states[FAILED]:
+                    continue
+                if node_id in states[CLAIMED] and not self._stale(node_id):
+                    continue
+                if all(r in states[BUILT] for r in self._nodes[node_id]["requires"]):
+                    self._save_claim(node_id, worker)
+                    return node_id
+        return None
+
+    def _claimed_by(self, node_id, worker):
+        try:
+            claim = json.loads(load(os.path.join(self._folder, CLAIMED, node_id)))
+        except (IOError, OSError, ValueError):
+            return False
+        return claim.get("worker") == worker
+
+    def heartbeat(self, node_id, worker):
+        """ updates the time of the claim of the node being built by the worker. Returns False
+        if the claim was lost, taken by other worker after claim_timeout
+        """
+        with self._mutex:
+            if not self._claimed_by(node_id, worker):
+                return False
+            self._save_claim(node_id, worker)
+            return True
+
+    def release(self, node_id, worker):
+        """ removes the claim of the worker that stops building the node, e.g. interrupted, so
+        other workers can claim it
+        """
+        with self._mutex:
+            if self._claimed_by(node_id, worker):
+                os.remove(os.path.join(self._folder, CLAIMED, node_id))
+
+    def finished(self):
+        """ True if all the nodes that can be built are already built, or failed. The nodes
+        claimed by workers that stopped are still pending, claim() returns them once stale
+        """
+        with self._mutex:
+            states = self._states()
+        pending = set(self._nodes).difference(states[BUILT], states[FAILED],
+                                              self._blocked(states))
+        return not pending
+
+    def failures(self):
+        """ returns {node_id: error} of the nodes that failed, and the ones that were not built
+        because some node they depend on failed
+        """
+        with self._mutex:
+            states = self._states()
+            result = {node_id: load(os.path.join(self._folder, FAILED, node_id))
+                      for node_id in states[FAILED]}
+        for node_id in self._blocked(states):
+            result[node_id] = "Not built, a dependency failed"
+        return result
+
+    def load_lock(self, revisions_enabled):
+        """ returns the GraphLockFile with all the packages built so far
+        """
+        with self._mutex:
+            return GraphLockFile.load(self._lockfile, revisions_enabled)
+
+    def built(self, node_id, worker, graph_lock):
+        """ updates the lockfile with the graph_lock of the worker that built the node. Returns
+        False, without updating it, if the claim of the worker was lost
+        """
+        with self._mutex:
+            if not self._claimed_by(node_id, worker):
+                return False
+            graph_lock_file = GraphLockFile.load(self._lockfile, graph_lock.revisions_enabled)
+            graph_lock_file.graph_lock.update_lock(graph_lock)
+            graph_lock_file.save(self._lockfile)
+            save(os.path.join(self._folder, BUILT, node_id), "")
+            return True
+
+    def failed(self, node_id, worker, error):
+        """ marks the node as failed, returns False if the claim of the worker was lost
+        """
+        with self._mutex:
+            if not self._claimed_by(node_id, worker):
+                return False
+            save(os.path.join(self._folder, FAILED, node_id), error)
+            return True
@@ -25,6 +25,12 @@ BINARY_UNKNOWN = "Unknown"
 
 
 class Node(object):
+    __slots__ = ("ref", "path", "_package_id", "prev", "conanfile", "dependencies",
+                 "_dependencies_dsts", "dependants", "binary", "binary_non_skip",
+                 "update_manifest", "recipe", "remote", "binary_remote", "revision_pinned",
+                 "public_deps", "public_closure", "transitive_closure", "inverse_closure",
+                 "ancestors", "_id", "graph_lock_node")
+
     def __init__(self, ref, conanfile, recipe=None, path=None):
         self.ref = ref
         self.path = path  # path to the consumer conanfile.xx for consumer, None otherwise
@@ -32,8 +38,11 @@ class Node(object):
         self.prev = None
         self.conanfile = conanfile
         self.dependencies = []  # Ordered Edges
+        self._dependencies_dsts = set()  # The "dst" of the dependencies, to not repeat them
         self.dependants = set()  # Edges
         self.binary = None
+        self.binary_non_skip = None  # The binary of a node marked as BINARY_SKIP
+        self.update_manifest = None  # The manifest of the remote package to update
         self.recipe = recipe
         self.remote = None
         self.binary_remote = None
@@ -83,8 +92,6 @@ class Node(object):
     def partial_copy(self):
         # Used for collapse_graph
         result = Node(self.ref, self.conanfile, self.recipe, self.path)
-        result.dependants = set()
-        result.dependencies = []
         result.binary = self.binary
         result.remote = self.remote
         result.binary_remote = self.binary_remote
@@ -92,7 +99,8 @@ class Node(object):
 
     def add_edge(self, edge):
         if edge.src == self:
-            if edge not in self.dependencies:
+            if edge.dst not in self._dependencies_dsts:
+                self._dependencies_dsts.add(edge.dst)
                 self.dependencies.append(edge)
         else:
             self.dependants.add(edge)
@@ -168,6 +176,8 @@ class Node(object):
 
 
 class Edge(object):
+    __slots__ = ("src", "dst", "require")
+
     def __init__(self, src, dst, require):
         self.src = src
         self.dst = dst
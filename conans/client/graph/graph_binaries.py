@@ -9,6 +9,7 @@ from conans.model.info import ConanInfo, PACKAGE_ID_UNKNOWN
 from conans.model.manifest import FileTreeManifest
 from conans.model.ref import PackageReference
 from conans.util.files import is_dirty, rmdir
+from conans.util.perf import perf_traced
 
 
 class GraphBinariesAnalyzer(object):
@@ -237,11 +238,13 @@ class GraphBinariesAnalyzer(object):
         conanfile.options.freeze()
 
     @staticmethod
-    def _compute_package_id(node, default_package_id_mode):
+    def _compute_package_id(node, default_package_id_mode, shared_requirements=None):
         """
         Compute the binary package ID of this node
         :param node: the node to compute the package-ID
         :param default_package_id_mode: configuration of the package-ID mode
+        :param shared_requirements: {(pref, indirect): RequirementInfo} of the nodes already
+        computed, so the upstream requirements are not hashed again for every consumer
         """
         # TODO Conan 2.0. To separate the propagation of the graph (options) of the package-ID
         # A bit risky to be done now
@@ -260,7 +263,8 @@ class GraphBinariesAnalyzer(object):
                                           conanfile.options.values,
                                           direct_reqs,
                                           indirect_reqs,
-                                          default_package_id_mode=default_package_id_mode)
+                                          default_package_id_mode=default_package_id_mode,
+                                          shared_requirements=shared_requirements)
 
         # Once we are done, call package_id() to narrow and change possible values
         with conanfile_exception_formatter(str(conanfile), "package_id"):
@@ -269,18 +273,36 @@ class GraphBinariesAnalyzer(object):
         info = conanfile.info
         node.package_id = info.package_id()
 
-    def evaluate_graph(self, deps_graph, build_mode, update, remotes, nodes_subset=None, root=None):
+    def _evaluate_resolved(self, node, resolved_binaries):
+        """ reuses the binary in the cache of a previous resolution of the same locked graph,
+        already checked to be there, if the package ID didn't change
+        """
+        prev = resolved_binaries.get(node.id)
+        locked = node.graph_lock_node
+        if not prev or not locked or locked.pref.id != node.package_id:
+            return False
+        if not self._evaluate_is_cached(node, locked.pref):
+            node.binary = BINARY_CACHE
+            node.prev = prev
+        return True
+
+    @perf_traced("evaluate binaries", "graph")
+    def evaluate_graph(self, deps_graph, build_mode, update, remotes, nodes_subset=None, root=None,
+                       resolved_binaries=None):
         default_package_id_mode = self._cache.config.default_package_id_mode
+        shared_requirements = {}
         for node in deps_graph.ordered_iterate(nodes_subset=nodes_subset):
             self._propagate_options(node)
 
-            self._compute_package_id(node, default_package_id_mode)
+            self._compute_package_id(node, default_package_id_mode, shared_requirements)
             if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
                 continue
             if node.package_id == PACKAGE_ID_UNKNOWN:
                 assert node.binary is None, "Node.binary should be None"
                 node.binary = BINARY_UNKNOWN
                 continue
+            if resolved_binaries and self._evaluate_resolved(node, resolved_binaries):
+                continue
             self._evaluate_node(node, build_mode, update, remotes)
         deps_graph.mark_private_skippable(nodes_subset=nodes_subset, root=root)
 
@@ -1,4 +1,3 @@
-import time
 from collections import OrderedDict
 
 from conans.client.graph.graph import DepsGraph, Node, RECIPE_EDITABLE
@@ -8,6 +7,7 @@ from conans.model.conan_file import get_env_context_manager
 from conans.model.ref import ConanFileReference
 from conans.model.requires import Requirements, Requirement
 from conans.util.log import logger
+from conans.util.perf import perf_span
 
 
 class DepsGraphBuilder(object):
@@ -33,11 +33,10 @@ class DepsGraphBuilder(object):
         dep_graph.add_node(root_node)
 
         # enter recursive computation
-        t1 = time.time()
-        self._load_deps(dep_graph, root_node, Requirements(), None, None,
-                        check_updates, update, remotes,
-                        profile_host, graph_lock)
-        logger.debug("GRAPH: Time to load deps %s" % (time.time() - t1))
+        with perf_span("expand graph", "graph"):
+            self._load_deps(dep_graph, root_node, Requirements(), None, None,
+                            check_updates, update, remotes,
+                            profile_host, graph_lock)
         return dep_graph
 
     def extend_build_requires(self, graph, node, build_requires_refs, check_updates, update,
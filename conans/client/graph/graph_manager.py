@@ -14,6 +14,7 @@ from conans.model.graph_lock import GraphLock, GraphLockFile
 from conans.model.ref import ConanFileReference
 from conans.paths import BUILD_INFO
 from conans.util.files import load
+from conans.util.perf import perf_traced
 
 
 class _RecipeBuildRequires(OrderedDict):
@@ -101,13 +102,17 @@ class GraphManager(object):
 
         return conanfile
 
+    @perf_traced("load graph", "graph")
     def load_graph(self, reference, create_reference, graph_info, build_mode, check_updates, update,
-                   remotes, recorder, apply_build_requires=True):
+                   remotes, recorder, apply_build_requires=True, resolved_binaries=None):
         """ main entry point to compute a full dependency graph
+        :param resolved_binaries: {node_id: PREV} of the binaries in the cache that a previous
+        resolution of the graph_info.graph_lock found, to not evaluate them again
         """
         root_node = self._load_root_node(reference, create_reference, graph_info)
         return self._resolve_graph(root_node, graph_info, build_mode, check_updates, update, remotes,
-                                   recorder, apply_build_requires=apply_build_requires)
+                                   recorder, apply_build_requires=apply_build_requires,
+                                   resolved_binaries=resolved_binaries)
 
     def _load_root_node(self, reference, create_reference, graph_info):
         """ creates the first, root node of the graph, loading or creating a conanfile
@@ -223,7 +228,8 @@ class GraphManager(object):
         return root_node
 
     def _resolve_graph(self, root_node, graph_info, build_mode, check_updates,
-                       update, remotes, recorder, apply_build_requires=True):
+                       update, remotes, recorder, apply_build_requires=True,
+                       resolved_binaries=None):
         build_mode = BuildMode(build_mode, self._output)
         profile_host = graph_info.profile_host
         graph_lock = graph_info.graph_lock
@@ -233,7 +239,8 @@ class GraphManager(object):
                                       recorder=recorder,
                                       profile_host=profile_host,
                                       apply_build_requires=apply_build_requires,
-                                      graph_lock=graph_lock)
+                                      graph_lock=graph_lock,
+                                      resolved_binaries=resolved_binaries)
 
         # THIS IS NECESSARY to store dependencies options in profile, for consumer
         # FIXME: This is a hack. Might dissapear if graph for local commands is always recomputed
@@ -268,12 +275,13 @@ class GraphManager(object):
     def _recurse_build_requires(self, graph, builder, check_updates,
                                 update, build_mode, remotes, profile_build_requires, recorder,
                                 profile_host, graph_lock, apply_build_requires=True,
-                                nodes_subset=None, root=None):
+                                nodes_subset=None, root=None, resolved_binaries=None):
         """
         :param graph: This is the full dependency graph with all nodes from all recursions
         """
 
-        self._binary_analyzer.evaluate_graph(graph, build_mode, update, remotes, nodes_subset, root)
+        self._binary_analyzer.evaluate_graph(graph, build_mode, update, remotes, nodes_subset, root,
+                                             resolved_binaries)
         if not apply_build_requires:
             return
 
@@ -313,7 +321,7 @@ class GraphManager(object):
                                              check_updates, update, build_mode,
                                              remotes, profile_build_requires, recorder,
                                              profile_host, graph_lock, nodes_subset=nodessub,
-                                             root=node)
+                                             root=node, resolved_binaries=resolved_binaries)
 
             if new_profile_build_requires:
                 nodessub = builder.extend_build_requires(graph, node, new_profile_build_requires,
@@ -324,11 +332,11 @@ class GraphManager(object):
                                              check_updates, update, build_mode,
                                              remotes, {}, recorder,
                                              profile_host, graph_lock, nodes_subset=nodessub,
-                                             root=node)
+                                             root=node, resolved_binaries=resolved_binaries)
 
     def _load_graph(self, root_node, check_updates, update, build_mode, remotes,
                     profile_host_build_requires, recorder, profile_host, apply_build_requires,
-                    graph_lock):
+                    graph_lock, resolved_binaries=None):
 
         assert isinstance(build_mode, BuildMode)
         builder = DepsGraphBuilder(self._proxy, self._output, self._loader, self._resolver,
@@ -338,7 +346,8 @@ class GraphManager(object):
 
         self._recurse_build_requires(graph, builder, check_updates, update, build_mode,
                                      remotes, profile_host_build_requires, recorder, profile_host,
-                                     graph_lock, apply_build_requires=apply_build_requires)
+                                     graph_lock, apply_build_requires=apply_build_requires,
+                                     resolved_binaries=resolved_binaries)
 
         # Sort of closures, for linking order
         inverse_levels = {n: i for i, level in enumerate(graph.inverse_levels()) for n in level}
@@ -10,6 +10,7 @@ from conans.client.recorder.action_recorder import INSTALL_ERROR_MISSING, INSTAL
 from conans.client.remover import DiskRemover
 from conans.errors import ConanException, NotFoundException, RecipeNotFoundException
 from conans.paths.package_layouts.package_editable_layout import PackageEditableLayout
+from conans.util.perf import perf_traced
 from conans.util.tracer import log_recipe_got_from_local_cache
 
 
@@ -20,6 +21,7 @@ class ConanProxy(object):
         self._out = output
         self._remote_manager = remote_manager
 
+    @perf_traced("get recipe", "graph")
     def get_recipe(self, ref, check_updates, update, remotes, recorder):
         layout = self._cache.package_layout(ref)
         if isinstance(layout, PackageEditableLayout):
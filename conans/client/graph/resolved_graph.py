@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+
+from conans.client.graph.graph import (BINARY_CACHE, BINARY_SKIP, RECIPE_CONSUMER,
+                                       RECIPE_EDITABLE, RECIPE_VIRTUAL)
+from conans.errors import ConanException
+from conans.model.graph_lock import GraphLock
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import RESOLVED_GRAPH
+from conans.util.files import is_dirty, load, save
+from conans.util.log import logger
+
+
+class ResolvedGraph(object):
+    """ The dependency graph resolved by the previous install in an install folder, stored with
+    a digest of its inputs: the consumer conanfile or reference, the profile, the build modes and
+    the configuration that changes the package IDs. If the inputs didn't change, and the recipe
+    revisions, the versions available for version ranges and the binaries in the cache are still
+    the ones of that graph, the graph is locked to it (no ranges or remotes are resolved again)
+    and its binaries in the cache are reused without evaluating them again
+    """
+
+    def __init__(self, cache, folder, ref_or_path, graph_info, build_modes):
+        self._cache = cache
+        self._path = os.path.join(folder, RESOLVED_GRAPH)
+        self._digest = self._compute_digest(ref_or_path, graph_info, build_modes)
+
+    def _compute_digest(self, ref_or_path, graph_info, build_modes):
+        from conans import __version__ as client_version
+        config = self._cache.config
+        if isinstance(ref_or_path, ConanFileReference):
+            consumer = repr(ref_or_path)
+        else:
+            consumer = load(ref_or_path)
+        items = [client_version, consumer, repr(graph_info.root),
+                 graph_info.profile_host.dumps(),
+                 repr(sorted(build_modes)) if build_modes is not None else "None",
+                 repr(config.revisions_enabled), config.default_package_id_mode]
+        sha = hashlib.sha1()
+        for item in items:
+            sha.update(item.encode("utf-8"))
+            sha.update(b"\0")
+        return sha.hexdigest()
+
+    def _versions(self, name):
+        folder = os.path.join(self._cache.store, name)
+        return sorted(os.listdir(folder)) if os.path.isdir(folder) else []
+
+    def load(self):
+        """ returns the GraphLock and the {node_id: PREV} of the binaries in the cache of the
+        stored graph, or None if there is no graph for the current inputs or it is outdated
+        """
+        try:
+            data = json.loads(load(self._path))
+        except (IOError, OSError, ValueError):
+            return None
+        if data.get("digest") != self._digest:
+            return None
+        try:
+            if not self._valid(data):
+                return None
+        except (ConanException, IOError, OSError, KeyError):  # Removed or editable packages
+            return None
+        graph_lock = GraphLock.from_dict(data["graph_lock"])
+        graph_lock.revisions_enabled = self._cache.config.revisions_enabled
+        binaries = {node_id: prev for node_id, (_, _, prev) in data["packages"].items()}
+        return graph_lock, binaries
+
+    def _valid(self, data):
+        for name, versions in data["ranges"].items():
+            if self._versions(name) != versions:
+                logger.debug("RESOLVED GRAPH: New versions of %s" % name)
+                return False
+        metadatas = {}
+        for ref, rrev in data["recipes"].items():
+            ref = ConanFileReference.loads(ref)
+            metadata = self._cache.package_layout(ref).load_metadata()
+            if metadata.recipe.revision != rrev:
+                logger.debug("RESOLVED GRAPH: New revision of %s" % repr(ref))
+                return False
+            metadatas[ref] = metadata
+        for ref, package_id, prev in data["packages"].values():
+            ref = ConanFileReference.loads(ref)
+            package_folder = self._cache.package_layout(ref).package(PackageReference(ref,
+                                                                                      package_id))
+            if (not os.path.isdir(package_folder) or is_dirty(package_folder) or
+                    metadatas[ref].packages[package_id].revision != prev):
+                logger.debug("RESOLVED GRAPH: Package %s:%s changed" % (repr(ref), package_id))
+                return False
+        return True
+
+    def remove(self):
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+    def save(self, deps_graph):
+        """ stores the graph, once installed, for the inputs of this instance. Graphs with
+        editable packages are not stored
+        """
+        graph_lock = GraphLock(deps_graph)
+        recipes, packages, ranges = {}, {}, {}
+        for node in deps_graph.nodes:
+            if node.recipe == RECIPE_EDITABLE:
+                self.remove()
+                return
+            if node.recipe == RECIPE_VIRTUAL:
+                continue
+            for edge in node.dependencies:  # Also the build-requires
+                if edge.require.version_range is not None:
+                    name = edge.require.ref.name
+                    ranges[name] = self._versions(name)
+            refs = list(graph_lock.python_requires(node.id) or [])
+            if node.recipe != RECIPE_CONSUMER:
+                refs.append(node.ref)
+                binary = node.binary_non_skip if node.binary == BINARY_SKIP else node.binary
+                if binary == BINARY_CACHE:
+                    ref = repr(node.ref.copy_clear_rev())
+                    packages[node.id] = [ref, node.package_id, node.prev]
+            for ref in refs:
+                ref = ref.copy_clear_rev()
+                metadata = self._cache.package_layout(ref).load_metadata()
+                recipes[repr(ref)] = metadata.recipe.revision
+
+        data = {"digest": self._digest,
+                "graph_lock": graph_lock.as_dict(),
+                "recipes": recipes,
+                "packages": packages,
+                "ranges": ranges}
+        save(self._path, json.dumps(data, indent=True))
@@ -1,9 +1,15 @@
+import multiprocessing
 import os
 import shutil
+import sys
+import tempfile
 import time
+import traceback
+
+from six.moves.queue import Empty
 
 from conans.client import tools
-from conans.client.file_copier import report_copied_files
+from conans.client.file_copier import copy_strategies, report_copied_files
 from conans.client.generators import TXTGenerator, write_generators
 from conans.client.graph.graph import BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_EDITABLE, \
     BINARY_MISSING, BINARY_SKIP, BINARY_UPDATE, BINARY_UNKNOWN
@@ -24,12 +30,13 @@ from conans.model.info import PACKAGE_ID_UNKNOWN
 from conans.model.manifest import FileTreeManifest
 from conans.model.ref import PackageReference
 from conans.model.user_info import UserInfo
-from conans.paths import BUILD_INFO, CONANINFO, RUN_LOG_NAME
+from conans.paths import BUILD_INFO, BUILD_LOG_NAME, CONANINFO, RUN_LOG_NAME
 from conans.util.env_reader import get_env
-from conans.util.files import (clean_dirty, is_dirty, make_read_only, mkdir, rmdir, save, set_dirty,
-                               set_dirty_context_manager)
+from conans.util.files import (clean_dirty, copy_tree, is_dirty, load, make_read_only, mkdir,
+                               rmdir, save, set_dirty, set_dirty_context_manager)
 from conans.util.log import logger
-from conans.util.tracer import log_package_built, log_package_got_from_local_cache
+from conans.util.perf import perf_record, perf_span, perf_traced
+from conans.util.tracer import flush_traces, log_package_built, log_package_got_from_local_cache
 
 
 def build_id(conan_file):
@@ -79,6 +86,7 @@ class _PackageBuilder(object):
 
         return build_folder, skip_build
 
+    @perf_traced("prepare sources", "build")
     def _prepare_sources(self, conanfile, pref, package_layout, conanfile_path, source_folder,
                          build_folder, remotes):
         export_folder = package_layout.export()
@@ -95,7 +103,7 @@ class _PackageBuilder(object):
         if not getattr(conanfile, 'no_copy_source', False):
             self._output.info('Copying sources to build folder')
             try:
-                shutil.copytree(source_folder, build_folder, symlinks=True)
+                copy_tree(source_folder, build_folder, strategies=copy_strategies())
             except Exception as e:
                 msg = str(e)
                 if "206" in msg:  # System error shutil.Error 206: Filename or extension too long
@@ -120,7 +128,8 @@ class _PackageBuilder(object):
                          os.listdir(build_folder))
             self._output.highlight("Calling build()")
             with conanfile_exception_formatter(str(conanfile), "build"):
-                conanfile.build()
+                with perf_span("build", "build", ref=str(pref.ref)):
+                    conanfile.build()
 
             self._output.success("Package '%s' built" % pref.id)
             self._output.info("Build folder %s" % build_folder)
@@ -138,7 +147,7 @@ class _PackageBuilder(object):
             remove_imports(conanfile, copied_files, self._output)
 
     def _package(self, conanfile, pref, package_layout, conanfile_path, build_folder,
-                 package_folder):
+                 package_folder, hardlinks):
 
         # FIXME: Is weak to assign here the recipe_hash
         manifest = package_layout.recipe_manifest()
@@ -158,7 +167,7 @@ class _PackageBuilder(object):
             install_folder = build_folder  # While installing, the infos goes to build folder
             prev = run_package_method(conanfile, package_id, source_folder, build_folder,
                                       package_folder, install_folder, self._hook_manager,
-                                      conanfile_path, pref.ref)
+                                      conanfile_path, pref.ref, hardlinks=hardlinks)
 
         update_package_metadata(prev, package_layout, package_id, pref.ref.revision)
 
@@ -208,8 +217,13 @@ class _PackageBuilder(object):
                         self._build(conanfile, pref, build_folder)
                     clean_dirty(build_folder)
 
+                # The package files can be hardlinks of the build files only if they are not
+                # modified in place: the build folder is not reused (--keep-build, build_id())
+                # and the package doesn't copy files from the source folder
+                hardlinks = (not keep_build and not hasattr(conanfile, "build_id") and
+                             not getattr(conanfile, 'no_copy_source', False))
                 prev = self._package(conanfile, pref, package_layout, conanfile_path, build_folder,
-                                     package_folder)
+                                     package_folder, hardlinks)
                 assert prev
                 node.prev = prev
                 log_file = os.path.join(build_folder, RUN_LOG_NAME)
@@ -224,6 +238,90 @@ class _PackageBuilder(object):
             return node.pref
 
 
+class _BuildWorker(object):
+    """ builds the package of a node in a forked process, with CONAN_CPU_COUNT=cpu_count, and
+    captures in a log file its output and the output of the commands it runs
+    """
+    def __init__(self, builder, node, keep_build, recorder, remotes, layout, cpu_count, output,
+                 requester):
+        self.node = node
+        self._builder = builder
+        self._keep_build = keep_build
+        self._recorder = recorder
+        self._remotes = remotes
+        self._layout = layout
+        self._cpu_count = cpu_count
+        self._output = output
+        self._requester = requester
+        fd, self.log_path = tempfile.mkstemp(prefix="conan_build", suffix=".log")
+        os.close(fd)
+        self.start_time = time.time()
+        self._process = None
+
+    def start(self, context, queue):
+        # Otherwise the forked process would write again what this one didn't flush yet
+        sys.stdout.flush()
+        sys.stderr.flush()
+        flush_traces()
+        self._process = context.Process(target=self._run, args=(queue, ))
+        self._process.start()
+
+    @property
+    def pid(self):
+        return self._process.pid
+
+    def _run(self, queue):
+        os.environ["CONAN_CPU_COUNT"] = str(self._cpu_count)
+        # The connections of the parent are still used by it, to download other packages
+        self._requester.reset_session()
+        stream = self._output.stream
+        # The output of the API users can be an in-memory stream instead of a file
+        buffered_start = len(stream.getvalue()) if hasattr(stream, "getvalue") else None
+        prev = build_folder = error = None
+        with open(self.log_path, "w") as log:
+            os.dup2(log.fileno(), 1)
+            os.dup2(log.fileno(), 2)
+            try:
+                pref = self.node.pref
+                with self._layout.package_lock(pref):
+                    with set_dirty_context_manager(self._layout.package(pref)):
+                        prev = self._builder.build_package(self.node, self._keep_build,
+                                                           self._recorder, self._remotes).revision
+                build_folder = os.getcwd()  # The build_package() runs in the build folder
+            except ConanException as exc:
+                error = str(exc)
+            except BaseException as exc:
+                error = "%s\n%s" % (exc, traceback.format_exc())
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+        if buffered_start is not None:
+            save(self.log_path, load(self.log_path) + stream.getvalue()[buffered_start:])
+        flush_traces()  # The forked process exits without the atexit handlers
+        queue.put((self.node.id, prev, build_folder, error))
+
+    @staticmethod
+    def wait(queue, workers):
+        """ waits for any of the {node.id: _BuildWorker} to finish and removes it, returns it
+        with the PREV it built and the build folder, or the error message if it failed
+        """
+        while True:
+            try:
+                node_id, prev, build_folder, error = queue.get(timeout=1)
+                break
+            except Empty:
+                # A worker that dies without its result, killed or crashed, is a failed build
+                dead = [node_id for node_id, w in workers.items() if not w._process.is_alive()]
+                if dead and queue.empty():
+                    node_id, prev, build_folder = dead[0], None, None
+                    error = "The build process exited with code %s" \
+                            % workers[node_id]._process.exitcode
+                    break
+        worker = workers.pop(node_id)
+        worker._process.join()
+        return worker, prev, build_folder, error
+
+
 def _remove_folder_raising(folder):
     try:
         rmdir(folder)
@@ -298,42 +396,173 @@ class BinaryInstaller(object):
         self._recorder = recorder
         self._binaries_analyzer = app.binaries_analyzer
         self._hook_manager = app.hook_manager
+        self._requester = app.requester
 
-    def install(self, deps_graph, remotes, build_mode, update, keep_build=False, graph_info=None):
+    def install(self, deps_graph, remotes, build_mode, update, keep_build=False, graph_info=None,
+                build_jobs=None):
         # order by levels and separate the root node (ref=None) from the rest
         nodes_by_level = deps_graph.by_levels()
         root_level = nodes_by_level.pop()
         root_node = root_level[0]
+        build_jobs = build_jobs or get_env("CONAN_BUILD_JOBS", 1)
+        if build_jobs > 1 and not hasattr(os, "fork"):
+            self._out.warn("Building packages in parallel is not supported in this platform, "
+                           "they will be built one by one")
+            build_jobs = 1
         # Get the nodes in order and if we have to build them
-        self._build(nodes_by_level, keep_build, root_node, graph_info, remotes, build_mode, update)
+        if build_jobs > 1:
+            self._build_parallel(nodes_by_level, keep_build, root_node, graph_info, remotes,
+                                 build_mode, update, build_jobs)
+        else:
+            self._build(nodes_by_level, keep_build, root_node, graph_info, remotes, build_mode,
+                        update)
 
     def _build(self, nodes_by_level, keep_build, root_node, graph_info, remotes, build_mode, update):
         processed_package_refs = set()
         for level in nodes_by_level:
             for node in level:
-                ref, conan_file = node.ref, node.conanfile
-                output = conan_file.output
-                package_id = node.package_id
-                if node.binary == BINARY_MISSING:
-                    dependencies = [str(dep.dst) for dep in node.dependencies]
-                    raise_package_not_found_error(conan_file, ref, package_id, dependencies,
-                                                  out=output, recorder=self._recorder)
-
-                self._propagate_info(node)
-                if node.binary == BINARY_EDITABLE:
-                    self._handle_node_editable(node, graph_info)
-                else:
-                    if node.binary == BINARY_SKIP:  # Privates not necessary
+                self._install_node(node, keep_build, processed_package_refs, graph_info, remotes,
+                                   build_mode, update)
+
+        # Finally, propagate information to root node (ref=None)
+        self._propagate_info(root_node)
+
+    def _build_parallel(self, nodes_by_level, keep_build, root_node, graph_info, remotes,
+                        build_mode, update, build_jobs):
+        """ builds up to build_jobs packages at the same time, each one in a worker process with
+        its share of the CPUs, while this process installs the packages that are not built.
+        The nodes are processed in the order of the levels as soon as all their dependencies
+        are, so the information of the dependencies is propagated always in the same order
+        """
+        if hasattr(multiprocessing, "get_context"):
+            context = multiprocessing.get_context("fork")
+        else:
+            context = multiprocessing
+        queue = context.Queue()
+        cpu_count = max(1, tools.cpu_count(self._out) // build_jobs)
+        processed_package_refs = set()
+        pending = [node for level in nodes_by_level for node in level]
+        done = set()
+        workers = {}  # {node.id: _BuildWorker}
+
+        def build(node):
+            # Downloaded here, the build process doesn't use the remotes unless the recipe does
+            self._complete_python_requires(node, remotes)
+            complete_recipe_sources(self._remote_manager, self._cache, node.conanfile, node.ref,
+                                    remotes)
+            builder = _PackageBuilder(self._cache, node.conanfile.output, self._hook_manager,
+                                      self._remote_manager)
+            worker = _BuildWorker(builder, node, keep_build, self._recorder, remotes,
+                                  self._cache.package_layout(node.ref, node.conanfile.short_paths),
+                                  cpu_count, self._out, self._requester)
+            worker.start(context, queue)
+            workers[node.id] = worker
+
+        try:
+            while pending:
+                building = set((w.node.ref, w.node.package_id) for w in workers.values())
+                ready = [node for node in pending
+                         if (node.ref, node.package_id) not in building and
+                         all(n in done for n in node.public_closure) and
+                         all(n in done for n in node.neighbors())]
+                installed = False
+                for node in ready:
+                    if (len(workers) >= build_jobs and
+                            node.binary in (BINARY_BUILD, BINARY_UNKNOWN)):
                         continue
-                    assert ref.revision is not None, "Installer should receive RREV always"
-                    _handle_system_requirements(conan_file, node.pref, self._cache, output)
-                    if node.binary == BINARY_UNKNOWN:
-                        self._binaries_analyzer.reevaluate_node(node, remotes, build_mode, update)
-                    self._handle_node_cache(node, keep_build, processed_package_refs, remotes)
+                    pending.remove(node)
+                    self._install_node(node, keep_build, processed_package_refs, graph_info,
+                                       remotes, build_mode, update, build=build)
+                    if node.id not in workers:
+                        done.add(node)
+                        installed = True
+                if not installed:
+                    assert workers, "Nodes that can't be installed: %s" % pending
+                    done.add(self._finish_worker(queue, workers))
+            while workers:
+                self._finish_worker(queue, workers)
+        except BaseException:
+            # Let the running builds finish, not to leave half-built packages
+            while workers:
+                try:
+                    self._finish_worker(queue, workers)
+                except ConanException:
+                    pass
+            raise
 
         # Finally, propagate information to root node (ref=None)
         self._propagate_info(root_node)
 
+    def _finish_worker(self, queue, workers):
+        """ waits for any of the workers to finish, shows its output and calls the package_info()
+        of the package it built. Returns its node
+        """
+        worker, prev, build_folder, error = _BuildWorker.wait(queue, workers)
+        node = worker.node
+        pref = node.pref
+        # The spans of the forked process are lost, it is shown as a whole in its own track
+        perf_record("build package", "build", worker.start_time, time.time() - worker.start_time,
+                    worker.pid, ref=str(pref.ref))
+        log = load(worker.log_path)
+        if build_folder and os.path.isdir(build_folder):
+            shutil.move(worker.log_path, os.path.join(build_folder, BUILD_LOG_NAME))
+        else:
+            os.remove(worker.log_path)
+        self._out.write(log)
+        if error:
+            self._recorder.package_install_error(pref, INSTALL_ERROR_BUILDING, error,
+                                                 remote_name=None)
+            raise ConanException(error)
+
+        node.prev = prev
+        if node.graph_lock_node:
+            node.graph_lock_node.modified = BINARY_BUILD
+        self._recorder.package_built(node.pref)
+        conanfile = node.conanfile
+        package_folder = self._cache.package_layout(node.ref, conanfile.short_paths).package(pref)
+        start = time.time()
+        self._call_package_info(conanfile, package_folder, ref=pref.ref)
+        self._recorder.package_timing(pref, "package_info", time.time() - start)
+        self._recorder.package_cpp_info(pref, conanfile.cpp_info)
+        self._recorder.package_timing(pref, "install", time.time() - worker.start_time)
+        return node
+
+    def _install_node(self, node, keep_build, processed_package_refs, graph_info, remotes,
+                      build_mode, update, build=None):
+        """ installs the binary of a node once all its dependencies are installed. If given, the
+        build(node) callback builds the packages that have to be built from sources
+        """
+        ref, conan_file = node.ref, node.conanfile
+        output = conan_file.output
+        package_id = node.package_id
+        if node.binary == BINARY_MISSING:
+            dependencies = [str(dep.dst) for dep in node.dependencies]
+            raise_package_not_found_error(conan_file, ref, package_id, dependencies,
+                                          out=output, recorder=self._recorder)
+
+        start = time.time()
+        self._propagate_info(node)
+        propagate_time = time.time() - start
+        if node.binary == BINARY_EDITABLE:
+            self._handle_node_editable(node, graph_info)
+        else:
+            if node.binary == BINARY_SKIP:  # Privates not necessary
+                return
+            assert ref.revision is not None, "Installer should receive RREV always"
+            _handle_system_requirements(conan_file, node.pref, self._cache, output)
+            if node.binary == BINARY_UNKNOWN:
+                self._binaries_analyzer.reevaluate_node(node, remotes, build_mode, update)
+            if (build is not None and node.binary == BINARY_BUILD and
+                    node.pref not in processed_package_refs):
+                processed_package_refs.add(node.pref)
+                self._recorder.package_timing(node.pref, "propagate_info", propagate_time)
+                build(node)
+                return
+            self._handle_node_cache(node, keep_build, processed_package_refs, remotes)
+        # Time spent by every package, to find the slow steps of big graphs
+        self._recorder.package_timing(node.pref, "propagate_info", propagate_time)
+        self._recorder.package_timing(node.pref, "install", time.time() - start)
+
     @staticmethod
     def _node_concurrently_installed(node, package_folder):
         if node.binary == BINARY_DOWNLOAD and os.path.exists(package_folder):
@@ -406,10 +635,12 @@ class BinaryInstaller(object):
                         with set_dirty_context_manager(package_folder):
                             assert pref.revision is not None, \
                                 "Installer should receive #PREV always"
-                            self._remote_manager.get_package(pref, package_folder,
-                                                             node.binary_remote, output,
-                                                             self._recorder)
-                            output.info("Downloaded package revision %s" % pref.revision)
+                            if not self._install_shared_package(layout, pref, output):
+                                self._remote_manager.get_package(pref, package_folder,
+                                                                 node.binary_remote, output,
+                                                                 self._recorder)
+                                output.info("Downloaded package revision %s" % pref.revision)
+                                layout.publish_shared_package(pref, copy_strategies())
                             with layout.update_metadata() as metadata:
                                 metadata.packages[pref.id].remote = node.binary_remote.name
                     else:
@@ -423,18 +654,34 @@ class BinaryInstaller(object):
                     self._recorder.package_fetched_from_cache(pref)
 
             # Call the info method
+            start = time.time()
             self._call_package_info(conanfile, package_folder, ref=pref.ref)
+            self._recorder.package_timing(pref, "package_info", time.time() - start)
             self._recorder.package_cpp_info(pref, conanfile.cpp_info)
 
-    def _build_package(self, node, output, keep_build, remotes):
-        conanfile = node.conanfile
+    def _install_shared_package(self, layout, pref, output):
+        # A read-only cache can point to the shared package, otherwise its files are copied
+        read_only = get_env("CONAN_READ_ONLY_CACHE", False)
+        if not layout.install_shared_package(pref, read_only, copy_strategies()):
+            return False
+        with layout.update_metadata() as metadata:
+            metadata.packages[pref.id].revision = pref.revision
+            metadata.packages[pref.id].recipe_revision = pref.ref.revision
+        output.success("Package installed %s from the shared package store" % pref.id)
+        log_package_got_from_local_cache(pref)
+        self._recorder.package_fetched_from_cache(pref)
+        return True
+
+    def _complete_python_requires(self, node, remotes):
         # It is necessary to complete the sources of python requires, which might be used
-        for python_require in conanfile.python_requires.values():
+        for python_require in node.conanfile.python_requires.values():
             assert python_require.ref.revision is not None, \
                 "Installer should receive python_require.ref always"
             complete_recipe_sources(self._remote_manager, self._cache,
                                     python_require.conanfile, python_require.ref, remotes)
 
+    def _build_package(self, node, output, keep_build, remotes):
+        self._complete_python_requires(node, remotes)
         builder = _PackageBuilder(self._cache, output, self._hook_manager, self._remote_manager)
         pref = builder.build_package(node, keep_build, self._recorder, remotes)
         if node.graph_lock_node:
@@ -447,23 +694,26 @@ class BinaryInstaller(object):
         node_order = [n for n in node.public_closure if n.binary != BINARY_SKIP]
         # List sort is stable, will keep the original order of the closure, but prioritize levels
         conan_file = node.conanfile
-        transitive = node.transitive_closure.values()
+        transitive = set(node.transitive_closure.values())
         for n in node_order:
             if n not in transitive:
                 conan_file.output.info("Applying build-requirement: %s" % str(n.ref))
+            # The lists of deps_cpp_info are merged once, when they are read
             conan_file.deps_cpp_info.update(n.conanfile.cpp_info, n.ref.name)
-            conan_file.deps_env_info.update(n.conanfile.env_info, n.ref.name)
             conan_file.deps_user_info[n.ref.name] = n.conanfile.user_info
+        conan_file.deps_env_info.update_all([(n.conanfile.env_info, n.ref.name)
+                                             for n in node_order])
 
         # Update the info but filtering the package values that not apply to the subtree
         # of this current node and its dependencies.
-        subtree_libnames = [node.ref.name for node in node_order]
+        subtree_libnames = set(node.ref.name for node in node_order)
         for package_name, env_vars in conan_file._conan_env_values.data.items():
             for name, value in env_vars.items():
                 if not package_name or package_name in subtree_libnames or \
                    package_name == conan_file.name:
                     conan_file.info.env_values.add(name, value, package_name)
 
+    @perf_traced("package_info", "install")
     def _call_package_info(self, conanfile, package_folder, ref):
         conanfile.cpp_info = CppInfo(package_folder)
         conanfile.cpp_info.name = conanfile.name
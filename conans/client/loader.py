@@ -20,6 +20,7 @@ from conans.model.settings import Settings
 from conans.model.values import Values
 from conans.paths import DATA_YML
 from conans.util.files import load
+from conans.util.perf import perf_traced
 
 
 class ConanFileLoader(object):
@@ -162,6 +163,7 @@ class ConanFileLoader(object):
         except Exception as e:  # re-raise with file name
             raise ConanException("%s: %s" % (conanfile_path, str(e)))
 
+    @perf_traced("load recipe", "recipe")
     def load_conanfile(self, conanfile_path, profile, ref, lock_python_requires=None):
         """ load a conanfile with a full reference, name, version, user and channel are obtained
         from the reference, not evaluated. Main way to load from the cache
@@ -274,6 +276,7 @@ def _parse_module(conanfile_module, module_id):
     return result
 
 
+@perf_traced("parse recipe", "recipe")
 def parse_conanfile(conanfile_path, python_requires):
     with python_requires.capture_requires() as py_requires:
         module, filename = _parse_conanfile(conanfile_path)
@@ -1,9 +1,10 @@
 import os
 
-from conans.client.generators import write_generators
+from conans.client.generators import generators_digest, write_generators
 from conans.client.graph.build_mode import BuildMode
 from conans.client.graph.graph import RECIPE_CONSUMER, RECIPE_VIRTUAL
 from conans.client.graph.printer import print_graph
+from conans.client.graph.resolved_graph import ResolvedGraph
 from conans.client.importer import run_deploy, run_imports
 from conans.client.installer import BinaryInstaller, call_system_requirements
 from conans.client.manifest_manager import ManifestManager
@@ -13,13 +14,15 @@ from conans.client.tools import cross_building, get_cross_building_settings
 from conans.errors import ConanException
 from conans.model.ref import ConanFileReference
 from conans.paths import CONANINFO
+from conans.util.env_reader import get_env
 from conans.util.files import normalize, save
 
 
 def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, build_modes=None,
                  update=False, manifest_folder=None, manifest_verify=False,
                  manifest_interactive=False, generators=None, no_imports=False,
-                 create_reference=None, keep_build=False, use_lock=False, recorder=None):
+                 create_reference=None, keep_build=False, use_lock=False, recorder=None,
+                 build_jobs=None):
     """ Fetch and build all dependencies for the given reference
     :param app: The ConanApp instance with all collaborators
     @param ref_or_path: ConanFileReference or path to user space conanfile
@@ -43,8 +46,32 @@ def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, bui
 
     out.info("Configuration:")
     out.writeln(graph_info.profile_host.dumps())
-    deps_graph = graph_manager.load_graph(ref_or_path, create_reference, graph_info, build_modes,
-                                          False, update, remotes, recorder)
+    # The graph of the previous install in the same folder, if its inputs didn't change
+    resolved_graph, resolved, resolved_binaries = None, None, None
+    if (install_folder and get_env("CONAN_RESOLVED_GRAPH_CACHE", False) and not update and
+            not create_reference and graph_info.graph_lock is None and
+            not isinstance(ref_or_path, list)):
+        resolved_graph = ResolvedGraph(cache, install_folder, ref_or_path, graph_info,
+                                       build_modes)
+        resolved = resolved_graph.load()
+        if resolved:
+            out.info("Using the graph resolved by the previous install")
+            graph_info.graph_lock, resolved_binaries = resolved
+    try:
+        deps_graph = graph_manager.load_graph(ref_or_path, create_reference, graph_info,
+                                              build_modes, False, update, remotes, recorder,
+                                              resolved_binaries=resolved_binaries)
+    except ConanException as exc:
+        if not resolved:
+            raise
+        # The recipes can resolve other requirements with the same inputs, e.g. reading the
+        # environment in requirements(), the graph is resolved again without the stored one
+        out.info("The graph resolved by the previous install is outdated: %s" % str(exc))
+        resolved_graph.remove()
+        resolved = None
+        graph_info.graph_lock = None
+        deps_graph = graph_manager.load_graph(ref_or_path, create_reference, graph_info,
+                                              build_modes, False, update, remotes, recorder)
     root_node = deps_graph.root
     conanfile = root_node.conanfile
     if root_node.recipe == RECIPE_VIRTUAL:
@@ -65,9 +92,11 @@ def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, bui
     # TODO: Extract this from the GraphManager, reuse same object, check args earlier
     build_modes = BuildMode(build_modes, out)
     installer.install(deps_graph, remotes, build_modes, update, keep_build=keep_build,
-                      graph_info=graph_info)
+                      graph_info=graph_info, build_jobs=build_jobs)
     # GraphLock always != None here (because of graph_manager.load_graph)
     graph_info.graph_lock.update_check_graph(deps_graph, out)
+    if resolved_graph and not resolved:
+        resolved_graph.save(deps_graph)
 
     if manifest_folder:
         manifest_manager = ManifestManager(manifest_folder, user_io=user_io, cache=cache)
@@ -88,11 +117,14 @@ def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, bui
             tmp = list(conanfile.generators)  # Add the command line specified generators
             tmp.extend([g for g in generators if g not in tmp])
             conanfile.generators = tmp
-            write_generators(conanfile, install_folder, output)
+            digest = None
+            if get_env("CONAN_GENERATORS_DIGEST", False):
+                digest = generators_digest(conanfile, deps_graph)
+            write_generators(conanfile, install_folder, output, digest=digest)
         if not isinstance(ref_or_path, ConanFileReference) or use_lock:
             # Write conaninfo
             content = normalize(conanfile.info.dumps())
-            save(os.path.join(install_folder, CONANINFO), content)
+            save(os.path.join(install_folder, CONANINFO), content, only_if_modified=True)
             output.info("Generated %s" % CONANINFO)
             graph_info.save(install_folder)
             output.info("Generated graphinfo")
@@ -66,6 +66,10 @@ class ConanOutput(object):
         self._stream_err = stream_err or stream
         self._color = color
 
+    @property
+    def stream(self):
+        return self._stream
+
     @property
     def is_terminal(self):
         return hasattr(self._stream, "isatty") and self._stream.isatty()
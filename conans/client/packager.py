@@ -10,6 +10,7 @@ from conans.model.manifest import FileTreeManifest
 from conans.paths import CONANINFO
 from conans.util.files import mkdir, rmdir, save
 from conans.util.log import logger
+from conans.util.perf import perf_traced
 
 
 def export_pkg(conanfile, package_id, src_package_folder, package_folder, hook_manager,
@@ -41,13 +42,15 @@ def export_pkg(conanfile, package_id, src_package_folder, package_folder, hook_m
     return prev
 
 
+@perf_traced("package", "build")
 def run_package_method(conanfile, package_id, source_folder, build_folder, package_folder,
                        install_folder, hook_manager, conanfile_path, ref, local=False,
-                       copy_info=False):
+                       copy_info=False, hardlinks=False):
     """ calls the recipe "package()" method
     - Assigns folders to conanfile.package_folder, source_folder, install_folder, build_folder
     - Calls pre-post package hook
-    - Prepares FileCopier helper for self.copy
+    - Prepares FileCopier helper for self.copy, hardlinking the files if hardlinks, only when
+      the source and build folders are not used again
     """
     mkdir(package_folder)
     output = conanfile.output
@@ -68,7 +71,7 @@ def run_package_method(conanfile, package_id, source_folder, build_folder, packa
         output.highlight("Calling package()")
 
         folders = [source_folder, build_folder] if source_folder != build_folder else [build_folder]
-        conanfile.copy = FileCopier(folders, package_folder)
+        conanfile.copy = FileCopier(folders, package_folder, hardlinks=hardlinks)
         with conanfile_exception_formatter(str(conanfile), "package"):
             with chdir(build_folder):
                 conanfile.package()
@@ -114,6 +114,11 @@ class ActionRecorder(object):
         # assert isinstance(cpp_info, CppInfo)
         self._inst_packages_info[pref.copy_clear_revs()]['cpp_info'] = _cpp_info_to_dict(cpp_info)
 
+    def package_timing(self, pref, step, seconds):
+        assert isinstance(pref, PackageReference)
+        timing = self._inst_packages_info[pref.copy_clear_revs()].setdefault("timing", {})
+        timing[step] = timing.get(step, 0) + seconds
+
     @property
     def install_errored(self):
         all_values = list(self._inst_recipes_actions.values()) + list(self._inst_packages_actions.values())
@@ -7,6 +7,7 @@ from requests.exceptions import ConnectionError
 
 from conans import DEFAULT_REVISION_V1
 from conans.client.cache.remote_registry import Remote
+from conans.client.file_copier import copy_strategies
 from conans.errors import ConanConnectionError, ConanException, NotFoundException, \
     NoRestV2Available, PackageNotFoundException
 from conans.paths import EXPORT_SOURCES_DIR_OLD, \
@@ -18,6 +19,7 @@ from conans.util.files import make_read_only, mkdir, rmdir, tar_extract, touch_f
     merge_directories
 from conans.util.log import logger
 # FIXME: Eventually, when all output is done, tracer functions should be moved to the recorder class
+from conans.util.perf import perf_traced
 from conans.util.tracer import (log_package_download,
                                 log_recipe_download, log_recipe_sources_download,
                                 log_uncompressed_file)
@@ -69,6 +71,7 @@ class RemoteManager(object):
         pref = self._resolve_latest_pref(pref, remote)
         return self._call_remote(remote, "get_package_info", pref), pref
 
+    @perf_traced("download recipe", "download")
     def get_recipe(self, ref, remote):
         """
         Read the conans from remotes
@@ -102,6 +105,7 @@ class RemoteManager(object):
 
         return ref
 
+    @perf_traced("download recipe sources", "download")
     def get_recipe_sources(self, ref, export_folder, export_sources_folder, remote):
         assert ref.revision, "get_recipe_sources requires RREV"
         t1 = time.time()
@@ -119,10 +123,11 @@ class RemoteManager(object):
         # REMOVE in Conan 2.0
         c_src_path = os.path.join(export_sources_folder, EXPORT_SOURCES_DIR_OLD)
         if os.path.exists(c_src_path):
-            merge_directories(c_src_path, export_sources_folder)
+            merge_directories(c_src_path, export_sources_folder, strategies=copy_strategies())
             rmdir(c_src_path)
         touch_folder(export_sources_folder)
 
+    @perf_traced("download package", "download")
     def get_package(self, pref, dest_folder, remote, output, recorder):
 
         conanfile_path = self._cache.package_layout(pref.ref).conanfile()
@@ -278,6 +283,7 @@ def unzip_and_get_files(files, destination_dir, tgz_name, output):
         os.remove(tgz_file)
 
 
+@perf_traced("unzip", "download")
 def uncompress_file(src_path, dest_folder, output):
     t1 = time.time()
     try:
@@ -1,4 +1,5 @@
 import os
+import platform
 
 from conans.client.cache.remote_registry import Remote
 from conans.errors import ConanException, PackageNotFoundException, RecipeNotFoundException
@@ -6,15 +7,23 @@ from conans.errors import NotFoundException
 from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
 from conans.paths import SYSTEM_REQS, rm_conandir
 from conans.search.search import filter_outdated, search_packages, search_recipes
+from conans.util.env_reader import get_env
 from conans.util.log import logger
 
 
 class DiskRemover(object):
 
+    def __init__(self, trash=None):
+        # Folders are moved to the trash, if given, instead of being deleted
+        self._trash = trash
+
     def _remove(self, path, ref, msg=""):
         try:
             logger.debug("REMOVE: folder %s" % path)
-            rm_conandir(path)
+            if self._trash:
+                self._trash.move(path)
+            else:
+                rm_conandir(path)
         except OSError:
             error_msg = "Folder busy (open or some file open): %s" % path
             raise ConanException("%s: Unable to remove %s\n\t%s" % (repr(ref), msg, error_msg))
@@ -32,6 +41,10 @@ class DiskRemover(object):
         self.remove_src(package_layout)
         self._remove(package_layout.export(), package_layout.ref, "export folder")
         self._remove(package_layout.export_sources(), package_layout.ref, "export_source folder")
+        self._remove_lock_files(package_layout, output)
+
+    @staticmethod
+    def _remove_lock_files(package_layout, output):
         for f in package_layout.conanfile_lock_files(output=output):
             try:
                 os.remove(f)
@@ -39,6 +52,11 @@ class DiskRemover(object):
                 pass
 
     def remove(self, package_layout, output):
+        if self._trash and platform.system() != "Windows":
+            # The whole base folder is moved at once, there are no short paths folders out of it
+            self._remove_lock_files(package_layout, output)
+            self._remove(package_layout.base_folder(), package_layout.ref)
+            return
         self.remove_recipe(package_layout, output=output)
         self.remove_builds(package_layout)
         self.remove_packages(package_layout)
@@ -90,6 +108,7 @@ class ConanRemover(object):
         self._cache = cache
         self._remote_manager = remote_manager
         self._remotes = remotes
+        self._trash = cache.trash()
 
     def _remote_remove(self, ref, package_ids, remote):
         assert(isinstance(remote, Remote))
@@ -115,7 +134,7 @@ class ConanRemover(object):
         package_layout = self._cache.package_layout(ref, short_paths=False)
 
         package_layout.remove_package_locks()  # Make sure to clean the locks too
-        remover = DiskRemover()
+        remover = DiskRemover(self._trash)
         if src:
             remover.remove_src(package_layout)
         if build_ids is not None:
@@ -229,6 +248,18 @@ class ConanRemover(object):
 
         if not remote_name:
             self._cache.delete_empty_dirs(deleted_refs)
+            self._empty_trash()
+
+    def _empty_trash(self):
+        if not self._trash.moved:
+            return
+        if get_env("CONAN_BACKGROUND_REMOVE", False):
+            if self._trash.empty_in_background(self._cache.cache_folder):
+                return
+        not_removed = self._trash.empty(self._trash.moved)
+        if not_removed:
+            self._user_io.out.warn("Some removed folders couldn't be deleted, they will be "
+                                   "deleted by 'conan remove --trash-gc'")
 
     def _ask_permission(self, ref, src, build_ids, package_ids_filter, force):
         def stringlist(alist):
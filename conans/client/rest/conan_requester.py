@@ -21,13 +21,8 @@ logging.captureWarnings(True)
 class ConanRequester(object):
 
     def __init__(self, config, http_requester=None):
-        if http_requester:
-            self._http_requester = http_requester
-        else:
-            self._http_requester = requests.Session()
-            adapter = HTTPAdapter(max_retries=config.retry)
-            self._http_requester.mount("http://", adapter)
-            self._http_requester.mount("https://", adapter)
+        self._own_session = not http_requester
+        self._http_requester = http_requester or self._new_session(config.retry)
 
         self._timeout_seconds = config.request_timeout
         self.proxies = config.proxies or {}
@@ -63,6 +58,21 @@ class ConanRequester(object):
             else:
                 self._client_certificates = self._client_cert_path
 
+    @staticmethod
+    def _new_session(retry):
+        session = requests.Session()
+        adapter = HTTPAdapter(max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def reset_session(self):
+        """ replaces the session by a new one, without the pooled connections, to be used in a
+        forked process, that cannot share the connections of its parent
+        """
+        if self._own_session:
+            self._http_requester = self._new_session(self._retry)
+
     @property
     def retry(self):
         return self._retry
@@ -0,0 +1,165 @@
+"""
+Machine wide cache of downloaded files, that can be shared by several Conan caches (e.g. one per
+CI executor). Files are stored by their checksum, or by their URL when the URL is immutable, as
+the ones of the recipe and package revisions of a remote.
+"""
+
+import hashlib
+import os
+
+import fasteners
+
+from conans.client.file_copier import copy_strategies
+from conans.paths import conan_expand_user
+from conans.util.env_reader import get_env
+from conans.util.files import DEFAULT_COPY_STRATEGIES, copy_file, mkdir, replace_file, save, \
+    walk, _generic_algorithm_sum
+from conans.util.log import logger
+
+MB = 1024 * 1024
+# The eviction removes files until the cache is below this fraction of its max_size, so it
+# doesn't have to walk the cache again in the next downloads
+_EVICTION_TARGET = 0.8
+_SIZE_KEY = "total-size"
+
+
+def checksum_key(md5=None, sha1=None, sha256=None):
+    """The cache key of a file with the given checksums (the strongest one), None if there is no
+    checksum"""
+    for algorithm, signature in (("sha256", sha256), ("sha1", sha1), ("md5", md5)):
+        if signature:
+            return "%s-%s" % (algorithm, signature.lower())
+    return None
+
+
+def url_key(url):
+    """The cache key of a file whose URL always returns the same content"""
+    return "url-%s" % hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+class DownloadCache(object):
+    """ The files are stored in "data/<xx>/<key>" and every key has its own lock file in
+    "locks/<key>.lock", held while the file is read from the cache or downloaded and stored, so
+    processes downloading the same file wait for the first one instead of downloading it again.
+    When max_size (bytes) is defined, the least recently used files are removed to keep the
+    size of the cache below it. The total size of the cache is counted in the "size" file, so
+    the cache is only walked when it is exceeded.
+    """
+
+    def __init__(self, folder, max_size=None, strategies=DEFAULT_COPY_STRATEGIES):
+        self._folder = folder
+        self._max_size = max_size
+        self._strategies = strategies
+
+    @staticmethod
+    def from_env():
+        """ The download cache configured in general.download_cache (CONAN_DOWNLOAD_CACHE),
+        None if it is not enabled
+        """
+        folder = get_env("CONAN_DOWNLOAD_CACHE")
+        if not folder:
+            return None
+        max_size = get_env("CONAN_DOWNLOAD_CACHE_MAX_SIZE", 0) * MB
+        return DownloadCache(os.path.abspath(conan_expand_user(folder)), max_size or None,
+                             copy_strategies())
+
+    @property
+    def _data_folder(self):
+        return os.path.join(self._folder, "data")
+
+    def _path(self, key):
+        signature = key.split("-", 1)[1]
+        return os.path.join(self._data_folder, signature[:2], key)
+
+    def _lock(self, key):
+        lock_folder = os.path.join(self._folder, "locks")
+        mkdir(lock_folder)
+        return fasteners.InterProcessLock(os.path.join(lock_folder, key + ".lock"), logger=logger)
+
+    def download(self, key, file_path, download_func):
+        """ Copies the file of the key to file_path. If it is not cached yet,
+        download_func(file_path) is called first and its result is stored in the cache
+        """
+        cached_path = self._path(key)
+        with self._lock(key):
+            if os.path.isfile(cached_path):
+                logger.debug("DOWNLOAD CACHE: Hit %s" % key)
+                mkdir(os.path.dirname(file_path))
+                copy_file(cached_path, file_path, strategies=self._strategies)
+                os.utime(cached_path, None)  # The mtime is the last use of the file
+                return
+            download_func(file_path)
+            stored = self._store(key, cached_path, file_path)
+        if self._max_size and stored:
+            if self._update_size(lambda size: size + stored) > self._max_size:
+                self._evict()
+
+    def _store(self, key, cached_path, file_path):
+        """ stores the downloaded file in the cache, returns its size, 0 if not stored
+        """
+        algorithm, signature = key.split("-", 1)
+        if algorithm != "url" and _generic_algorithm_sum(file_path, algorithm) != signature:
+            # The caller checks the file and raises, it is never stored with a wrong checksum
+            logger.debug("DOWNLOAD CACHE: Wrong %s checksum, not stored" % algorithm)
+            return 0
+        mkdir(os.path.dirname(cached_path))
+        # A copy interrupted half way never leaves a truncated file in the cache
+        tmp_path = cached_path + ".tmp"
+        copy_file(file_path, tmp_path, strategies=self._strategies)
+        replace_file(tmp_path, cached_path)
+        return os.path.getsize(cached_path)
+
+    def _update_size(self, update_func):
+        """ updates the total size of the cached files, counted in the "size" file, with
+        update_func(current_size), after the cached files have changed. If the file is missing
+        or corrupted the size is counted from the cached files instead. Returns the new size
+        """
+        size_path = os.path.join(self._folder, "size")
+        with self._lock(_SIZE_KEY):
+            try:
+                with open(size_path) as f:
+                    size = update_func(int(f.read()))
+            except (IOError, OSError, ValueError):
+                size = sum(entry[1] for entry in self._entries())
+            save(size_path, str(size))
+        return size
+
+    def _entries(self):
+        """ [(mtime, size, key, path)] of the cached files
+        """
+        entries = []
+        for root, _, files in walk(self._data_folder):
+            for filename in files:
+                if filename.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:  # Removed by another process
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, filename, path))
+        return entries
+
+    def _evict(self):
+        """ removes the least recently used files until the cache is below _EVICTION_TARGET of
+        its max_size, and counts its real size again
+        """
+        entries = self._entries()
+        total_size = sum(entry[1] for entry in entries)
+        target = self._max_size * _EVICTION_TARGET
+        for _, size, key, path in sorted(entries):
+            if total_size <= target:
+                break
+            lock = self._lock(key)
+            if not lock.acquire(blocking=False):  # Being used by another process, keep it
+                continue
+            try:
+                os.remove(path)
+                total_size -= size
+                logger.debug("DOWNLOAD CACHE: Removed %s" % key)
+            except OSError:
+                pass
+            finally:
+                lock.release()
+        removed = sum(entry[1] for entry in entries) - total_size
+        self._update_size(lambda size: max(size - removed, 0))
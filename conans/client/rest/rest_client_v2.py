@@ -3,8 +3,10 @@ import traceback
 
 import time
 
+from conans import DEFAULT_REVISION_V1
 from conans.client.remote_manager import check_compressed_files
 from conans.client.rest.client_routes import ClientV2Router
+from conans.client.rest.download_cache import url_key
 from conans.client.rest.rest_client_common import RestCommonMethods, get_exception_from_error
 from conans.client.rest.uploader_downloader import FileDownloader, FileUploader
 from conans.errors import ConanException, NotFoundException, PackageNotFoundException, \
@@ -86,7 +88,7 @@ class RestV2Methods(RestCommonMethods):
 
         # If we didn't indicated reference, server got the latest, use absolute now, it's safer
         urls = {fn: self.router.recipe_file(ref, fn) for fn in files}
-        self._download_and_save_files(urls, dest_folder, files)
+        self._download_and_save_files(urls, dest_folder, files, _immutable(ref.revision))
         ret = {fn: os.path.join(dest_folder, fn) for fn in files}
         return ret
 
@@ -104,7 +106,7 @@ class RestV2Methods(RestCommonMethods):
 
         # If we didn't indicated reference, server got the latest, use absolute now, it's safer
         urls = {fn: self.router.recipe_file(ref, fn) for fn in files}
-        self._download_and_save_files(urls, dest_folder, files)
+        self._download_and_save_files(urls, dest_folder, files, _immutable(ref.revision))
         ret = {fn: os.path.join(dest_folder, fn) for fn in files}
         return ret
 
@@ -115,7 +117,8 @@ class RestV2Methods(RestCommonMethods):
         check_compressed_files(PACKAGE_TGZ_NAME, files)
         # If we didn't indicated reference, server got the latest, use absolute now, it's safer
         urls = {fn: self.router.package_file(pref, fn) for fn in files}
-        self._download_and_save_files(urls, dest_folder, files)
+        immutable = _immutable(pref.ref.revision) and _immutable(pref.revision)
+        self._download_and_save_files(urls, dest_folder, files, immutable)
         ret = {fn: os.path.join(dest_folder, fn) for fn in files}
         return ret
 
@@ -198,7 +201,10 @@ class RestV2Methods(RestCommonMethods):
         else:
             logger.debug("\nUPLOAD: All uploaded! Total time: %s\n" % str(time.time() - t1))
 
-    def _download_and_save_files(self, urls, dest_folder, files):
+    def _download_and_save_files(self, urls, dest_folder, files, immutable=False):
+        """ immutable: the URLs are the ones of a real revision, so their files never change and
+        are stored in the download cache
+        """
         downloader = FileDownloader(self.requester, self._output, self.verify_ssl)
         # Take advantage of filenames ordering, so that conan_package.tgz and conan_export.tgz
         # can be < conanfile, conaninfo, and sent always the last, so smaller files go first
@@ -207,7 +213,8 @@ class RestV2Methods(RestCommonMethods):
                 self._output.writeln("Downloading %s" % filename)
             resource_url = urls[filename]
             abs_path = os.path.join(dest_folder, filename)
-            downloader.download(resource_url, abs_path, auth=self.auth)
+            cache_key = url_key(resource_url) if immutable else None
+            downloader.download(resource_url, abs_path, auth=self.auth, cache_key=cache_key)
 
     def _remove_conanfile_files(self, ref, files):
         # V2 === revisions, do not remove files, it will create a new revision if the files changed
@@ -307,3 +314,8 @@ class RestV2Methods(RestCommonMethods):
         prev = data["revision"]
         # Ignored data["time"]
         return pref.copy_with_revs(pref.ref.revision, prev)
+
+
+def _immutable(revision):
+    # The revision "0" of the packages uploaded without revisions is overwritten by every upload
+    return bool(revision) and revision != DEFAULT_REVISION_V1
@@ -4,21 +4,28 @@ import time
 
 from conans.util import progress_bar
 from conans.client.rest import response_to_str
+from conans.client.rest.download_cache import DownloadCache
 from conans.errors import AuthenticationException, ConanConnectionError, ConanException, \
     NotFoundException, ForbiddenException, RequestErrorException
+from conans.util.env_reader import get_env
 from conans.util.files import mkdir, save_append, sha1sum, to_file_bytes
 from conans.util.log import logger
-from conans.util.tracer import log_download
+from conans.util.perf import perf_traced
+from conans.util.tracer import ChecksumsCalculator, log_download, trace_file_checksums, tracing
+
+# Bytes read from the file and handed to the HTTP layer at once (and so, progress updates)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class FileUploader(object):
 
-    def __init__(self, requester, output, verify, chunk_size=1000):
-        self.chunk_size = chunk_size
+    def __init__(self, requester, output, verify, chunk_size=None):
+        self.chunk_size = chunk_size or get_env("CONAN_UPLOAD_CHUNK_SIZE", UPLOAD_CHUNK_SIZE)
         self.output = output
         self.requester = requester
         self.verify = verify
 
+    @perf_traced("upload file", "upload")
     def upload(self, url, abs_path, auth=None, dedup=False, retry=None, retry_wait=None,
                headers=None):
         retry = retry if retry is not None else self.requester.retry
@@ -28,7 +35,10 @@ class FileUploader(object):
 
         # Send always the header with the Sha1
         headers = headers or {}
-        headers["X-Checksum-Sha1"] = sha1sum(abs_path)
+        if tracing():
+            _, headers["X-Checksum-Sha1"] = trace_file_checksums(abs_path)
+        else:
+            headers["X-Checksum-Sha1"] = sha1sum(abs_path)
         if dedup:
             dedup_headers = {"X-Checksum-Deploy": "true"}
             if headers:
@@ -59,8 +69,8 @@ class FileUploader(object):
         description = "Uploading {}".format(file_name)
 
         def load_in_chunks(file, size):
-            """Lazy function (generator) to read a file piece by piece.
-            Default chunk size: 1k."""
+            """Lazy function (generator) to read a file piece by piece. The chunks are
+            sent as they are by the HTTP layer, so big chunks mean less Python calls per byte"""
             while True:
                 chunk = file.read(size)
                 if not chunk:
@@ -69,7 +79,7 @@ class FileUploader(object):
 
         with open(abs_path, mode='rb') as file_handler:
             progress = progress_bar.Progress(file_size, self.output, description, print_dot=True)
-            chunk_size = 1024
+            chunk_size = self.chunk_size
             data = progress.update(load_in_chunks(file_handler, chunk_size), chunk_size)
             iterable_to_file = IterableToFileAdapter(data, file_size)
             try:
@@ -120,8 +130,12 @@ class FileDownloader(object):
         self.requester = requester
         self.verify = verify
 
+    @perf_traced("download file", "download")
     def download(self, url, file_path=None, auth=None, retry=None, retry_wait=None, overwrite=False,
-                 headers=None):
+                 headers=None, cache_key=None):
+        """ cache_key identifies the content of the url (conans.client.rest.download_cache),
+        to get it from the download cache, if enabled, instead of the network
+        """
         retry = retry if retry is not None else self.requester.retry
         retry = retry if retry is not None else 2
         retry_wait = retry_wait if retry_wait is not None else self.requester.retry_wait
@@ -139,8 +153,14 @@ class FileDownloader(object):
                 # the dest folder before
                 raise ConanException("Error, the file to download already exists: '%s'" % file_path)
 
-        return call_with_retry(self.output, retry, retry_wait, self._download_file, url, auth,
-                               headers, file_path)
+        def download_file(path):
+            return call_with_retry(self.output, retry, retry_wait, self._download_file, url, auth,
+                                   headers, path)
+
+        download_cache = DownloadCache.from_env() if file_path and cache_key else None
+        if download_cache:
+            return download_cache.download(cache_key, file_path, download_file)
+        return download_file(file_path)
 
     def _download_file(self, url, auth, headers, file_path):
         t1 = time.time()
@@ -170,10 +190,13 @@ class FileDownloader(object):
             downloaded_size = 0
             if path:
                 mkdir(os.path.dirname(path))
+                checksums = ChecksumsCalculator(path)
                 with open(path, 'wb') as file_handler:
                     for chunk in chunks:
                         file_handler.write(to_file_bytes(chunk))
+                        checksums.update(chunk)
                         downloaded_size += len(chunk)
+                checksums.save()
             else:
                 ret_data = bytearray()
                 for chunk in chunks:
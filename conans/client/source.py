@@ -5,6 +5,7 @@ import six
 
 from conans.client import tools
 from conans.client.cmd.export import export_recipe, export_source
+from conans.client.file_copier import copy_strategies
 from conans.errors import ConanException, ConanExceptionInUserConanfileMethod, \
     conanfile_exception_formatter
 from conans.model.conan_file import get_env_context_manager
@@ -91,9 +92,10 @@ def config_source(export_folder, export_source_folder, scm_sources_folder,
                 # First of all get the exported scm sources (if auto) or clone (if fixed)
                 _run_cache_scm(conanfile, scm_sources_folder, src_folder, output)
                 # so self exported files have precedence over python_requires ones
-                merge_directories(export_folder, src_folder)
+                strategies = copy_strategies()
+                merge_directories(export_folder, src_folder, strategies=strategies)
                 # Now move the export-sources to the right location
-                merge_directories(export_source_folder, src_folder)
+                merge_directories(export_source_folder, src_folder, strategies=strategies)
 
             _run_source(conanfile, conanfile_path, src_folder, hook_manager, reference,
                         cache, get_sources_from_exports=get_sources_from_exports)
@@ -167,7 +169,7 @@ def _run_cache_scm(conanfile, scm_sources_folder, src_folder, output):
         dest_dir = src_folder
     if os.path.exists(scm_sources_folder):
         output.info("Copying previously cached scm sources")
-        merge_directories(scm_sources_folder, dest_dir)
+        merge_directories(scm_sources_folder, dest_dir, strategies=copy_strategies())
     else:
         output.info("SCM: Getting sources from url: '%s'" % scm_data.url)
         scm = SCM(scm_data, dest_dir, output)
@@ -202,7 +204,8 @@ def _run_local_scm(conanfile, conanfile_folder, src_folder, output):
         if src_path and src_path != dest_dir:
             excluded = SCM(scm_data, src_path, output).excluded_files
             output.info("SCM: Getting sources from folder: %s" % src_path)
-            merge_directories(src_path, dest_dir, excluded=excluded)
+            merge_directories(src_path, dest_dir, excluded=excluded,
+                              strategies=copy_strategies())
             return
 
     output.info("SCM: Getting sources from url: '%s'" % scm_data.url)
@@ -1,5 +1,6 @@
 import os
 
+from conans.client.rest.download_cache import checksum_key
 from conans.client.rest.uploader_downloader import FileDownloader
 from conans.client.tools.files import check_md5, check_sha1, check_sha256, unzip
 from conans.errors import ConanException
@@ -16,15 +17,8 @@ def get(url, md5='', sha1='', sha256='', destination=".", filename="", keep_perm
 
     filename = filename or os.path.basename(url)
     download(url, filename, out=output, requester=requester, verify=verify, retry=retry,
-             retry_wait=retry_wait, overwrite=overwrite, auth=auth, headers=headers)
-
-    if md5:
-        check_md5(filename, md5)
-    if sha1:
-        check_sha1(filename, sha1)
-    if sha256:
-        check_sha256(filename, sha256)
-
+             retry_wait=retry_wait, overwrite=overwrite, auth=auth, headers=headers,
+             md5=md5, sha1=sha1, sha256=sha256)
     unzip(filename, destination=destination, keep_permissions=keep_permissions, pattern=pattern,
           output=output)
     os.unlink(filename)
@@ -54,7 +48,10 @@ def ftp_download(ip, filename, login='', password=''):
 
 
 def download(url, filename, verify=True, out=None, retry=None, retry_wait=None, overwrite=False,
-             auth=None, headers=None, requester=None):
+             auth=None, headers=None, requester=None, md5='', sha1='', sha256=''):
+    """ downloads the url to filename, checking its md5, sha1 and sha256 if given. Files with a
+    checksum are stored in the download cache, when enabled
+    """
 
     out = default_output(out, 'conans.client.tools.net.download')
     requester = default_requester(requester, 'conans.client.tools.net.download')
@@ -67,5 +64,12 @@ def download(url, filename, verify=True, out=None, retry=None, retry_wait=None,
 
     downloader = FileDownloader(requester=requester, output=out, verify=verify)
     downloader.download(url, filename, retry=retry, retry_wait=retry_wait, overwrite=overwrite,
-                        auth=auth, headers=headers)
+                        auth=auth, headers=headers, cache_key=checksum_key(md5, sha1, sha256))
     out.writeln("")
+
+    if md5:
+        check_md5(filename, md5)
+    if sha1:
+        check_sha1(filename, sha1)
+    if sha256:
+        check_sha256(filename, sha256)
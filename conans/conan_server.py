@@ -1,5 +1,7 @@
 import argparse
+import sys
 
+from conans.errors import ConanException
 from conans.server.launcher import ServerLauncher
 
 
@@ -7,9 +9,20 @@ def run():
     parser = argparse.ArgumentParser(description='Launch the server')
     parser.add_argument('--migrate', default=False, action='store_true',
                         help='Run the pending migrations')
+    parser.add_argument('--collect-garbage', default=False, action='store_true',
+                        help='Remove the stored files that the removed recipes and packages no '
+                             'longer use (content_addressed storage_adapter) and exit')
     args = parser.parse_args()
     launcher = ServerLauncher(force_migration=args.migrate)
-    launcher.launch()
+    if args.collect_garbage:
+        try:
+            removed = launcher.server_store.collect_garbage()
+        except ConanException as exc:
+            print("ERROR: %s" % exc)
+            sys.exit(1)
+        print("Removed %d stored files no longer used" % removed)
+    else:
+        launcher.launch()
 
 
 if __name__ == '__main__':
@@ -146,32 +146,97 @@ class CppInfo(_CppInfo):
         return self.configs.setdefault(config, _get_cpp_info())
 
 
+def merge_lists(seqs, append=True):
+    """ The result of merging the given lists one by one, in order, with:
+        append: merged = [s for s in merged if s not in seq] + seq
+        prepend: merged = [s for s in seq if s not in merged] + merged
+    but in linear time: every item ends in the block of the last (append) or the first
+    (prepend) list that contains it
+    """
+    if len(seqs) == 1:
+        return list(seqs[0])
+    try:
+        blocks = []
+        seen = set()
+        for seq in (reversed(seqs) if append else seqs):
+            blocks.append([s for s in seq if s not in seen])
+            seen.update(seq)
+    except TypeError:  # Unhashable items, merging them one by one
+        merged = []
+        for seq in seqs:
+            if append:
+                merged = [s for s in merged if s not in seq] + list(seq)
+            else:
+                merged = [s for s in seq if s not in merged] + merged
+        return merged
+    result = []
+    for block in reversed(blocks):
+        result.extend(block)
+    return result
+
+
+def _merged_field(name, append):
+    """ A list of _BaseDepsCppInfo that merges the lists of its updates when it is read.
+    Concurrent reads (e.g. parallel generators) could merge the same lists twice, with the
+    same result
+    """
+    def getter(self):
+        pending = self._pending[name]
+        if pending:
+            self._merged[name] = merge_lists([self._merged[name]] + pending, append)
+            self._pending[name] = []
+        return self._merged[name]
+
+    def setter(self, value):
+        self._merged[name] = value
+        self._pending[name] = []
+
+    return property(getter, setter)
+
+
 class _BaseDepsCppInfo(_CppInfo):
     def __init__(self):
+        # The lists of every field are merged only once, when the field is read, and not in
+        # every update(). Dependencies updated later go after the previous ones, except for
+        # defines and flags, that go before
+        self._merged = {}
+        self._pending = {}
         super(_BaseDepsCppInfo, self).__init__()
 
-    def update(self, dep_cpp_info):
+    includedirs = _merged_field("includedirs", append=True)
+    srcdirs = _merged_field("srcdirs", append=True)
+    libdirs = _merged_field("libdirs", append=True)
+    bindirs = _merged_field("bindirs", append=True)
+    resdirs = _merged_field("resdirs", append=True)
+    builddirs = _merged_field("builddirs", append=True)
+    frameworkdirs = _merged_field("frameworkdirs", append=True)
+    libs = _merged_field("libs", append=True)
+    frameworks = _merged_field("frameworks", append=True)
+    defines = _merged_field("defines", append=False)
+    cxxflags = _merged_field("cxxflags", append=False)
+    cflags = _merged_field("cflags", append=False)
+    sharedlinkflags = _merged_field("sharedlinkflags", append=False)
+    exelinkflags = _merged_field("exelinkflags", append=False)
 
-        def merge_lists(seq1, seq2):
-            return [s for s in seq1 if s not in seq2] + seq2
-
-        self.includedirs = merge_lists(self.includedirs, dep_cpp_info.include_paths)
-        self.srcdirs = merge_lists(self.srcdirs, dep_cpp_info.src_paths)
-        self.libdirs = merge_lists(self.libdirs, dep_cpp_info.lib_paths)
-        self.bindirs = merge_lists(self.bindirs, dep_cpp_info.bin_paths)
-        self.resdirs = merge_lists(self.resdirs, dep_cpp_info.res_paths)
-        self.builddirs = merge_lists(self.builddirs, dep_cpp_info.build_paths)
-        self.frameworkdirs = merge_lists(self.frameworkdirs, dep_cpp_info.framework_paths)
-        self.libs = merge_lists(self.libs, dep_cpp_info.libs)
-        self.frameworks = merge_lists(self.frameworks, dep_cpp_info.frameworks)
+    def update(self, dep_cpp_info):
+        pending = self._pending
+        pending["includedirs"].append(dep_cpp_info.include_paths)
+        pending["srcdirs"].append(dep_cpp_info.src_paths)
+        pending["libdirs"].append(dep_cpp_info.lib_paths)
+        pending["bindirs"].append(dep_cpp_info.bin_paths)
+        pending["resdirs"].append(dep_cpp_info.res_paths)
+        pending["builddirs"].append(dep_cpp_info.build_paths)
+        pending["frameworkdirs"].append(dep_cpp_info.framework_paths)
+        pending["libs"].append(dep_cpp_info.libs)
+        pending["frameworks"].append(dep_cpp_info.frameworks)
         self.rootpaths.append(dep_cpp_info.rootpath)
 
         # Note these are in reverse order
-        self.defines = merge_lists(dep_cpp_info.defines, self.defines)
-        self.cxxflags = merge_lists(dep_cpp_info.cxxflags, self.cxxflags)
-        self.cflags = merge_lists(dep_cpp_info.cflags, self.cflags)
-        self.sharedlinkflags = merge_lists(dep_cpp_info.sharedlinkflags, self.sharedlinkflags)
-        self.exelinkflags = merge_lists(dep_cpp_info.exelinkflags, self.exelinkflags)
+        pending["defines"].append(dep_cpp_info.defines)
+        pending["cxxflags"].append(dep_cpp_info.cxxflags)
+        pending["cflags"].append(dep_cpp_info.cflags)
+        pending["sharedlinkflags"].append(dep_cpp_info.sharedlinkflags)
+        pending["exelinkflags"].append(dep_cpp_info.exelinkflags)
 
         if not self.sysroot:
             self.sysroot = dep_cpp_info.sysroot
@@ -3,6 +3,7 @@ import re
 from collections import OrderedDict, defaultdict
 
 from conans.errors import ConanException
+from conans.model.build_info import merge_lists
 from conans.util.log import logger
 
 
@@ -240,22 +241,25 @@ class DepsEnvInfo(EnvInfo):
         return self._dependencies_[item]
 
     def update(self, dep_env_info, pkg_name):
-        self._dependencies_[pkg_name] = dep_env_info
+        self.update_all([(dep_env_info, pkg_name)])
 
-        def merge_lists(seq1, seq2):
-            return [s for s in seq1 if s not in seq2] + seq2
-
-        # With vars if its set the keep the set value
-        for varname, value in dep_env_info.vars.items():
-            if varname not in self.vars:
-                self.vars[varname] = value
-            elif isinstance(self.vars[varname], list):
-                if isinstance(value, list):
-                    self.vars[varname] = merge_lists(self.vars[varname], value)
+    def update_all(self, dep_env_infos):
+        """ update() with every (env_info, pkg_name), merging the list variables only once
+        """
+        pending = {}  # The lists of every variable, to be merged in linear time
+        for dep_env_info, pkg_name in dep_env_infos:
+            self._dependencies_[pkg_name] = dep_env_info
+            # With vars if its set the keep the set value
+            for varname, value in dep_env_info.vars.items():
+                if varname not in self.vars:
+                    self.vars[varname] = value
+                elif isinstance(self.vars[varname], list):
+                    lists = pending.setdefault(varname, [self.vars[varname]])
+                    lists.append(value if isinstance(value, list) else [value])
                 else:
-                    self.vars[varname] = merge_lists(self.vars[varname], [value])
-            else:
-                logger.warning("DISCARDED variable %s=%s from %s" % (varname, value, pkg_name))
+                    logger.warning("DISCARDED variable %s=%s from %s" % (varname, value, pkg_name))
+        for varname, lists in pending.items():
+            self.vars[varname] = merge_lists(lists)
 
     def update_deps_env_info(self, dep_env_info):
         assert isinstance(dep_env_info, DepsEnvInfo)
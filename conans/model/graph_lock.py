@@ -59,17 +59,21 @@ class GraphLockFile(object):
         save(path, serialized_graph_str)
 
     def dumps(self):
-        result = {"profile_host": self.profile_host.dumps(),
-                  "graph_lock": self.graph_lock.as_dict(),
-                  "version": LOCKFILE_VERSION}
-        return json.dumps(result, indent=True)
+        # One node per line, encoded by the json C encoder. json.dumps(indent=...) uses the
+        # pure python one, too slow for lockfiles of thousands of nodes
+        nodes = self.graph_lock.as_dict()["nodes"]
+        nodes = ",\n".join("   %s: %s" % (json.dumps(str(id_)), json.dumps(node))
+                            for id_, node in nodes.items())
+        return ('{\n "profile_host": %s,\n "graph_lock": {\n  "nodes": {\n%s\n  }\n },\n'
+                ' "version": %s\n}' % (json.dumps(self.profile_host.dumps()), nodes,
+                                        json.dumps(LOCKFILE_VERSION)))
 
 
 class GraphLockNode(object):
     def __init__(self, pref, python_requires, options, modified, requires, path):
         self.pref = pref
         self.python_requires = python_requires
-        self.options = options
+        self._options = options  # OptionsValues, or its serialization until it is used
         self.modified = modified
         self.requires = requires
         self.path = path
@@ -84,19 +88,26 @@ class GraphLockNode(object):
         if python_requires:
             python_requires = [ConanFileReference.loads(ref, validate=False)
                                for ref in python_requires]
-        options = OptionsValues.loads(data["options"])
+        options = data["options"]  # Most nodes of large lockfiles never use them, parsed lazily
         modified = data.get("modified")
         requires = data.get("requires", {})
         path = data.get("path")
         return GraphLockNode(pref, python_requires, options, modified, requires, path)
 
+    @property
+    def options(self):
+        if not isinstance(self._options, OptionsValues):
+            self._options = OptionsValues.loads(self._options)
+        return self._options
+
     def as_dict(self):
         """ returns the object serialized as a dict of plain python types
         that can be converted to json
         """
         result = {}
         result["pref"] = repr(self.pref) if self.pref else None
-        result["options"] = self.options.dumps()
+        options = self._options
+        result["options"] = options.dumps() if isinstance(options, OptionsValues) else options
         if self.python_requires:
             result["python_requires"] = [repr(r) for r in self.python_requires]
         if self.modified:
@@ -112,6 +123,7 @@ class GraphLock(object):
 
     def __init__(self, graph=None):
         self._nodes = {}  # {numeric id: PREF or None}
+        self._indexes = None  # Computed by _index(), reset when the nodes change
         self.revisions_enabled = None
 
         if graph:
@@ -142,10 +154,8 @@ class GraphLock(object):
         i.e. the root or downstream consumer
         Used by graph build-order command
         """
-        total = []
-        for node in self._nodes.values():
-            total.extend(node.requires.values())
-        roots = set(self._nodes).difference(total)
+        inverse = self._index()[2]
+        roots = [id_ for id_ in self._nodes if not inverse.get(id_)]
         assert len(roots) == 1
         root_node = self._nodes[roots.pop()]
         if root_node.path:
@@ -175,6 +185,21 @@ class GraphLock(object):
         result["nodes"] = nodes
         return result
 
+    def _index(self):
+        """ returns the {repr(ref): [ids]}, {name: [ids]} and {id: [ids that require it]}
+        indexes of the nodes, built once until the nodes change
+        """
+        if self._indexes is None:
+            refs, names, inverse = {}, {}, {}
+            for id_, node in self._nodes.items():
+                if node.pref:
+                    refs.setdefault(repr(node.pref.ref), []).append(id_)
+                    names.setdefault(node.pref.ref.name, []).append(id_)
+                for require_id in node.requires.values():
+                    inverse.setdefault(require_id, []).append(id_)
+            self._indexes = refs, names, inverse
+        return self._indexes
+
     def update_lock(self, new_lock):
         """ update the lockfile with the contents of other one that was branched from this
         one and had some node re-built. Only nodes marked as modified == BINARY_BUILD (has
@@ -189,34 +214,41 @@ class GraphLock(object):
                         raise ConanException("Lockfile had already modified %s" % str(node.pref))
                 node.modified = True
                 self._nodes[id_] = node
+        self._indexes = None
 
     def _closure_affected(self):
         """ returns all the IDs of the nodes that depend directly or indirectly of some
         package marked as "modified"
         """
+        inverse = self._index()[2]
         closure = set()
-        current = [id_ for id_, node in self._nodes.items() if node.modified]
-        # closure.update(current)
+        current = set(id_ for id_, node in self._nodes.items() if node.modified)
         while current:
             new_current = set()
             for n in current:
-                new_neighs = self._inverse_neighbors(n)
-                to_add = set(new_neighs).difference(current)
-                new_current.update(to_add)
-                closure.update(to_add)
+                new_current.update(inverse.get(n, ()))
+            # Every node is expanded once
+            new_current.difference_update(current)
+            new_current.difference_update(closure)
+            closure.update(new_current)
             current = new_current
 
         return closure
 
-    def _inverse_neighbors(self, node_id):
-        """ return all the nodes that have an edge to the "node_id". Useful for computing
-        the set of nodes affected downstream by a change in one package
+    def dependencies(self, node_id):
+        """ returns the IDs of all the nodes that the given one depends on, directly or
+        indirectly
         """
-        result = []
-        for id_, node in self._nodes.items():
-            if node_id in node.requires.values():
-                result.append(id_)
-        return result
+        closure = set()
+        current = {node_id}
+        while current:
+            new_current = set()
+            for n in current:
+                new_current.update(self._nodes[n].requires.values())
+            new_current.difference_update(closure)
+            closure.update(new_current)
+            current = new_current
+        return closure
 
     def update_check_graph(self, deps_graph, output):
         """ update the lockfile, checking for security that only nodes that are being built
@@ -242,6 +274,7 @@ class GraphLock(object):
                 if pref.id == PACKAGE_ID_UNKNOWN or pref.is_compatible_with(node_pref) or \
                         node.binary == BINARY_BUILD or node.id in affected:
                     lock_node.pref = node.pref
+                    self._indexes = None
                 else:
                     raise ConanException("Mismatch between lock and graph:\nLock:  %s\nGraph: %s"
                                          % (repr(pref), repr(node.pref)))
@@ -302,22 +335,16 @@ class GraphLock(object):
                 if not node.pref and node.path:
                     return id_
 
+        refs, names, _ = self._index()
         # First search by ref (without RREV)
-        ids = []
-        search_ref = repr(ref)
-        for id_, node in self._nodes.items():
-            if node.pref and repr(node.pref.ref) == search_ref:
-                ids.append(id_)
+        ids = refs.get(repr(ref))
         if ids:
             if len(ids) == 1:
                 return ids[0]
             raise ConanException("There are %s binaries for ref %s" % (len(ids), ref))
 
         # Search by approximate name
-        ids = []
-        for id_, node in self._nodes.items():
-            if node.pref and node.pref.ref.name == ref.name:
-                ids.append(id_)
+        ids = names.get(ref.name)
         if ids:
             if len(ids) == 1:
                 return ids[0]
@@ -334,3 +361,4 @@ class GraphLock(object):
         if lock_node.pref.ref != ref:
             lock_node.pref = PackageReference(ref, lock_node.pref.id)
             lock_node.modified = True
+            self._indexes = None
@@ -34,6 +34,18 @@ class RequirementInfo(object):
         except AttributeError:
             raise ConanException("'%s' is not a known package_id_mode" % default_package_id_mode)
 
+    def __setattr__(self, name, value):
+        # The package_id() method of the recipe can change the values after the sha is computed
+        self.__dict__.pop("_sha", None)
+        self.__dict__[name] = value
+
+    def clone(self):
+        """ a copy of this requirement with the same values, including the sha already computed
+        """
+        result = RequirementInfo.__new__(RequirementInfo)
+        result.__dict__.update(self.__dict__)
+        return result
+
     def copy(self):
         # Useful for build_id()
         result = RequirementInfo(self.package, "unrelated_mode")
@@ -61,6 +73,13 @@ class RequirementInfo(object):
 
     @property
     def sha(self):
+        try:
+            return self.__dict__["_sha"]
+        except KeyError:
+            sha = self.__dict__["_sha"] = self._compute_sha()
+            return sha
+
+    def _compute_sha(self):
         if self.package_id == PACKAGE_ID_UNKNOWN or self.package_revision == PREV_UNKNOWN:
             return None
         vals = [str(n) for n in (self.name, self.version, self.user, self.channel, self.package_id)]
@@ -156,11 +175,36 @@ class RequirementInfo(object):
         self.package_revision = self.full_package_revision or PREV_UNKNOWN
 
 
+def _requirement_info(pref, default_package_id_mode, indirect, shared):
+    """ the RequirementInfo of the pref, a clone of the one in the shared
+    {(pref, indirect): RequirementInfo} if provided, so its sha is computed only once for all
+    the consumers of the pref in the graph
+    """
+    if shared is None:
+        return RequirementInfo(pref, default_package_id_mode, indirect=indirect)
+    key = pref, indirect
+    req_info = shared.get(key)
+    if req_info is None:
+        req_info = RequirementInfo(pref, default_package_id_mode, indirect=indirect)
+        req_info.sha  # Computed before being cloned
+        shared[key] = req_info
+    return req_info.clone()
+
+
+def _pref_sort_key(pref):
+    """ the same order than sorting the PackageReferences, but without calling
+    ConanFileReference.__lt__() for every comparison
+    """
+    ref = pref.ref
+    return (ref.name, ref.version, ref.user or "", ref.channel or "", ref.revision or "",
+            pref.id, pref.revision or "")
+
+
 class RequirementsInfo(object):
 
-    def __init__(self, prefs, default_package_id_mode):
+    def __init__(self, prefs, default_package_id_mode, shared=None):
         # {PackageReference: RequirementInfo}
-        self._data = {pref: RequirementInfo(pref, default_package_id_mode=default_package_id_mode)
+        self._data = {pref: _requirement_info(pref, default_package_id_mode, False, shared)
                       for pref in prefs}
 
     def copy(self):
@@ -176,13 +220,12 @@ class RequirementsInfo(object):
         for name in args:
             del self._data[self._get_key(name)]
 
-    def add(self, prefs_indirect, default_package_id_mode):
+    def add(self, prefs_indirect, default_package_id_mode, shared=None):
         """ necessary to propagate from upstream the real
         package requirements
         """
         for r in prefs_indirect:
-            self._data[r] = RequirementInfo(r, indirect=True,
-                                            default_package_id_mode=default_package_id_mode)
+            self._data[r] = _requirement_info(r, default_package_id_mode, True, shared)
 
     def refs(self):
         """ used for updating downstream requirements with this
@@ -211,7 +254,7 @@ class RequirementsInfo(object):
         result = []
         # Remove requirements without a name, i.e. indirect transitive requirements
         data = {k: v for k, v in self._data.items() if v.name}
-        for key in sorted(data):
+        for key in sorted(data, key=_pref_sort_key):
             s = data[key].sha
             if s is None:
                 return None
@@ -220,7 +263,7 @@ class RequirementsInfo(object):
 
     def dumps(self):
         result = []
-        for ref in sorted(self._data):
+        for ref in sorted(self._data, key=_pref_sort_key):
             dumped = self._data[ref].dumps()
             if dumped:
                 result.append(dumped)
@@ -299,7 +342,11 @@ class ConanInfo(object):
         return result
 
     @staticmethod
-    def create(settings, options, prefs_direct, prefs_indirect, default_package_id_mode):
+    def create(settings, options, prefs_direct, prefs_indirect, default_package_id_mode,
+               shared_requirements=None):
+        """ shared_requirements: {(pref, indirect): RequirementInfo} to reuse the requirements,
+        and their shas, created for other packages of the same graph
+        """
         result = ConanInfo()
         result.full_settings = settings
         result.settings = settings.copy()
@@ -307,8 +354,9 @@ class ConanInfo(object):
         result.options = options.copy()
         result.options.clear_indirect()
         result.full_requires = _PackageReferenceList(prefs_direct)
-        result.requires = RequirementsInfo(prefs_direct, default_package_id_mode)
-        result.requires.add(prefs_indirect, default_package_id_mode)
+        result.requires = RequirementsInfo(prefs_direct, default_package_id_mode,
+                                           shared_requirements)
+        result.requires.add(prefs_indirect, default_package_id_mode, shared_requirements)
         result.full_requires.extend(prefs_indirect)
         result.recipe_hash = None
         result.env_values = EnvValues()
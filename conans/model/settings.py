@@ -31,10 +31,14 @@ class SettingsItem(object):
     - "ANY", as string to accept any value
     - List ["None", "ANY"] to accept None or any value
     - A dict {subsetting: definition}, e.g. {version: [], runtime: []} for VS
+    The definition is shared by the copies of the item, until one of them modifies it
     """
+    __slots__ = ("_name", "_value", "_definition", "_shared")
+
     def __init__(self, definition, name):
         self._name = name  # settings.compiler
         self._value = None  # gcc
+        self._shared = False  # The definition is also used by other copies
         if isinstance(definition, dict):
             self._definition = {}
             # recursive
@@ -51,16 +55,25 @@ class SettingsItem(object):
         return value in (self._value or "")
 
     def copy(self):
-        """ deepcopy, recursive
+        """ copy-on-write copy, the definition is copied when any of them modifies it
         """
         result = SettingsItem({}, name=self._name)
         result._value = self._value
-        if self.is_final:
-            result._definition = self._definition[:]
-        else:
-            result._definition = {k: v.copy() for k, v in self._definition.items()}
+        result._definition = self._definition
+        result._shared = self._shared = True
         return result
 
+    def _own(self):
+        """ copies the shared definition before modifying it, or before returning a subsetting
+        that could be modified. The subsettings are copy-on-write copies too
+        """
+        if self._shared:
+            if isinstance(self._definition, dict):
+                self._definition = {k: v.copy() for k, v in self._definition.items()}
+            elif isinstance(self._definition, list):
+                self._definition = self._definition[:]
+            self._shared = False
+
     def copy_values(self):
         if self._value is None and "None" not in self._definition:
             return None
@@ -68,7 +81,8 @@ class SettingsItem(object):
         result = SettingsItem({}, name=self._name)
         result._value = self._value
         if self.is_final:
-            result._definition = self._definition[:]
+            result._definition = self._definition
+            result._shared = self._shared = True
         else:
             result._definition = {k: v.copy_values() for k, v in self._definition.items()}
         return result
@@ -114,6 +128,7 @@ class SettingsItem(object):
     def remove(self, values):
         if not isinstance(values, (list, tuple, set)):
             values = [values]
+        self._own()
         for v in values:
             v = str(v)
             if isinstance(self._definition, dict):
@@ -132,6 +147,7 @@ class SettingsItem(object):
             raise undefined_field(self._name, item, None, self._value)
         if self._value is None:
             raise undefined_value(self._name)
+        self._own()
         return self._definition[self._value]
 
     def __getattr__(self, item):
@@ -149,6 +165,7 @@ class SettingsItem(object):
 
     def __getitem__(self, value):
         value = str(value)
+        self._own()
         try:
             return self._definition[value]
         except Exception:
@@ -193,12 +210,19 @@ class SettingsItem(object):
 
 
 class Settings(object):
+    """ The settings of a conanfile, or the subsettings of a setting value. Its copies share
+    their items until they are modified (copy-on-write), so copying the whole settings.yml
+    tree for every conanfile is cheap
+    """
+    __slots__ = ("_name", "_parent_value", "_data", "_shared")
+
     def __init__(self, definition=None, name="settings", parent_value=None):
         if parent_value == "None" and definition:
             raise ConanException("settings.yml: None setting can't have subsettings")
         definition = definition or {}
         self._name = name  # settings, settings.compiler
         self._parent_value = parent_value  # gcc, x86
+        self._shared = False  # The items are also used by other copies
         self._data = {str(k): SettingsItem(v, "%s.%s" % (name, k))
                       for k, v in definition.items()}
 
@@ -214,13 +238,21 @@ class Settings(object):
         return None
 
     def copy(self):
-        """ deepcopy, recursive
+        """ copy-on-write copy, the items are copied when any of them modifies them
         """
         result = Settings({}, name=self._name, parent_value=self._parent_value)
-        for k, v in self._data.items():
-            result._data[k] = v.copy()
+        result._data = self._data
+        result._shared = self._shared = True
         return result
 
+    def _own(self):
+        """ copies the shared items before modifying them or returning one that could be
+        modified
+        """
+        if self._shared:
+            self._data = {k: v.copy() for k, v in self._data.items()}
+            self._shared = False
+
     def copy_values(self):
         """ deepcopy, recursive
         """
@@ -247,12 +279,14 @@ class Settings(object):
     def remove(self, item):
         if not isinstance(item, (list, tuple, set)):
             item = [item]
+        self._own()
         for it in item:
             it = str(it)
             self._data.pop(it, None)
 
     def clear(self):
         self._data = {}
+        self._shared = False
 
     def _check_field(self, field):
         if field not in self._data:
@@ -261,11 +295,13 @@ class Settings(object):
     def __getattr__(self, field):
         assert field[0] != "_", "ERROR %s" % field
         self._check_field(field)
+        self._own()
         return self._data[field]
 
     def __delattr__(self, field):
         assert field[0] != "_", "ERROR %s" % field
         self._check_field(field)
+        self._own()
         del self._data[field]
 
     def __setattr__(self, field, value):
@@ -273,6 +309,7 @@ class Settings(object):
             return super(Settings, self).__setattr__(field, value)
 
         self._check_field(field)
+        self._own()
         self._data[field].value = value
 
     @property
@@ -321,6 +358,7 @@ class Settings(object):
         else:
             constraint_def = {str(k): v for k, v in constraint_def.items()}
 
+        self._own()
         fields_to_remove = []
         for field, config_item in self._data.items():
             if field not in constraint_def:
@@ -189,5 +189,4 @@ class Version(str):
     def __ne__(self, other):
         return not self.__eq__(other)
 
-    def __hash__(self):
-        return str.__hash__(self)
+    __hash__ = str.__hash__  # Not a method, it is called for every hashed reference
@@ -37,6 +37,8 @@ BUILD_INFO_XCODE = 'conanbuildinfo.xcconfig'
 BUILD_INFO_PREMAKE = 'conanbuildinfo.premake.lua'
 BUILD_INFO_MAKE = 'conanbuildinfo.mak'
 BUILD_INFO_DEPLOY = 'deploy_manifest.txt'
+GENERATORS_DIGEST = 'conangenerators.json'
+RESOLVED_GRAPH = 'conangraph.json'
 CONANINFO = "conaninfo.txt"
 CONANENV = "conanenv.txt"
 SYSTEM_REQS = "system_reqs.txt"
@@ -46,6 +48,7 @@ EXPORT_TGZ_NAME = "conan_export.tgz"
 EXPORT_SOURCES_TGZ_NAME = "conan_sources.tgz"
 EXPORT_SOURCES_DIR_OLD = ".c_src"
 RUN_LOG_NAME = "conan_run.log"
+BUILD_LOG_NAME = "conan_build.log"
 DEFAULT_PROFILE_NAME = "default"
 PACKAGE_METADATA = "metadata.json"
 CACERT_FILE = "cacert.pem"  # Server authorities file
@@ -2,11 +2,13 @@
 
 import os
 import platform
+import tempfile
 from contextlib import contextmanager
 
 
 import fasteners
 
+from conans import DEFAULT_REVISION_V1
 from conans.errors import NotFoundException, ConanException
 from conans.errors import RecipeNotFoundException, PackageNotFoundException
 from conans.model.manifest import FileTreeManifest
@@ -15,8 +17,10 @@ from conans.model.package_metadata import PackageMetadata
 from conans.model.ref import ConanFileReference
 from conans.model.ref import PackageReference
 from conans.paths import CONANFILE, SYSTEM_REQS, EXPORT_FOLDER, EXPORT_SRC_FOLDER, SRC_FOLDER, \
-    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER
-from conans.util.files import load, save, rmdir
+    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER, \
+    rm_conandir
+from conans.util.files import DEFAULT_COPY_STRATEGIES, copy_tree, link_tree, load, \
+    make_read_only, make_writable, mkdir, save, rmdir
 from conans.util.locks import Lock, NoLock, ReadLock, SimpleLock, WriteLock
 from conans.util.log import logger
 
@@ -37,12 +41,13 @@ def short_path(func):
 class PackageCacheLayout(object):
     """ This is the package layout for Conan cache """
 
-    def __init__(self, base_folder, ref, short_paths, no_lock):
+    def __init__(self, base_folder, ref, short_paths, no_lock, shared_store=None):
         assert isinstance(ref, ConanFileReference)
         self._ref = ref
         self._base_folder = os.path.normpath(base_folder)
         self._short_paths = short_paths
         self._no_lock = no_lock
+        self._shared_store = shared_store
 
     @property
     def ref(self):
@@ -109,6 +114,58 @@ class PackageCacheLayout(object):
         assert pref.ref == self._ref, "{!r} != {!r}".format(pref.ref, self._ref)
         return os.path.join(self._base_folder, PACKAGES_FOLDER, pref.id)
 
+    def shared_package(self, pref):
+        """ The folder of the package revision in the shared package store, None if there
+        is no store or the revisions don't identify the contents (revisions disabled)
+        """
+        revisions = (self._ref.revision, pref.revision)
+        if not self._shared_store or None in revisions or DEFAULT_REVISION_V1 in revisions:
+            return None
+        return os.path.join(self._shared_store, self._ref.dir_repr(), self._ref.revision,
+                            PACKAGES_FOLDER, pref.id, pref.revision)
+
+    def install_shared_package(self, pref, read_only=False, strategies=DEFAULT_COPY_STRATEGIES):
+        """ Replaces the package folder with the package revision of the shared store. A
+        read-only cache uses a symlink to it (or hardlinks its files), otherwise its files are
+        copied with the copy strategies and are writable. False if it is not in the store
+        """
+        shared_folder = self.shared_package(pref)
+        if not shared_folder or not os.path.isdir(shared_folder):
+            return False
+        package_folder = self.package(pref)
+        rm_conandir(package_folder)
+        if not read_only:
+            copy_tree(shared_folder, package_folder, strategies=strategies)
+            make_writable(package_folder)
+            return True
+        mkdir(os.path.dirname(package_folder))
+        try:
+            os.symlink(shared_folder, package_folder)
+        except (AttributeError, OSError) as e:  # Windows without symlink privileges
+            logger.debug("Cannot symlink the shared package: %s" % str(e))
+            link_tree(shared_folder, package_folder)
+        return True
+
+    def publish_shared_package(self, pref, strategies=DEFAULT_COPY_STRATEGIES):
+        """ Adds a copy of the package folder to the shared store if it isn't there yet. Only the
+        copy is made read-only, the files of the package folder are not shared with the store
+        """
+        shared_folder = self.shared_package(pref)
+        if not shared_folder or os.path.exists(shared_folder):
+            return
+        mkdir(os.path.dirname(shared_folder))
+        # Renamed once complete, other caches never see a package half way published
+        tmp_folder = tempfile.mkdtemp(prefix=".tmp", dir=os.path.dirname(shared_folder))
+        tmp_package = os.path.join(tmp_folder, "package")
+        try:
+            copy_tree(self.package(pref), tmp_package, strategies=strategies)
+            make_read_only(tmp_package)
+            os.rename(tmp_package, shared_folder)
+        except (IOError, OSError) as e:  # e.g. published meanwhile by another cache
+            logger.debug("Cannot publish the shared package %s: %s" % (str(pref), str(e)))
+        finally:
+            rmdir(tmp_folder)
+
     def package_metadata(self):
         return os.path.join(self._base_folder, PACKAGE_METADATA)
 
@@ -14,7 +14,8 @@ from conans.client import tools
 from conans.errors import ConanException
 from conans.paths import conan_expand_user
 from conans.server.conf.default_server_conf import default_server_conf
-from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.server.store.content_addressed_adapter import ServerContentAddressedAdapter
+from conans.server.store.disk_adapter import DEFAULT_BUFFER_SIZE, ServerDiskAdapter
 from conans.server.store.server_store import ServerStore
 from conans.util.env_reader import get_env
 from conans.util.files import mkdir, save
@@ -40,6 +41,11 @@ class ConanServerConfigParser(ConfigParser):
         self.env_config = {"updown_secret": get_env("CONAN_UPDOWN_SECRET", None, environment),
                            "authorize_timeout": get_env("CONAN_AUTHORIZE_TIMEOUT", None, environment),
                            "disk_storage_path": get_env("CONAN_STORAGE_PATH", None, environment),
+                           "storage_adapter": get_env("CONAN_STORAGE_ADAPTER", None, environment),
+                           "blobs_storage_path": get_env("CONAN_BLOBS_STORAGE_PATH", None,
+                                                         environment),
+                           "upload_buffer_size": get_env("CONAN_UPLOAD_BUFFER_SIZE", None,
+                                                         environment),
                            "jwt_secret": get_env("CONAN_JWT_SECRET", None, environment),
                            "jwt_expire_minutes": get_env("CONAN_JWT_EXPIRE_MINUTES", None, environment),
                            "write_permissions": [],
@@ -143,6 +149,42 @@ class ConanServerConfigParser(ConfigParser):
         mkdir(ret)
         return ret
 
+    @property
+    def storage_adapter(self):
+        """'disk' (default) or 'content_addressed', that stores identical files only once"""
+        try:
+            adapter = self._get_conf_server_string("storage_adapter")
+        except ConanException:
+            return "disk"
+        if adapter not in ("disk", "content_addressed"):
+            raise ConanException("Invalid 'storage_adapter' value '%s', use 'disk' or "
+                                 "'content_addressed'" % adapter)
+        return adapter
+
+    @property
+    def blobs_storage_path(self):
+        """Folder of the blobs of the 'content_addressed' storage adapter, it can be shared
+        by several servers. If not defined, a folder inside the disk_storage_path"""
+        try:
+            blobs_path = self._get_conf_server_string("blobs_storage_path")
+        except ConanException:
+            return None
+        if blobs_path.startswith("."):
+            blobs_path = os.path.join(os.path.dirname(self.config_filename), blobs_path)
+            blobs_path = os.path.abspath(blobs_path)
+        return os.path.normpath(conan_expand_user(blobs_path))
+
+    @property
+    def upload_buffer_size(self):
+        """Bytes read from the uploads and written to the storage at once"""
+        try:
+            return int(self._get_conf_server_string("upload_buffer_size"))
+        except ConanException:
+            return DEFAULT_BUFFER_SIZE
+        except ValueError:
+            raise ConanException("Invalid 'upload_buffer_size' value, it has to be a number of "
+                                 "bytes")
+
     @property
     def read_permissions(self):
         if self.env_config["read_permissions"]:
@@ -220,9 +262,18 @@ class ConanServerConfigParser(ConfigParser):
         return timedelta(minutes=float(self._get_conf_server_string("jwt_expire_minutes")))
 
 
-def get_server_store(disk_storage_path, public_url, updown_auth_manager):
+def get_server_store(disk_storage_path, public_url, updown_auth_manager,
+                     storage_adapter="disk", blobs_storage_path=None,
+                     buffer_size=DEFAULT_BUFFER_SIZE):
     disk_controller_url = "%s/%s" % (public_url, "files")
     if not updown_auth_manager:
         raise Exception("Updown auth manager needed for disk controller (not s3)")
-    adapter = ServerDiskAdapter(disk_controller_url, disk_storage_path, updown_auth_manager)
+    if storage_adapter == "content_addressed":
+        adapter = ServerContentAddressedAdapter(disk_controller_url, disk_storage_path,
+                                                updown_auth_manager,
+                                                blobs_path=blobs_storage_path,
+                                                buffer_size=buffer_size)
+    else:
+        adapter = ServerDiskAdapter(disk_controller_url, disk_storage_path, updown_auth_manager,
+                                    buffer_size=buffer_size)
     return ServerStore(adapter)
@@ -20,6 +20,18 @@ disk_storage_path: ./data
 disk_authorize_timeout: 1800
 updown_secret: {updown_secret}
 
+# Storage of the recipe and package files: "disk" (default) or "content_addressed", that
+# stores identical files (e.g. the same binary uploaded to several channels) only once in a
+# blobs folder, that can be shared by several servers. By default inside disk_storage_path
+# The files no longer used after removing recipes or packages are deleted running
+# "conan_server --collect-garbage", e.g. periodically, only if the blobs folder is inside
+# disk_storage_path (not shared by other servers)
+# storage_adapter: content_addressed
+# blobs_storage_path: ./data/.blobs
+
+# Bytes read from the uploads and written to the storage at once (default 1MB)
+# upload_buffer_size: 1048576
+
 
 # Check docs.conan.io to implement a different authenticator plugin for conan_server
 # if custom_authenticator is not specified, [users] section will be used to authenticate
@@ -4,8 +4,8 @@ from conans.server.crypto.jwt.jwt_manager import JWTManager
 class JWTCredentialsManager(JWTManager):
     """JWT for manage auth credentials"""
 
-    def __init__(self, secret, expire_time):
-        super(JWTCredentialsManager, self).__init__(secret, expire_time)
+    def __init__(self, secret, expire_time, cache_size=1024):
+        super(JWTCredentialsManager, self).__init__(secret, expire_time, cache_size)
 
     def get_token_for(self, brl_user):
         """Generates a token with the brl_user and additional data dict if needed"""
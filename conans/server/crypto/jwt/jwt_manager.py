@@ -1,3 +1,7 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 
 import jwt
@@ -8,11 +12,13 @@ class JWTManager(object):
         Handles the JWT token generation and encryption.
     """
 
-    def __init__(self, secret, expire_time):
+    def __init__(self, secret, expire_time, cache_size=1024):
         """expire_time is a timedelta
-           secret is a string with the secret encoding key"""
+           secret is a string with the secret encoding key
+           cache_size is the max number of verified tokens kept in memory, 0 to disable it"""
         self.secret = secret
         self.expire_time = expire_time
+        self._cache = _VerifiedTokensCache(cache_size)
 
     def get_token_for(self, profile_fields=None):
         """Generates a token with the provided fields.
@@ -27,5 +33,54 @@ class JWTManager(object):
     def get_profile(self, token):
         """Gets the user from credentials object. None if no credentials.
         Can raise jwt.ExpiredSignature and jwt.DecodeError"""
-        profile = jwt.decode(token, self.secret)
-        return profile
+        profile = self._cache.get(token)
+        if profile is None:
+            profile = jwt.decode(token, self.secret)
+            self._cache.put(token, profile)
+        return dict(profile)
+
+
+class _VerifiedTokensCache(object):
+    """Bounded LRU of the profiles of already verified tokens, so a token used for many
+    requests (e.g. every file of an upload) is decoded and its signature checked only once.
+    Entries are keyed by the token hash and never returned after their 'exp' time, then the
+    token goes through the full verification again (that will raise ExpiredSignature)"""
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token):
+        if not isinstance(token, bytes):
+            token = token.encode("utf-8")
+        return hashlib.sha256(token).digest()
+
+    def get(self, token):
+        if not self._max_size:
+            return None
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            profile, expiration = entry
+            if expiration is not None and expiration <= time.time():
+                del self._entries[key]
+                return None
+            # Python 2 OrderedDict has no move_to_end()
+            del self._entries[key]
+            self._entries[key] = entry
+            return profile
+
+    def put(self, token, profile):
+        if not self._max_size:
+            return
+        expiration = profile.get("exp")
+        key = self._key(token)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (profile, expiration)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
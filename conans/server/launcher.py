@@ -37,11 +37,15 @@ class ServerLauncher(object):
 
         server_store = get_server_store(server_config.disk_storage_path,
                                         server_config.public_url,
-                                        updown_auth_manager=updown_auth_manager)
+                                        updown_auth_manager=updown_auth_manager,
+                                        storage_adapter=server_config.storage_adapter,
+                                        blobs_storage_path=server_config.blobs_storage_path,
+                                        buffer_size=server_config.upload_buffer_size)
 
         server_capabilities = SERVER_CAPABILITIES
         server_capabilities.append(REVISIONS)
 
+        self.server_store = server_store
         self.server = ConanServer(server_config.port, credentials_manager, updown_auth_manager,
                                   authorizer, authenticator, server_store,
                                   server_capabilities)
@@ -0,0 +1,35 @@
+from conans.errors import RequestErrorException
+
+
+class RequestBodyStream(object):
+    """File-like object reading the body of a request directly from the WSGI input, without
+    the buffering of bottle's request.body (in memory up to MEMFILE_MAX, then in a temporary
+    file), so big uploads are written only once, to their final location. A body shorter
+    than its Content-Length (e.g. the client disconnected) raises RequestErrorException, so
+    the truncated contents are never stored"""
+
+    def __init__(self, wsgi_input, content_length):
+        self._input = wsgi_input
+        self._remaining = content_length
+
+    def read(self, size=-1):
+        if self._remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._input.read(size)
+        if not data:
+            raise RequestErrorException("Incomplete request body, %d bytes missing"
+                                        % self._remaining)
+        self._remaining -= len(data)
+        return data
+
+
+def get_body_stream(request):
+    """The body of the request as a readable file-like object. Streamed unless it has been
+    already read, or it has no Content-Length (chunked transfer encoding), then the bottle
+    buffered body is used"""
+    if "bottle.request.body" in request.environ or request.chunked or \
+            request.content_length < 0:
+        return request.body
+    return RequestBodyStream(request.environ["wsgi.input"], request.content_length)
@@ -1,9 +1,9 @@
 import os
-from unicodedata import normalize
 
-import six
-from bottle import FileUpload, cached_property, request, static_file
+from bottle import request, static_file
 
+from conans.paths import CONANINFO
+from conans.server.rest.body_stream import get_body_stream
 from conans.server.rest.bottle_routes import BottleRoutes
 from conans.server.service.mime import get_mime_type
 from conans.server.service.v1.upload_download_service import FileUploadDownloadService
@@ -23,41 +23,37 @@ class FileUploadDownloadController(object):
         def get(the_path):
             token = request.query.get("signature", None)
             file_path = service.get_file_path(the_path, token)
+            local_path = app.server_store.get_local_file_path(file_path)
             # https://github.com/kennethreitz/requests/issues/1586
-            return static_file(os.path.basename(file_path),
-                               root=os.path.dirname(file_path),
+            return static_file(os.path.basename(local_path),
+                               root=os.path.dirname(local_path),
                                mimetype=get_mime_type(file_path))
 
         @app.route(r.v1_updown_file, method=["PUT"])
         def put(the_path):
             token = request.query.get("signature", None)
-            file_saver = ConanFileUpload(request.body, None,
-                                         filename=os.path.basename(the_path),
-                                         headers=request.headers)
+            file_saver = StoreFileSaver(app.server_store, get_body_stream(request),
+                                        filename=os.path.basename(the_path),
+                                        size=request.content_length,
+                                        sha1=request.headers.get("X-Checksum-Sha1"))
             abs_path = os.path.abspath(os.path.join(storage_path, os.path.normpath(the_path)))
             # Body is a stringIO (generator)
             service.put_file(file_saver, abs_path, token, request.content_length)
+            if os.path.basename(abs_path) == CONANINFO:
+                app.server_store.update_package_search_info_from_path(abs_path)
 
 
-class ConanFileUpload(FileUpload):
-    """Code copied from bottle but removing filename normalizing
-    FIXME: Review bottle.FileUpload and analyze possible security or general issues    """
-    @cached_property
-    def filename(self):
-        ''' Name of the file on the client file system, but normalized to ensure
-            file system compatibility. An empty filename is returned as 'empty'.
-
-            Only ASCII letters, digits, dashes, underscores and dots are
-            allowed in the final filename. Accents are removed, if possible.
-            Whitespace is replaced by a single dash. Leading or tailing dots
-            or dashes are removed. The filename is limited to 255 characters.
-        '''
-        fname = self.raw_filename
-        if six.PY2:
-            if not isinstance(fname, unicode):
-                fname = fname.decode('utf8', 'ignore')
-        fname = normalize('NFKD', fname).encode('ASCII', 'ignore').decode('ASCII')
-        fname = os.path.basename(fname.replace('\\', os.path.sep))
-#         fname = re.sub(r'[^a-zA-Z0-9-_.\s]', '', fname).strip()
-#         fname = re.sub(r'[-\s]+', '-', fname).strip('.-')
-        return fname[:255] or 'empty'
+class StoreFileSaver(object):
+    """Saves the uploaded body through the server store, so it goes to the configured
+    storage adapter. The file name is not normalized, it comes from the signed path"""
+
+    def __init__(self, server_store, body, filename, size=None, sha1=None):
+        self._server_store = server_store
+        self._body = body
+        self.filename = filename
+        self._size = size if size is not None and size >= 0 else None
+        self._sha1 = sha1
+
+    def save(self, folder):
+        self._server_store.put_file(os.path.join(folder, self.filename), self._body,
+                                    self._size, self._sha1)
@@ -1,7 +1,7 @@
-from bottle import request
+from bottle import request, response
 
-from conans.errors import NotFoundException
 from conans.model.ref import ConanFileReference
+from conans.server.rest.body_stream import get_body_stream
 from conans.server.rest.bottle_routes import BottleRoutes
 from conans.server.rest.controller.v2 import get_package_ref
 from conans.server.service.v2.service_v2 import ConanServiceV2
@@ -34,13 +34,12 @@ class ConanControllerV2(object):
         @app.route(r.package_revision_file, method=["PUT"])
         def upload_package_file(name, version, username, channel, package_id,
                                 the_path, auth_user, revision, p_revision):
-
-            if "X-Checksum-Deploy" in request.headers:
-                raise NotFoundException("Non checksum storage")
             pref = get_package_ref(name, version, username, channel, package_id,
                                    revision, p_revision)
-            conan_service.upload_package_file(request.body, request.headers, pref,
+            conan_service.upload_package_file(get_body_stream(request), request.headers, pref,
                                               the_path, auth_user)
+            if "X-Checksum-Deploy" in request.headers:
+                response.status = 201  # The file was already in the server, not uploaded
 
         @app.route(r.recipe_revision_files, method=["GET"])
         def get_recipe_file_list(name, version, username, channel, auth_user, revision):
@@ -56,8 +55,9 @@ class ConanControllerV2(object):
 
         @app.route(r.recipe_revision_file, method=["PUT"])
         def upload_recipe_file(name, version, username, channel, the_path, auth_user, revision):
-            if "X-Checksum-Deploy" in request.headers:
-                raise NotFoundException("Not a checksum storage")
             ref = ConanFileReference(name, version, username, channel, revision)
-            conan_service.upload_recipe_file(request.body, request.headers, ref, the_path, auth_user)
+            conan_service.upload_recipe_file(get_body_stream(request), request.headers, ref,
+                                            the_path, auth_user)
+            if "X-Checksum-Deploy" in request.headers:
+                response.status = 201  # The file was already in the server, not uploaded
 
@@ -10,6 +10,7 @@ Replace this module with other that keeps the interface or super class.
 '''
 
 from abc import ABCMeta, abstractmethod
+from collections import defaultdict
 
 import six
 
@@ -96,6 +97,81 @@ class BasicAuthenticator(Authenticator):
         return username in self.users and self.users[username] == plain_password
 
 
+class _PermissionRule(object):
+    """A rule from the config file (server.cfg), parsed once. The reference fields are None
+    when they are a wildcard. An invalid rule is kept (with valid=False) so it is reported
+    only when it is reached, in the same position of the evaluation order"""
+    __slots__ = ("index", "name", "version", "user", "channel", "users", "valid")
+
+    def __init__(self, index, rule):
+        self.index = index
+        self.valid = True
+        self.name = self.version = self.user = self.channel = None
+        self.users = None
+        try:
+            rule_ref = ConanFileReference.loads(rule[0])
+            authorized_users = [_.strip() for _ in rule[1].split(",")]
+        except Exception:
+            # TODO: Log error
+            self.valid = False
+            return
+        name, version, user, channel, _ = rule_ref
+        self.name = None if name == "*" else name
+        self.version = None if version == "*" else version
+        self.user = None if user == "*" else user
+        self.channel = None if channel == "*" else channel
+        self.users = authorized_users
+
+    def applies(self, ref):
+        """Checks if the rule applies to current conans reference"""
+        return not((self.name is not None and self.name != ref.name) or
+                   (self.version is not None and self.version != ref.version) or
+                   (self.user is not None and self.user != ref.user) or
+                   (self.channel is not None and self.channel != ref.channel))
+
+    def check(self, username):
+        """The rule applies to the reference, check the username against it"""
+        if not self.valid or len(self.users) < 1:
+            raise InternalErrorException("Invalid server configuration. "
+                                         "Contact the administrator.")
+        if self.users[0] == "*" or username in self.users:
+            return  # Ok, applies and match username
+        if username:
+            if self.users[0] == "?":
+                return  # Ok, applies and match any authenticated username
+            raise ForbiddenException("Permission denied")
+        raise AuthenticationException()
+
+
+class PermissionMatcher(object):
+    """Precompiled list of permission rules. The rules are indexed by the package name, so
+    only the rules for that name and the ones with a wildcard name are evaluated, keeping
+    the order in which they were declared: the first rule that applies decides."""
+
+    def __init__(self, rules):
+        self._by_name = defaultdict(list)
+        self._any_name = []
+        for index, rule in enumerate(rules):
+            compiled = _PermissionRule(index, rule)
+            if compiled.valid and compiled.name is not None:
+                self._by_name[compiled.name].append(compiled)
+            else:
+                self._any_name.append(compiled)
+        # Every name gets its candidate rules merged with the wildcard ones, in order
+        for name, name_rules in self._by_name.items():
+            self._by_name[name] = sorted(name_rules + self._any_name, key=lambda r: r.index)
+
+    def check(self, username, ref):
+        for rule in self._by_name.get(ref.name, self._any_name):
+            if rule.applies(ref):
+                rule.check(username)  # raises if don't
+                return
+        if username:
+            raise ForbiddenException("Permission denied")
+        else:
+            raise AuthenticationException()
+
+
 class BasicAuthorizer(Authorizer):
     """
     Reads permissions from the config file (server.cfg)
@@ -110,6 +186,24 @@ class BasicAuthorizer(Authorizer):
         self.read_permissions = read_permissions
         self.write_permissions = write_permissions
 
+    @property
+    def read_permissions(self):
+        return self._read_permissions
+
+    @read_permissions.setter
+    def read_permissions(self, value):
+        self._read_permissions = value
+        self._read_matcher = PermissionMatcher(value)
+
+    @property
+    def write_permissions(self):
+        return self._write_permissions
+
+    @write_permissions.setter
+    def write_permissions(self, value):
+        self._write_permissions = value
+        self._write_matcher = PermissionMatcher(value)
+
     def check_read_conan(self, username, ref):
         """
         username: User that request to read the conans
@@ -118,7 +212,7 @@ class BasicAuthorizer(Authorizer):
         if ref.user == username:
             return
 
-        self._check_any_rule_ok(username, self.read_permissions, ref)
+        self._read_matcher.check(username, ref)
 
     def check_write_conan(self, username, ref):
         """
@@ -128,7 +222,7 @@ class BasicAuthorizer(Authorizer):
         if ref.user == username:
             return True
 
-        self._check_any_rule_ok(username, self.write_permissions, ref)
+        self._write_matcher.check(username, ref)
 
     def check_delete_conan(self, username, ref):
         """
@@ -157,52 +251,3 @@ class BasicAuthorizer(Authorizer):
         pref: PackageReference
         """
         self.check_write_package(username, pref)
-
-    def _check_any_rule_ok(self, username, rules, *args, **kwargs):
-        for rule in rules:
-            # raises if don't
-            ret = self._check_rule_ok(username, rule, *args, **kwargs)
-            if ret:  # A rule is applied ok, if not apply keep looking
-                return True
-        if username:
-            raise ForbiddenException("Permission denied")
-        else:
-            raise AuthenticationException()
-
-    def _check_rule_ok(self, username, rule, ref):
-        """Checks if a rule specified in config file applies to current conans
-        reference and current user"""
-        try:
-            rule_ref = ConanFileReference.loads(rule[0])
-        except Exception:
-            # TODO: Log error
-            raise InternalErrorException("Invalid server configuration. "
-                                         "Contact the administrator.")
-        authorized_users = [_.strip() for _ in rule[1].split(",")]
-        if len(authorized_users) < 1:
-            raise InternalErrorException("Invalid server configuration. "
-                                         "Contact the administrator.")
-
-        # Check if rule apply ref
-        if self._check_ref_apply_for_rule(rule_ref, ref):
-            if authorized_users[0] == "*" or username in authorized_users:
-                return True  # Ok, applies and match username
-            else:
-                if username:
-                    if authorized_users[0] == "?":
-                        return True  # Ok, applies and match any authenticated username
-                    else:
-                        raise ForbiddenException("Permission denied")
-                else:
-                    raise AuthenticationException()
-
-        return False
-
-    def _check_ref_apply_for_rule(self, rule_ref, ref):
-        """Checks if a conans reference specified in config file applies to current conans
-        reference"""
-        name, version, user, channel, _ = rule_ref
-        return not((name != "*" and name != ref.name) or
-                   (version != "*" and version != ref.version) or
-                   (user != "*" and user != ref.user) or
-                   (channel != "*" and channel != ref.channel))
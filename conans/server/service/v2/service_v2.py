@@ -1,12 +1,13 @@
 import os
 
-from bottle import FileUpload, static_file
+from bottle import static_file
 
-from conans.errors import RecipeNotFoundException, PackageNotFoundException
+from conans.errors import AuthenticationException, ForbiddenException, NotFoundException, \
+    PackageNotFoundException, RecipeNotFoundException
+from conans.paths import CONANINFO
 from conans.server.service.common.common import CommonService
 from conans.server.service.mime import get_mime_type
 from conans.server.store.server_store import ServerStore
-from conans.util.files import mkdir
 
 
 class ConanServiceV2(CommonService):
@@ -29,14 +30,13 @@ class ConanServiceV2(CommonService):
     def get_conanfile_file(self, reference, filename, auth_user):
         self._authorizer.check_read_conan(auth_user, reference)
         path = self._server_store.get_conanfile_file_path(reference, filename)
-        return static_file(os.path.basename(path), root=os.path.dirname(path),
-                           mimetype=get_mime_type(path))
+        return self._serve_file(path)
 
     def upload_recipe_file(self, body, headers, reference, filename, auth_user):
         self._authorizer.check_write_conan(auth_user, reference)
         # FIXME: Check that reference contains revision (MANDATORY TO UPLOAD)
         path = self._server_store.get_conanfile_file_path(reference, filename)
-        self._upload_to_path(body, headers, path)
+        self._put_file(path, body, headers, auth_user)
 
         # If the upload was ok, update the pointer to the latest
         self._server_store.update_last_revision(reference)
@@ -83,8 +83,7 @@ class ConanServiceV2(CommonService):
     def get_package_file(self, pref, filename, auth_user):
         self._authorizer.check_read_conan(auth_user, pref.ref)
         path = self._server_store.get_package_file_path(pref, filename)
-        return static_file(os.path.basename(path), root=os.path.dirname(path),
-                           mimetype=get_mime_type(path))
+        return self._serve_file(path)
 
     def upload_package_file(self, body, headers, pref, filename, auth_user):
         self._authorizer.check_write_conan(auth_user, pref.ref)
@@ -92,22 +91,38 @@ class ConanServiceV2(CommonService):
 
         # Check if the recipe exists
         recipe_path = self._server_store.export(pref.ref)
-        if not os.path.exists(recipe_path):
+        if not self._server_store.path_exists(recipe_path):
             raise RecipeNotFoundException(pref.ref)
         path = self._server_store.get_package_file_path(pref, filename)
-        self._upload_to_path(body, headers, path)
+        self._put_file(path, body, headers, auth_user)
 
         # If the upload was ok, update the pointer to the latest
         self._server_store.update_last_package_revision(pref)
+        if filename == CONANINFO:
+            self._server_store.update_package_search_info(pref)
 
     # Misc
-    @staticmethod
-    def _upload_to_path(body, headers, path):
-        file_saver = FileUpload(body, None,
-                                filename=os.path.basename(path),
-                                headers=headers)
-        if os.path.exists(path):
-            os.unlink(path)
-        if not os.path.exists(os.path.dirname(path)):
-            mkdir(os.path.dirname(path))
-        file_saver.save(os.path.dirname(path))
+    def _put_file(self, path, body, headers, auth_user):
+        """With the 'X-Checksum-Deploy' header the client sends no contents, only the
+        'X-Checksum-Sha1', and expects a 404 to upload them if the server doesn't have them.
+        Only the files of references the user can read are reused"""
+        if "X-Checksum-Deploy" in headers:
+            def can_read(ref):
+                try:
+                    self._authorizer.check_read_conan(auth_user, ref)
+                    return True
+                except (ForbiddenException, AuthenticationException):
+                    return False
+
+            if not self._server_store.put_file_by_checksum(path, headers.get("X-Checksum-Sha1"),
+                                                           can_read):
+                raise NotFoundException("No file with the checksum in the server")
+        else:
+            size = headers.get("Content-Length")
+            self._server_store.put_file(path, body, int(size) if size else None,
+                                        headers.get("X-Checksum-Sha1"))
+
+    def _serve_file(self, path):
+        local_path = self._server_store.get_local_file_path(path)
+        return static_file(os.path.basename(local_path), root=os.path.dirname(local_path),
+                           mimetype=get_mime_type(path))
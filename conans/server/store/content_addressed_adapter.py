@@ -0,0 +1,147 @@
+import json
+import os
+import time
+import uuid
+
+from conans.errors import ConanException
+from conans.server.store.disk_adapter import DEFAULT_BUFFER_SIZE, ServerDiskAdapter
+from conans.util.files import mkdir, relative_dirs, replace_file, sha1sum, walk
+
+BLOBS_FOLDER = ".blobs"
+# Blobs (and temporary files) modified more recently are never collected, as they can belong
+# to an upload in progress, whose pointer is not written yet
+GC_GRACE_PERIOD = 3600
+
+
+class ServerContentAddressedAdapter(ServerDiskAdapter):
+    """Storage where the content files are kept in a content-addressed blob store (by sha1),
+    so identical files of different recipes or packages are stored only once. The storage
+    layout keeps a small pointer file (json with the sha1, md5 and size of the blob) for
+    every content file, metadata files are kept as they are.
+
+    The blob store is a local folder, that can be shared by several servers (e.g. a network
+    mount), playing the role of an object storage bucket. The garbage is only collected when
+    the blob store is in the storage folder, as a shared one has blobs used by other servers."""
+
+    def __init__(self, base_url, base_storage_path, updown_auth_manager, blobs_path=None,
+                 buffer_size=DEFAULT_BUFFER_SIZE):
+        super(ServerContentAddressedAdapter, self).__init__(base_url, base_storage_path,
+                                                            updown_auth_manager, buffer_size)
+        self._blobs_folder = blobs_path or os.path.join(base_storage_path, BLOBS_FOLDER)
+
+    def _blob_path(self, sha1):
+        return os.path.join(self._blobs_folder, sha1[:2], sha1)
+
+    def has_blob(self, sha1):
+        """True if there is a blob with that sha1. It is touched, so it is not collected before
+        the pointer of the upload reusing it is written"""
+        try:
+            os.utime(self._blob_path(sha1), None)
+            return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def _read_pointer(path):
+        with open(path) as f:
+            return json.loads(f.read())
+
+    @staticmethod
+    def _write_pointer(path, sha1, md5, size):
+        mkdir(os.path.dirname(path))
+        # Written aside and renamed, so readers never see a half written pointer
+        tmp_path = "%s.%s.tmp" % (path, uuid.uuid4().hex)
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps({"sha1": sha1, "md5": md5, "size": size}))
+        replace_file(tmp_path, path)
+
+    def put_file(self, path, file_obj, size=None, sha1=None):
+        tmp_folder = os.path.join(self._blobs_folder, "tmp")
+        mkdir(tmp_folder)
+        tmp_path = os.path.join(tmp_folder, uuid.uuid4().hex)
+        try:
+            checksums = self._save_stream(file_obj, tmp_path, size, sha1)
+            blob_path = self._blob_path(checksums["sha1"])
+            if not self.has_blob(checksums["sha1"]):
+                mkdir(os.path.dirname(blob_path))
+                replace_file(tmp_path, blob_path)
+        finally:
+            if os.path.exists(tmp_path):  # The blob already existed
+                os.unlink(tmp_path)
+        self._write_pointer(path, checksums["sha1"], checksums["md5"], checksums["size"])
+        self._index_checksum(path, checksums["sha1"])
+        return checksums
+
+    def put_file_by_checksum(self, path, sha1, source_filter=None):
+        """Makes path point to an already stored blob, if the last file stored with it still
+        points to it and the blob contents still have that sha1"""
+        source = self._indexed_source(sha1, source_filter)
+        if source is None:
+            return False
+        sha1 = sha1.lower()
+        try:
+            pointer = self._read_pointer(source)
+        except (IOError, OSError, ValueError):
+            return False
+        if pointer.get("sha1") != sha1 or not self.has_blob(sha1):
+            return False
+        blob_path = self._blob_path(sha1)
+        if sha1sum(blob_path) != sha1:
+            return False
+        self._write_pointer(path, sha1, pointer["md5"], pointer["size"])
+        return True
+
+    def get_local_path(self, path):
+        if not os.path.exists(path):
+            return path
+        return self._blob_path(self._read_pointer(path)["sha1"])
+
+    def get_snapshot(self, absolute_path="", files_subset=None):
+        abs_paths = self._get_paths(absolute_path, files_subset)
+        return {filepath: self._read_pointer(filepath)["md5"] for filepath in abs_paths}
+
+    def _is_pointer(self, path):
+        """Metadata files (revisions, indexes) are stored in the same folders than the
+        pointers of the content files"""
+        try:
+            if os.path.getsize(path) > 1024:
+                return False
+            return set(self._read_pointer(path).keys()) == {"sha1", "md5", "size"}
+        except (IOError, OSError, ValueError, AttributeError):
+            return False
+
+    def collect_garbage(self, grace_period=GC_GRACE_PERIOD):
+        """Removes the blobs that are no longer referenced by any pointer, and the temporary
+        files of aborted uploads, if they are older than grace_period seconds. Returns the
+        number of removed blobs"""
+        store_folder = os.path.join(os.path.realpath(self._store_folder), "")
+        if not os.path.realpath(self._blobs_folder).startswith(store_folder):
+            raise ConanException("The blobs storage '%s' is not in the storage folder '%s', "
+                                 "it can be shared by other servers whose files would be "
+                                 "removed. Cannot collect the garbage"
+                                 % (self._blobs_folder, self._store_folder))
+        limit = time.time() - grace_period
+        referenced = set()
+        for root, _, files in walk(self._store_folder):
+            if root.startswith(self._blobs_folder):
+                continue
+            for f in files:
+                path = os.path.join(root, f)
+                if self._is_pointer(path):
+                    referenced.add(self._read_pointer(path)["sha1"])
+        removed = 0
+        for blob in relative_dirs(self._blobs_folder) if os.path.exists(self._blobs_folder) \
+                else []:
+            blob_path = os.path.join(self._blobs_folder, blob)
+            sha1 = os.path.basename(blob)
+            try:
+                if os.path.getmtime(blob_path) > limit:
+                    continue
+                if os.path.dirname(blob) != sha1[:2]:  # Temporary file of an aborted upload
+                    os.unlink(blob_path)
+                elif sha1 not in referenced:
+                    os.unlink(blob_path)
+                    removed += 1
+            except OSError:  # Removed meanwhile by other server sharing the blobs
+                pass
+        return removed
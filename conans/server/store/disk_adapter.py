@@ -1,24 +1,35 @@
+import hashlib
+import json
 import os
+import shutil
+import uuid
 
 import fasteners
 
 from conans.client.tools.env import no_op
-from conans.errors import NotFoundException
-from conans.server.store.server_store import REVISIONS_FILE
-from conans.util.files import decode_text, md5sum, path_exists, relative_dirs, rmdir
+from conans.errors import NotFoundException, RequestErrorException
+from conans.server.store.storage_adapter import ServerStorageAdapter
+from conans.util.files import (decode_text, list_folder_subdirs, md5sum, mkdir, path_exists,
+                               relative_dirs, replace_file, rmdir, sha1sum)
 
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+CHECKSUMS_FOLDER = ".checksums"
 
-class ServerDiskAdapter(object):
+
+class ServerDiskAdapter(ServerStorageAdapter):
     '''Manage access to disk files with common methods required
     for conan operations'''
-    def __init__(self, base_url, base_storage_path, updown_auth_manager):
+    def __init__(self, base_url, base_storage_path, updown_auth_manager,
+                 buffer_size=DEFAULT_BUFFER_SIZE):
         """
-        :param: base_url Base url for generate urls to download and upload operations"""
+        :param: base_url Base url for generate urls to download and upload operations
+        :param: buffer_size Size of the chunks read from the uploads and written to disk"""
 
         self.base_url = base_url
         # URLs are generated removing this base path
         self.updown_auth_manager = updown_auth_manager
         self._store_folder = base_storage_path
+        self._buffer_size = buffer_size
 
     # ONLY USED BY APIV1
     def get_download_urls(self, paths, user=None):
@@ -75,6 +86,103 @@ class ServerDiskAdapter(object):
         abs_paths = self._get_paths(absolute_path, files_subset)
         return abs_paths
 
+    def list_subdirs(self, absolute_path, level):
+        return list_folder_subdirs(absolute_path, level)
+
+    def put_file(self, path, file_obj, size=None, sha1=None):
+        """The contents are written to a temporary file next to the destination, then moved
+        to the final path, so readers never see a missing or half written file.
+        Returns the {"md5": , "sha1": , "size": } of the contents"""
+        mkdir(os.path.dirname(path))
+        tmp_path = "%s.%s.tmp" % (path, uuid.uuid4().hex)
+        try:
+            checksums = self._save_stream(file_obj, tmp_path, size, sha1)
+            replace_file(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        self._index_checksum(path, checksums["sha1"])
+        return checksums
+
+    def _checksum_index_path(self, sha1):
+        return os.path.join(self._store_folder, CHECKSUMS_FOLDER, sha1[:2], sha1)
+
+    def _index_checksum(self, path, sha1):
+        """Remembers a stored file with the given sha1, so later uploads of the same contents
+        (e.g. the same binary in other channel) can reuse it"""
+        entry = {"path": os.path.relpath(path, self._store_folder).replace("\\", "/")}
+        index_path = self._checksum_index_path(sha1)
+        mkdir(os.path.dirname(index_path))
+        tmp_path = "%s.%s.tmp" % (index_path, uuid.uuid4().hex)
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(entry))
+        replace_file(tmp_path, index_path)
+
+    def _indexed_source(self, sha1, source_filter):
+        """The path of the last stored file with the given sha1, if it still exists and
+        source_filter(path) allows reusing it, None otherwise"""
+        if not sha1:
+            return None
+        try:
+            with open(self._checksum_index_path(sha1)) as f:
+                entry = json.loads(f.read())
+            source = os.path.join(self._store_folder, entry["path"])
+        except (IOError, OSError, ValueError, KeyError):
+            return None
+        if not os.path.isfile(source):
+            return None
+        if source_filter is not None and not source_filter(source):
+            return None
+        return source
+
+    def put_file_by_checksum(self, path, sha1, source_filter=None):
+        """The file is hard-linked (copied if links are not supported) from the last stored
+        file with the same sha1, if its contents still have that sha1"""
+        source = self._indexed_source(sha1, source_filter)
+        if source is None:
+            return False
+
+        mkdir(os.path.dirname(path))
+        tmp_path = "%s.%s.tmp" % (path, uuid.uuid4().hex)
+        try:
+            try:
+                os.link(source, tmp_path)
+            except (OSError, AttributeError):
+                shutil.copyfile(source, tmp_path)
+            # Checked after linking, the source can be replaced meanwhile
+            if sha1sum(tmp_path) != sha1.lower():
+                return False
+            replace_file(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        return True
+
+    def _save_stream(self, file_obj, path, expected_size=None, expected_sha1=None):
+        """Writes the file-like object contents to path, computing the checksums meanwhile,
+        and checks them against the expected ones, if any"""
+        md5, sha1, size = hashlib.md5(), hashlib.sha1(), 0
+        with open(path, "wb", self._buffer_size) as f:
+            while True:
+                chunk = file_obj.read(self._buffer_size)
+                if not chunk:
+                    break
+                md5.update(chunk)
+                sha1.update(chunk)
+                size += len(chunk)
+                f.write(chunk)
+        checksums = {"md5": md5.hexdigest(), "sha1": sha1.hexdigest(), "size": size}
+        if expected_size is not None and size != expected_size:
+            raise RequestErrorException("Incomplete upload, received %d bytes of %d"
+                                        % (size, expected_size))
+        if expected_sha1 and checksums["sha1"] != expected_sha1.lower():
+            raise RequestErrorException("The uploaded contents don't match their sha1 %s"
+                                        % expected_sha1)
+        return checksums
+
+    def get_local_path(self, path):
+        return path
+
     def delete_folder(self, path):
         '''Delete folder from disk. Path already contains base dir'''
         if not path_exists(path, self._store_folder):
@@ -100,5 +208,17 @@ class ServerDiskAdapter(object):
             with open(path, "w") as f:
                 f.write(contents)
 
+    def compare_and_swap(self, path, expected, contents, lock_file):
+        with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
+            current = None
+            if os.path.exists(path):
+                with open(path) as f:
+                    current = f.read()
+            if current != expected:
+                return False
+            with open(path, "w") as f:
+                f.write(contents)
+            return True
+
     def base_storage_folder(self):
         return self._store_folder
@@ -0,0 +1,48 @@
+import json
+
+SEARCH_INDEX_FILE = "search_index.json"
+
+
+class PackageSearchIndex(object):
+    """Search information of the binary packages of a recipe revision, so the server doesn't
+    need to read the revisions and the conaninfo.txt of every package on each search request.
+    Stores, for every package ID, its latest package revision and the minimal conaninfo
+    serialization (ConanInfo.serialize_min()) returned by the search"""
+
+    version = 1
+
+    def __init__(self):
+        self._data = {}
+
+    @staticmethod
+    def loads(contents):
+        ret = PackageSearchIndex()
+        try:
+            data = json.loads(contents)
+        except ValueError:
+            return ret
+        if not isinstance(data, dict) or data.get("version") != PackageSearchIndex.version:
+            return ret  # Unknown format, it will be computed again
+        ret._data = data["packages"]
+        return ret
+
+    def dumps(self):
+        return json.dumps({"version": self.version, "packages": self._data})
+
+    def package_ids(self):
+        return set(self._data.keys())
+
+    def infos(self):
+        return {package_id: entry["info"] for package_id, entry in self._data.items()}
+
+    def set_package(self, package_id, revision, info):
+        self._data[package_id] = {"revision": revision, "info": info}
+
+    def remove_package(self, package_id):
+        self._data.pop(package_id, None)
+
+    def __eq__(self, other):
+        return self._data == other._data
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
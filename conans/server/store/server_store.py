@@ -3,9 +3,13 @@ from os.path import join, normpath, relpath
 
 from conans import DEFAULT_REVISION_V1
 from conans.errors import ConanException, PackageNotFoundException, RecipeNotFoundException
+from conans.model.info import ConanInfo
 from conans.model.ref import ConanFileReference, PackageReference
-from conans.paths import EXPORT_FOLDER, PACKAGES_FOLDER
+from conans.paths import CONANINFO, EXPORT_FOLDER, PACKAGES_FOLDER
 from conans.server.revision_list import RevisionList
+from conans.server.store.search_index import PackageSearchIndex, SEARCH_INDEX_FILE
+from conans.util.files import load
+from conans.util.log import logger
 
 REVISIONS_FILE = "revisions.txt"
 
@@ -14,7 +18,7 @@ class ServerStore(object):
 
     def __init__(self, storage_adapter):
         self._storage_adapter = storage_adapter
-        self._store_folder = storage_adapter._store_folder
+        self._store_folder = storage_adapter.base_storage_folder()
 
     @property
     def store(self):
@@ -61,6 +65,46 @@ class ServerStore(object):
     def path_exists(self, path):
         return self._storage_adapter.path_exists(path)
 
+    def list_subdirs(self, path, level):
+        return self._storage_adapter.list_subdirs(path, level)
+
+    def put_file(self, path, file_obj, size=None, sha1=None):
+        """Stores a recipe or package file reading it from the file-like object, checking
+        its declared size and sha1, if any. Returns the {"md5": , "sha1": , "size": } of
+        the file"""
+        return self._storage_adapter.put_file(path, file_obj, size, sha1)
+
+    def put_file_by_checksum(self, path, sha1, can_read=None):
+        """Stores a recipe or package file reusing an already stored one with the same sha1,
+        of a reference for which can_read(ref) is True. Returns False if there is none, so the
+        contents have to be uploaded"""
+        source_filter = None
+        if can_read is not None:
+            def source_filter(source_path):
+                ref = self.ref_from_path(source_path)
+                return ref is not None and can_read(ref)
+        return self._storage_adapter.put_file_by_checksum(path, sha1, source_filter)
+
+    def ref_from_path(self, path):
+        """The reference (without revision) of a file of the store, None if it doesn't
+        belong to any"""
+        parts = relpath(path, self.store).replace("\\", "/").split("/")
+        if len(parts) < 5 or parts[0] == "..":
+            return None
+        try:
+            return ConanFileReference.load_dir_repr("/".join(parts[:4]))
+        except ConanException:
+            return None
+
+    def collect_garbage(self):
+        """Removes the stored contents that the removed recipes and packages no longer use.
+        Returns the number of removed items"""
+        return self._storage_adapter.collect_garbage()
+
+    def get_local_file_path(self, path):
+        """Local path with the contents of a recipe or package file, to be served"""
+        return self._storage_adapter.get_local_path(path)
+
     # ############ SNAPSHOTS (APIv1)
     def get_recipe_snapshot(self, ref):
         """Returns a {filepath: md5} """
@@ -96,14 +140,16 @@ class ServerStore(object):
 
     def _delete_empty_dirs(self, ref):
         lock_files = set([REVISIONS_FILE, "%s.lock" % REVISIONS_FILE])
+        index_files = set([SEARCH_INDEX_FILE, "%s.lock" % SEARCH_INDEX_FILE])
 
         ref_path = normpath(join(self.store, ref.dir_repr()))
         if ref.revision:
             ref_path = join(ref_path, ref.revision)
         for _ in range(4 if not ref.revision else 5):
             if os.path.exists(ref_path):
-                if set(os.listdir(ref_path)) == lock_files:
-                    for lock_file in lock_files:
+                contents = set(os.listdir(ref_path))
+                if contents == lock_files or (contents and contents <= index_files):
+                    for lock_file in contents:
                         os.unlink(os.path.join(ref_path, lock_file))
                 try:  # Take advantage that os.rmdir does not delete non-empty dirs
                     os.rmdir(ref_path)
@@ -128,12 +174,14 @@ class ServerStore(object):
         if not package_ids_filter:  # Remove all packages
             packages_folder = self.packages(ref)
             self._storage_adapter.delete_folder(packages_folder)
+            self._update_package_search_index(ref, remove_all=True)
         else:
             for package_id in package_ids_filter:
                 pref = PackageReference(ref, package_id)
                 # Remove all package revisions
                 package_folder = self.package_revisions_root(pref)
                 self._storage_adapter.delete_folder(package_folder)
+            self._update_package_search_index(ref, removed_ids=package_ids_filter)
         self._delete_empty_dirs(ref)
 
     def remove_package(self, pref):
@@ -143,12 +191,14 @@ class ServerStore(object):
         package_folder = self.package(pref)
         self._storage_adapter.delete_folder(package_folder)
         self._remove_package_revision_from_index(pref)
+        self.update_package_search_info(pref)
 
     def remove_all_packages(self, ref):
         assert ref.revision is not None, "BUG: server store needs RREV remove_all_packages"
         assert isinstance(ref, ConanFileReference)
         packages_folder = self.packages(ref)
         self._storage_adapter.delete_folder(packages_folder)
+        self._update_package_search_index(ref, remove_all=True)
 
     def remove_conanfile_files(self, ref, files):
         subpath = self.export(ref)
@@ -161,6 +211,8 @@ class ServerStore(object):
         for filepath in files:
             path = join(subpath, filepath)
             self._storage_adapter.delete_file(path)
+        if CONANINFO in files:
+            self.update_package_search_info(pref)
 
     # ONLY APIv1 URLS
     # ############ DOWNLOAD URLS
@@ -356,3 +408,80 @@ class ServerStore(object):
         path = self._package_revisions_file(pref)
         rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
         return RevisionList.loads(rev_file)
+
+    # Package search index, one per recipe revision
+    def get_packages_infos(self, ref):
+        """Returns the {package_id: info} search information of all the packages of the recipe
+        revision, where info is the ConanInfo.serialize_min() of the latest package revision.
+        The packages found in the storage that are not in the index yet (or the other way
+        around) are computed (discarded) and the index saved"""
+        assert ref.revision is not None, "BUG: server store needs RREV to get_packages_infos"
+        package_ids = set(self.list_subdirs(self.packages(ref), level=1))
+        path = self._package_search_index_file(ref)
+        if not package_ids and not self._storage_adapter.path_exists(path):
+            return {}
+
+        def update(contents):
+            index = PackageSearchIndex.loads(contents) if contents else PackageSearchIndex()
+            indexed_ids = index.package_ids()
+            for package_id in indexed_ids - package_ids:
+                index.remove_package(package_id)
+            for package_id in package_ids - indexed_ids:
+                self._set_package_search_info(index, PackageReference(ref, package_id))
+            return index.dumps()
+
+        contents = self._storage_adapter.update_file(path, update, lock_file=path + ".lock")
+        return PackageSearchIndex.loads(contents).infos()
+
+    def update_package_search_info(self, pref):
+        """Called when a conaninfo.txt is uploaded or a package revision removed"""
+        assert pref.ref.revision is not None, "BUG: server store needs RREV to update the index"
+        self._update_package_search_index(pref.ref, updated_ids=[pref.id])
+
+    def update_package_search_info_from_path(self, path):
+        """APIv1 uploads write the files directly, the package is deduced from the file path:
+        name/version/user/channel/rrev/package/package_id/prev/conaninfo.txt"""
+        tokens = relpath(path, self.store).replace("\\", "/").split("/")
+        if len(tokens) != 9 or tokens[5] != PACKAGES_FOLDER or tokens[8] != CONANINFO:
+            return
+        ref = ConanFileReference.load_dir_repr("/".join(tokens[:4])).copy_with_rev(tokens[4])
+        self.update_package_search_info(PackageReference(ref, tokens[6], tokens[7]))
+
+    def _update_package_search_index(self, ref, updated_ids=None, removed_ids=None,
+                                     remove_all=False):
+        path = self._package_search_index_file(ref)
+        if not self._storage_adapter.path_exists(path):
+            return  # Not computed yet, the first search will do it
+
+        def update(contents):
+            index = PackageSearchIndex.loads(contents) if not remove_all else PackageSearchIndex()
+            for package_id in removed_ids or []:
+                index.remove_package(package_id)
+            for package_id in updated_ids or []:
+                self._set_package_search_info(index, PackageReference(ref, package_id))
+            return index.dumps()
+
+        self._storage_adapter.update_file(path, update, lock_file=path + ".lock")
+
+    def _set_package_search_info(self, index, pref):
+        """Reads the conaninfo.txt of the latest revision of the package into the index,
+        removing the package from it if it cannot be read"""
+        index.remove_package(pref.id)
+        try:
+            revision_entry = self.get_last_package_revision(pref)
+            if not revision_entry:
+                raise PackageNotFoundException(pref)
+            pref = PackageReference(pref.ref, pref.id, revision_entry.revision)
+            info_path = join(self.package(pref), CONANINFO)
+            if not self._storage_adapter.path_exists(info_path):
+                raise PackageNotFoundException(pref)
+            conan_info_content = load(self.get_local_file_path(info_path))
+            info = ConanInfo.loads(conan_info_content)
+            index.set_package(pref.id, pref.revision, info.serialize_min())
+        except Exception as exc:  # FIXME: Too wide
+            logger.error("Package %s has no ConanInfo file" % str(pref))
+            if str(exc):
+                logger.error(str(exc))
+
+    def _package_search_index_file(self, ref):
+        return join(self.base_folder(ref), SEARCH_INDEX_FILE)
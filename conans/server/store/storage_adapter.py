@@ -0,0 +1,127 @@
+from abc import ABCMeta, abstractmethod
+
+import six
+
+from conans.errors import ConanException
+
+
+@six.add_metaclass(ABCMeta)
+class ServerStorageAdapter(object):
+    """
+    Storage backend of the ServerStore. Paths are always absolute, starting with the
+    base_storage_folder(), and they keep the same layout whatever the backend is.
+
+    There are two kinds of files:
+        - Content files (recipe and package files), written once with put_file() and read
+          through get_local_path(). Backends are free to store them however they want
+        - Metadata files (revisions.txt, search indexes), small files that are modified
+          concurrently, read and written with read_file(), write_file() and
+          compare_and_swap()
+    """
+
+    # ONLY USED BY APIV1
+    @abstractmethod
+    def get_download_urls(self, paths, user=None):
+        """returns a dict with this structure: {"filepath": "http://..."}
+        paths is a list of path files"""
+        raise NotImplementedError()
+
+    # ONLY USED BY APIV1
+    @abstractmethod
+    def get_upload_urls(self, paths_sizes, user=None):
+        """returns a dict with this structure: {"filepath": "http://..."}
+        paths_sizes is a dict of {path: size_in_bytes}"""
+        raise NotImplementedError()
+
+    # ############ SNAPSHOTS AND LISTING
+    @abstractmethod
+    def get_snapshot(self, absolute_path="", files_subset=None):
+        """returns a dict with the content files under absolute_path and their md5.
+        Raises NotFoundException if the path doesn't exist"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_file_list(self, absolute_path="", files_subset=None):
+        """returns the list of content files under absolute_path.
+        Raises NotFoundException if the path doesn't exist"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def list_subdirs(self, absolute_path, level):
+        """returns the "a/b/c" relative paths of the folders 'level' levels below
+        absolute_path, an empty list if it doesn't exist"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def path_exists(self, path):
+        raise NotImplementedError()
+
+    # ############ CONTENT FILES
+    @abstractmethod
+    def put_file(self, path, file_obj, size=None, sha1=None):
+        """Stores at path the contents read from the file-like object, replacing atomically
+        the previous contents, if any. Returns the {"md5": , "sha1": , "size": } of them.
+        If the expected size or sha1 are given and the contents don't match them, nothing is
+        stored and RequestErrorException is raised"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def put_file_by_checksum(self, path, sha1, source_filter=None):
+        """Stores at path the contents of an already stored file with the given sha1, without
+        transferring them again. source_filter(source_path) tells if the stored file at
+        source_path can be reused. Returns False if the storage has no file with that sha1
+        that can be reused"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_local_path(self, path):
+        """Path of a local file with the contents of path, to be served or read"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete_folder(self, path):
+        """Raises NotFoundException if the path doesn't exist"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete_file(self, path):
+        """Raises NotFoundException if the path doesn't exist"""
+        raise NotImplementedError()
+
+    # ############ METADATA FILES
+    @abstractmethod
+    def read_file(self, path, lock_file):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def write_file(self, path, contents, lock_file):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def compare_and_swap(self, path, expected, contents, lock_file):
+        """Atomically writes contents to the file only if its current contents are
+        'expected' (None meaning that the file doesn't exist). Returns True if written"""
+        raise NotImplementedError()
+
+    def update_file(self, path, update_func, lock_file, max_retries=100):
+        """Read-modify-write of a metadata file. update_func receives the current contents
+        (None if the file doesn't exist) and returns the new ones, or None to leave the file
+        untouched. It is retried if another writer changes the file meanwhile.
+        Returns the final contents"""
+        for _ in range(max_retries):
+            contents = self.read_file(path, lock_file) if self.path_exists(path) else None
+            new_contents = update_func(contents)
+            if new_contents is None or new_contents == contents:
+                return contents
+            if self.compare_and_swap(path, contents, new_contents, lock_file):
+                return new_contents
+        raise ConanException("Too many concurrent modifications of '%s'" % path)
+
+    def collect_garbage(self):
+        """Removes the stored contents no longer used by any content file, for backends that
+        share them. Returns the number of removed items"""
+        return 0
+
+    @abstractmethod
+    def base_storage_folder(self):
+        raise NotImplementedError()
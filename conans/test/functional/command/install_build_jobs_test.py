@@ -0,0 +1,117 @@
+import os
+import platform
+import textwrap
+import unittest
+
+from conans.client.tools import environment_append
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import BUILD_LOG_NAME
+from conans.test.utils.tools import NO_SETTINGS_PACKAGE_ID, TestClient, TestServer
+from conans.util.files import load, save
+
+
+@unittest.skipIf(platform.system() == "Windows", "Parallel builds need fork()")
+class InstallBuildJobsTest(unittest.TestCase):
+
+    def setUp(self):
+        # Each one of the dependencies waits for the other one to start building, so they can
+        # only be built if they are built in parallel
+        dep = textwrap.dedent("""
+            import os, time
+            from conans import ConanFile, tools
+
+            class Pkg(ConanFile):
+                def build(self):
+                    sync = os.environ["SYNC_FOLDER"]
+                    tools.save(os.path.join(sync, self.name), "")
+                    other = "libb" if self.name == "liba" else "liba"
+                    for _ in range(200):
+                        if os.path.exists(os.path.join(sync, other)):
+                            break
+                        time.sleep(0.05)
+                    else:
+                        raise Exception("%s not built in parallel" % other)
+                    if os.getenv("FAIL") == self.name:
+                        raise Exception("Build failed on purpose")
+                    self.output.info("CPUS: %s" % tools.cpu_count())
+
+                def package_info(self):
+                    self.cpp_info.defines = [self.name.upper()]
+            """)
+        consumer = textwrap.dedent("""
+            from conans import ConanFile
+
+            class Pkg(ConanFile):
+                requires = "libb/1.0@user/testing", "liba/1.0@user/testing"
+
+                def build(self):
+                    self.output.info("DEFINES: %s" % self.deps_cpp_info.defines)
+            """)
+        self.client = TestClient()
+        self.client.save({"dep/conanfile.py": dep, "consumer/conanfile.py": consumer})
+        self.client.run("export dep liba/1.0@user/testing")
+        self.client.run("export dep libb/1.0@user/testing")
+        self.client.run("export consumer app/1.0@user/testing")
+        self.sync_folder = os.path.join(self.client.current_folder, "sync")
+
+    def build_jobs_test(self):
+        with environment_append({"SYNC_FOLDER": self.sync_folder, "CONAN_CPU_COUNT": "4"}):
+            self.client.run("install app/1.0@user/testing --build=missing --build-jobs=2")
+        self.assertIn("liba/1.0@user/testing: CPUS: 2", self.client.out)
+        self.assertIn("libb/1.0@user/testing: CPUS: 2", self.client.out)
+        self.assertIn("liba/1.0@user/testing: Package '%s' created" % NO_SETTINGS_PACKAGE_ID,
+                      self.client.out)
+        # The order of the graph, not the order in which the builds finish
+        self.assertIn("app/1.0@user/testing: DEFINES: ['LIBA', 'LIBB']", self.client.out)
+        self.assertIn("app/1.0@user/testing: Created package revision", self.client.out)
+
+        ref = ConanFileReference.loads("liba/1.0@user/testing")
+        build_folder = self.client.cache.package_layout(ref).build(
+            PackageReference(ref, NO_SETTINGS_PACKAGE_ID))
+        log = load(os.path.join(build_folder, BUILD_LOG_NAME))
+        self.assertIn("liba/1.0@user/testing: CPUS: 2", log)
+        self.assertNotIn("libb/1.0@user/testing", log)
+
+    def build_jobs_conf_test(self):
+        self.client.run("config set general.build_jobs=2")
+        with environment_append({"SYNC_FOLDER": self.sync_folder}):
+            self.client.run("install app/1.0@user/testing --build=missing")
+        self.assertIn("app/1.0@user/testing: DEFINES: ['LIBA', 'LIBB']", self.client.out)
+
+    def build_error_test(self):
+        with environment_append({"SYNC_FOLDER": self.sync_folder, "FAIL": "libb"}):
+            self.client.run("install app/1.0@user/testing --build=missing --build-jobs=2",
+                            assert_error=True)
+        self.assertIn("libb/1.0@user/testing: Error in build() method, line 17", self.client.out)
+        self.assertIn("Build failed on purpose", self.client.out)
+        # The build of the other package finishes
+        self.assertIn("liba/1.0@user/testing: Package '%s' created" % NO_SETTINGS_PACKAGE_ID,
+                      self.client.out)
+        self.assertNotIn("app/1.0@user/testing: Building", self.client.out)
+
+    def remote_sources_test(self):
+        # The sources are downloaded by the main process, not by the build processes, so they
+        # don't use the connections of the main process while it downloads other packages
+        servers = {"default": TestServer(users={"user": "mypass"})}
+        client = TestClient(servers=servers, users={"default": [("user", "mypass")]})
+        conanfile = self.client.load("dep/conanfile.py")
+        conanfile = conanfile.replace("class Pkg(ConanFile):",
+                                      'class Pkg(ConanFile):\n    exports_sources = "*.h"')
+        client.save({"conanfile.py": conanfile, "header.h": "header"})
+        client.run("export . liba/1.0@user/testing")
+        client.run("export . libb/1.0@user/testing")
+        client.run("upload * --confirm")
+
+        client = TestClient(servers=servers)
+        save(os.path.join(self.sync_folder, "liba"), "")  # libb doesn't wait for liba
+        with environment_append({"SYNC_FOLDER": self.sync_folder}):
+            client.run("install libb/1.0@user/testing --build=missing --build-jobs=2")
+        self.assertIn("libb/1.0@user/testing: Package '%s' created" % NO_SETTINGS_PACKAGE_ID,
+                      client.out)
+        ref = ConanFileReference.loads("libb/1.0@user/testing")
+        build_folder = client.cache.package_layout(ref).build(
+            PackageReference(ref, NO_SETTINGS_PACKAGE_ID))
+        self.assertEqual(load(os.path.join(build_folder, "header.h")), "header")
+        self.assertIn("Downloading conan_sources.tgz", client.out)
+        self.assertNotIn("Downloading conan_sources.tgz",
+                         load(os.path.join(build_folder, BUILD_LOG_NAME)))
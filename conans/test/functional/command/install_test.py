@@ -569,6 +569,8 @@ class TestConan(ConanFile):
         client.save({"conanfile.py": conanfile,
                      "conanfile_boost.py": conanfile_boost})
         client.run("create conanfile_boost.py conan/stable")
+        # The first install reports the generated files as changed, the next ones don't
+        client.run("install . -o boost:shared=True --build=missing")
         client.run("install . -o boost:shared=True --build=missing")
         output_0 = "%s" % client.out
         client.run("install . -o boost:shared=True --build missing")
@@ -0,0 +1,62 @@
+import os
+import platform
+import textwrap
+import unittest
+
+from conans.client.tools import environment_append
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.tools import NO_SETTINGS_PACKAGE_ID, TestClient
+
+
+@unittest.skipIf(platform.system() == "Windows", "Hardlinks need the same volume and privileges")
+class PackageHardlinksTest(unittest.TestCase):
+
+    conanfile = textwrap.dedent("""
+        from conans import ConanFile, tools
+
+        class Pkg(ConanFile):
+            exports_sources = "src.h"
+            {attrs}
+            def build(self):
+                tools.save("built.h", "built")
+            def package(self):
+                self.copy("*.h")
+        """)
+
+    def _create(self, attrs="", args=""):
+        client = TestClient()
+        client.save({"conanfile.py": self.conanfile.format(attrs=attrs), "src.h": "src"})
+        ref = ConanFileReference.loads("lib/1.0@user/testing")
+        with environment_append({"CONAN_COPY_STRATEGY": "hardlink, copy"}):
+            client.run("create . %s" % repr(ref))
+            if args:
+                client.run("create . %s %s" % (repr(ref), args))
+        layout = client.cache.package_layout(ref)
+        pref = PackageReference(ref, NO_SETTINGS_PACKAGE_ID)
+        return layout.package(pref), layout.build(pref), layout.source()
+
+    def _linked(self, package_folder, folder, filename):
+        return os.path.samefile(os.path.join(package_folder, filename),
+                                os.path.join(folder, filename))
+
+    def build_folder_test(self):
+        package_folder, build_folder, _ = self._create()
+        self.assertTrue(self._linked(package_folder, build_folder, "built.h"))
+        self.assertTrue(self._linked(package_folder, build_folder, "src.h"))
+
+    def no_copy_source_test(self):
+        # The source folder is used again in the next builds
+        package_folder, build_folder, source_folder = self._create("no_copy_source = True")
+        self.assertFalse(self._linked(package_folder, source_folder, "src.h"))
+        self.assertFalse(self._linked(package_folder, build_folder, "built.h"))
+
+    def build_id_test(self):
+        # The build folder is shared by the packages with the same build_id()
+        package_folder, build_folder, _ = self._create("def build_id(self):\n"
+                                                       "        pass")
+        self.assertFalse(self._linked(package_folder, build_folder, "built.h"))
+
+    def keep_build_test(self):
+        package_folder, build_folder, _ = self._create(args="--keep-build")
+        self.assertFalse(self._linked(package_folder, build_folder, "built.h"))
+        self.assertTrue(os.stat(os.path.join(build_folder, "built.h")).st_mode & 0o200)
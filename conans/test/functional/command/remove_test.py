@@ -4,7 +4,7 @@ import textwrap
 import unittest
 
 import six
-from mock import Mock
+from mock import Mock, patch
 
 from conans import DEFAULT_REVISION_V1
 from conans.client.userio import UserIO
@@ -390,7 +390,8 @@ class RemoveTest(unittest.TestCase):
                             build_folders={"H1": [1, 2], "H2": [1, 2], "B": [1, 2], "O": [1, 2]},
                             src_folders={"H1": True, "H2": True, "B": True, "O": True})
         remote_folder = os.path.join(self.server_folder, ".conan_server/data")
-        folders = os.listdir(remote_folder)
+        # Hidden folders are the server storage internal metadata
+        folders = [f for f in os.listdir(remote_folder) if not f.startswith(".")]
         six.assertCountEqual(self, ["Other", "Bye"], folders)
 
     def remove_specific_package_test(self):
@@ -513,3 +514,41 @@ class RemoveWithoutUserChannel(unittest.TestCase):
         self.client.run("remove lib/1.0 -f -r default")
         self.client.run("install lib/1.0@", assert_error=True)
         self.assertIn("ERROR: Unable to find 'lib/1.0' in remotes", self.client.out)
+
+
+class RemoveTrashTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient()
+        self.client.save({"conanfile.py": GenConanfile()})
+        self.client.run("create . lib/1.0@user/testing")
+        self.trash = os.path.join(self.client.cache.cache_folder, "trash")
+
+    def remove_test(self):
+        layout = self.client.cache.package_layout(ConanFileReference.loads("lib/1.0@user/testing"))
+        self.client.run("remove * -f")
+        self.assertFalse(os.path.exists(layout.base_folder()))
+        self.assertEqual(os.listdir(self.trash), [])
+
+    def background_remove_test(self):
+        # The background process finds the cache with CONAN_USER_HOME
+        self.client = TestClient(cache_folder=os.path.join(temp_folder(), ".conan"))
+        self.client.save({"conanfile.py": GenConanfile()})
+        self.client.run("create . lib/1.0@user/testing")
+        self.trash = os.path.join(self.client.cache.cache_folder, "trash")
+        self.client.run("config set general.background_remove=True")
+        with patch("subprocess.Popen") as popen:
+            self.client.run("remove * -f")
+        command = popen.call_args[0][0]
+        self.assertEqual(command[-2:], ["remove", "--trash-gc"])
+        self.assertEqual(popen.call_args[1]["env"]["CONAN_USER_HOME"],
+                         os.path.dirname(self.client.cache.cache_folder))
+        self.assertTrue(os.listdir(self.trash))
+
+        self.client.run("remove --trash-gc")
+        self.assertIn("Cache trash emptied", self.client.out)
+        self.assertEqual(os.listdir(self.trash), [])
+
+    def trash_gc_pattern_test(self):
+        self.client.run("remove * --trash-gc", assert_error=True)
+        self.assertIn("Specifying a pattern is not supported", self.client.out)
@@ -0,0 +1,41 @@
+import json
+import os
+import unittest
+
+from conans.test.utils.tools import GenConanfile, TestClient
+from conans.util.files import load
+
+
+class TracePerfTest(unittest.TestCase):
+
+    def create_test(self):
+        client = TestClient()
+        client.save({"conanfile.py": GenConanfile().with_name("dep").with_version("0.1")})
+        client.run("create . user/testing")
+        self.assertNotIn("Performance hotspots", client.out)
+
+        client.save({"conanfile.py": GenConanfile().with_require_plain("dep/[>0.0]@user/testing")},
+                    clean_first=True)
+        client.run("create . pkg/0.1@user/testing --build --trace-perf trace.json")
+        self.assertIn("Performance hotspots:", client.out)
+        trace_file = os.path.join(client.current_folder, "trace.json")
+        self.assertIn("Performance trace saved in %s" % trace_file, client.out)
+
+        events = json.loads(load(trace_file))["traceEvents"]
+        names = set(e["name"] for e in events)
+        for name in ("conan create", "load graph", "load recipe", "resolve version range",
+                     "evaluate binaries", "build", "package", "generators", "package_info"):
+            self.assertIn(name, names)
+        create = events[0]
+        self.assertEqual(create["name"], "conan create")
+        self.assertTrue(all(create["ts"] <= e["ts"] for e in events))
+        builds = [e["args"]["ref"] for e in events if e["name"] == "build"]
+        self.assertEqual(sorted(builds), ["dep/0.1@user/testing", "pkg/0.1@user/testing"])
+
+    def error_test(self):
+        client = TestClient()
+        client.run("install . --trace-perf=trace.json", assert_error=True)
+        self.assertIn("Conanfile not found", client.out)
+        self.assertIn("Performance hotspots:", client.out)
+        events = json.loads(load(os.path.join(client.current_folder, "trace.json")))
+        self.assertEqual(events["traceEvents"][0]["name"], "conan install")
@@ -82,3 +82,21 @@ class ConanRequesterCacertPathTests(unittest.TestCase):
         requester.get(url="aaa", verify=True)
         self.assertEqual(mocked_requester.verify, cache.config.cacert_path)
         self.assertEqual(cache.config.cacert_path, default_cacert_path)
+
+
+class ConanRequesterSessionTests(unittest.TestCase):
+
+    def test_reset_session(self):
+        cache = ClientCache(temp_folder(), TestBufferConanOutput())
+        requester = ConanRequester(cache.config)
+        session = requester._http_requester
+        requester.reset_session()
+        self.assertIsNot(requester._http_requester, session)
+        self.assertEqual(requester._http_requester.get_adapter("https://remote").max_retries
+                         .total, session.get_adapter("https://remote").max_retries.total)
+
+        # A requester given by the API user is kept
+        mocked_requester = MockRequesterGet()
+        requester = ConanRequester(cache.config, mocked_requester)
+        requester.reset_session()
+        self.assertIs(requester._http_requester, mocked_requester)
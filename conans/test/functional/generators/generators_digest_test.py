@@ -0,0 +1,117 @@
+import os
+import textwrap
+import unittest
+
+from conans.paths import GENERATORS_DIGEST
+from conans.test.utils.tools import GenConanfile, TestClient
+
+
+class GeneratorsDigestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient()
+        self.client.save({"dep/conanfile.py": GenConanfile().with_setting("build_type"),
+                          "conanfile.txt": "[requires]\ndep/1.0@user/testing\n"
+                                           "[generators]\ncmake\ntxt\n"})
+        self.client.run("create dep dep/1.0@user/testing -s build_type=Release")
+        self.client.run("create dep dep/1.0@user/testing -s build_type=Debug")
+
+    def _mtime(self, filename):
+        return os.path.getmtime(os.path.join(self.client.current_folder, filename))
+
+    def unchanged_files_test(self):
+        self.client.run("install .")
+        self.assertIn("Generated files changed: conanbuildinfo.cmake, conanbuildinfo.txt",
+                      self.client.out)
+        os.utime(os.path.join(self.client.current_folder, "conanbuildinfo.cmake"), (1, 1))
+
+        self.client.run("install .")
+        self.assertIn("Generated files didn't change", self.client.out)
+        self.assertEqual(self._mtime("conanbuildinfo.cmake"), 1)
+        self.assertFalse(os.path.exists(os.path.join(self.client.current_folder,
+                                                     GENERATORS_DIGEST)))
+
+        self.client.run("install . -s build_type=Debug")
+        self.assertIn("Generated files changed: conanbuildinfo.cmake, conanbuildinfo.txt",
+                      self.client.out)
+
+    def digest_test(self):
+        self.client.run("config set general.generators_digest=True")
+        self.client.run("install .")
+        self.assertIn("Generated files changed: conanbuildinfo.cmake, conanbuildinfo.txt",
+                      self.client.out)
+
+        self.client.run("install .")
+        self.assertIn("Generators skipped, their inputs didn't change", self.client.out)
+        self.assertNotIn("Generator cmake created", self.client.out)
+
+        self.client.run("install . -s build_type=Debug")
+        self.assertIn("Generated files changed: conanbuildinfo.cmake, conanbuildinfo.txt",
+                      self.client.out)
+
+        # New generators or removed files are generated again
+        self.client.run("install . -s build_type=Debug -g json")
+        self.assertIn("Generated files changed: conanbuildinfo.json", self.client.out)
+        os.remove(os.path.join(self.client.current_folder, "conanbuildinfo.txt"))
+        self.client.run("install . -s build_type=Debug -g json")
+        self.assertIn("Generated files changed: conanbuildinfo.txt", self.client.out)
+        self.client.run("install . -s build_type=Debug -g json")
+        self.assertIn("Generators skipped", self.client.out)
+
+    def digest_package_changed_test(self):
+        self.client.run("config set general.generators_digest=True")
+        self.client.run("install .")
+        dep = GenConanfile().with_setting("build_type").with_package_file("header.h", "header")
+        self.client.save({"dep/conanfile.py": dep})
+        self.client.run("create dep dep/1.0@user/testing")
+        self.client.run("install .")
+        self.assertNotIn("Generators skipped", self.client.out)
+        self.assertIn("Generated files didn't change", self.client.out)
+
+    def digest_virtualenv_test(self):
+        # The virtualenv deactivate scripts depend on the current environment
+        self.client.run("config set general.generators_digest=True")
+        self.client.run("install . -g virtualenv")
+        self.client.run("install . -g virtualenv")
+        self.assertNotIn("Generators skipped", self.client.out)
+
+    def digest_python_requires_test(self):
+        # A custom generator of a python_requires, that is not a node of the graph
+        generator = textwrap.dedent("""
+            from conans import ConanFile
+            from conans.model import Generator
+
+            class MyGenerator(Generator):
+                @property
+                def filename(self):
+                    return "mygenerator.txt"
+
+                @property
+                def content(self):
+                    return "{}"
+
+            class Pkg(ConanFile):
+                pass
+            """)
+        consumer = textwrap.dedent("""
+            from conans import ConanFile, python_requires
+            gen = python_requires("gen/1.0@user/testing")
+
+            class MyGenerator(gen.MyGenerator):
+                pass
+
+            class Pkg(ConanFile):
+                generators = "MyGenerator"
+            """)
+        self.client.run("config set general.generators_digest=True")
+        self.client.save({"gen/conanfile.py": generator.format("one"), "conanfile.py": consumer})
+        self.client.run("export gen gen/1.0@user/testing")
+        self.client.run("install .")
+        self.client.run("install .")
+        self.assertIn("Generators skipped", self.client.out)
+
+        self.client.save({"gen/conanfile.py": generator.format("two")})
+        self.client.run("export gen gen/1.0@user/testing")
+        self.client.run("install .")
+        self.assertNotIn("Generators skipped", self.client.out)
+        self.assertEqual(self.client.load("mygenerator.txt"), "two")
@@ -0,0 +1,31 @@
+import os
+import unittest
+
+from conans.test.utils.tools import GenConanfile, TestClient
+from conans.util.files import load
+
+
+class ParallelGeneratorsTest(unittest.TestCase):
+
+    def same_files_test(self):
+        client = TestClient()
+        client.save({"dep/conanfile.py": GenConanfile(),
+                     "conanfile.txt": "[requires]\ndep/1.0@user/testing\n"
+                                      "[generators]\ncmake\ntxt\njson\nmake\n"})
+        client.run("create dep dep/1.0@user/testing")
+        client.run("install .")
+        serial_output = str(client.out)
+        files = ("conanbuildinfo.cmake", "conanbuildinfo.txt", "conanbuildinfo.json",
+                 "conanbuildinfo.mak")
+        serial = [load(os.path.join(client.current_folder, f)) for f in files]
+
+        client.run("config set general.generators_jobs=4")
+        client.run("install .")
+        self.assertIn("Generated files didn't change", client.out)
+        parallel = [load(os.path.join(client.current_folder, f)) for f in files]
+        self.assertEqual(serial, parallel)
+        # Reported in the order of the generators
+        created = [line for line in str(client.out).splitlines() if "created" in line]
+        self.assertEqual(created, [line for line in serial_output.splitlines()
+                                   if "created" in line])
+        self.assertTrue(created[0].endswith("created conanbuildinfo.cmake"))
@@ -45,9 +45,9 @@ class GraphManagerTest(unittest.TestCase):
                                     self.resolver, binaries)
         hook_manager = Mock()
         app_type = namedtuple("ConanApp", "cache out remote_manager hook_manager graph_manager"
-                              " binaries_analyzer")
+                              " binaries_analyzer requester")
         app = app_type(self.cache, self.output, self.remote_manager, hook_manager, self.manager,
-                       binaries)
+                       binaries, Mock())
         return app
 
     def _cache_recipe(self, ref, test_conanfile, revision=None):
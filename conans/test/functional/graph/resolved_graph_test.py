@@ -0,0 +1,90 @@
+import os
+import textwrap
+import unittest
+
+from conans.client.tools import environment_append
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.tools import GenConanfile, NO_SETTINGS_PACKAGE_ID, TestClient
+from conans.util.files import rmdir
+
+
+class ResolvedGraphTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient()
+        self.client.run("config set general.resolved_graph_cache=True")
+        self.client.save({"dep/conanfile.py": GenConanfile(),
+                          "lib/conanfile.py": GenConanfile().with_require_plain(
+                              "dep/[>=1.0]@user/testing"),
+                          "conanfile.txt": "[requires]\nlib/1.0@user/testing\n"})
+        self.client.run("create dep dep/1.0@user/testing")
+        self.client.run("create lib lib/1.0@user/testing")
+
+    def reused_graph_test(self):
+        self.client.run("install .")
+        self.assertNotIn("Using the graph resolved by the previous install", self.client.out)
+        self.assertIn("Version ranges solved", self.client.out)
+
+        self.client.run("install .")
+        self.assertIn("Using the graph resolved by the previous install", self.client.out)
+        self.assertNotIn("Version ranges solved", self.client.out)
+        self.assertIn("dep/1.0@user/testing:%s - Cache" % NO_SETTINGS_PACKAGE_ID,
+                      self.client.out)
+        self.assertIn("dep/1.0@user/testing: Already installed!", self.client.out)
+
+        # Other inputs resolve the graph again
+        self.client.run("install . -e VAR=1")
+        self.assertNotIn("Using the graph resolved", self.client.out)
+        self.client.run("install . --build=missing")
+        self.assertNotIn("Using the graph resolved", self.client.out)
+        self.client.run("install . --update")
+        self.assertNotIn("Using the graph resolved", self.client.out)
+
+    def new_version_test(self):
+        self.client.run("install .")
+        self.client.run("create dep dep/1.1@user/testing")
+        self.client.run("install .")
+        self.assertNotIn("Using the graph resolved", self.client.out)
+        self.assertIn("dep/1.1@user/testing from local cache", self.client.out)
+
+    def removed_package_test(self):
+        self.client.run("install .")
+        ref = ConanFileReference.loads("dep/1.0@user/testing")
+        package_folder = self.client.cache.package_layout(ref).package(
+            PackageReference(ref, NO_SETTINGS_PACKAGE_ID))
+        rmdir(package_folder)
+        self.client.run("install .", assert_error=True)
+        self.assertNotIn("Using the graph resolved", self.client.out)
+        self.assertIn("Missing prebuilt package for 'dep/1.0@user/testing'", self.client.out)
+
+    def requirements_from_environment_test(self):
+        # The inputs of the graph don't include what requirements() reads from the environment
+        conanfile = textwrap.dedent("""
+            import os
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                requires = "lib/1.0@user/testing"
+                def requirements(self):
+                    if os.getenv("WITH_B"):
+                        self.requires("libb/1.0@user/testing")
+            """)
+        self.client.save({"libb/conanfile.py": GenConanfile(), "conanfile.py": conanfile})
+        self.client.run("create libb libb/1.0@user/testing")
+        self.client.run("install .")
+        with environment_append({"WITH_B": "1"}):
+            self.client.run("install .")
+        self.assertIn("The graph resolved by the previous install is outdated", self.client.out)
+        self.assertIn("libb/1.0@user/testing from local cache", self.client.out)
+        self.client.run("install .")
+        self.assertIn("The graph resolved by the previous install is outdated", self.client.out)
+        self.assertNotIn("libb/1.0@user/testing from local cache", self.client.out)
+        self.client.run("install .")
+        self.assertIn("Using the graph resolved by the previous install", self.client.out)
+
+    def disabled_test(self):
+        self.client.run("config set general.resolved_graph_cache=False")
+        self.client.run("install .")
+        self.client.run("install .")
+        self.assertNotIn("Using the graph resolved", self.client.out)
+        self.assertFalse(os.path.exists(os.path.join(self.client.current_folder,
+                                                     "conangraph.json")))
@@ -0,0 +1,165 @@
+import multiprocessing
+import os
+import platform
+import textwrap
+import unittest
+
+from mock import patch
+
+from conans.client.graph.build_queue import BuildQueue
+from conans.client.tools import environment_append
+from conans.model.graph_lock import LOCKFILE
+from conans.test.utils.tools import TestClient, TestServer
+from conans.util.files import load, save
+
+
+class BuildQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        # PkgB and PkgC wait for the other one to start building, if SYNC_FOLDER is defined
+        conanfile = textwrap.dedent("""
+            import os, time
+            from conans import ConanFile, tools
+
+            class Pkg(ConanFile):
+                {requires}
+                def build(self):
+                    sync = os.getenv("SYNC_FOLDER")
+                    if sync and self.name in ("PkgB", "PkgC"):
+                        tools.save(os.path.join(sync, self.name), "")
+                        other = "PkgC" if self.name == "PkgB" else "PkgB"
+                        for _ in range(200):
+                            if os.path.exists(os.path.join(sync, other)):
+                                break
+                            time.sleep(0.05)
+                        else:
+                            raise Exception("%s not built in parallel" % other)
+                    if os.getenv("FAIL") == self.name:
+                        raise Exception("Build failed on purpose")
+            """)
+        self.server = TestServer(users={"user": "mypass"})
+        self.client = TestClient(servers={"default": self.server},
+                                 users={"default": [("user", "mypass")]})
+        for name, requires in (("PkgA", ""),
+                               ("PkgB", 'requires = "PkgA/0.1@user/channel"'),
+                               ("PkgC", 'requires = "PkgA/0.1@user/channel"'),
+                               ("PkgD", 'requires = "PkgB/0.1@user/channel", '
+                                        '"PkgC/0.1@user/channel"')):
+            self.client.save({"conanfile.py": conanfile.format(requires=requires)})
+            self.client.run("create . %s/0.1@user/channel" % name)
+        self.client.run("upload * --all --confirm")
+        self.client.run("graph lock PkgD/0.1@user/channel")
+        self.queue_folder = os.path.join(self.client.current_folder, "queue")
+        self.client.run("graph queue . queue --build")
+        self.assertIn("4 packages to build queued in queue", self.client.out)
+
+    def _worker(self, name):
+        client = TestClient(servers={"default": self.server},
+                            users={"default": [("user", "mypass")]})
+        try:
+            client.run("graph worker \"%s\" --name=%s" % (self.queue_folder, name))
+        finally:
+            save(os.path.join(self.queue_folder, "%s.log" % name), str(client.out))
+
+    @unittest.skipIf(platform.system() == "Windows", "The test workers need fork()")
+    def parallel_workers_test(self):
+        with environment_append({"SYNC_FOLDER": os.path.join(self.client.current_folder,
+                                                             "sync")}):
+            workers = [multiprocessing.Process(target=self._worker, args=(name, ))
+                       for name in ("worker1", "worker2")]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        logs = [load(os.path.join(self.queue_folder, "%s.log" % name))
+                for name in ("worker1", "worker2")]
+        self.assertEqual([w.exitcode for w in workers], [0, 0], "\n".join(logs))
+        # PkgB and PkgC can only be built at the same time by different workers
+        built = "\n".join(log.splitlines()[-1] for log in logs)
+        for name in ("PkgA", "PkgB", "PkgC", "PkgD"):
+            self.assertEqual(built.count("%s/0.1@user/channel" % name), 1, built)
+
+        # The lockfile of the queue has all the packages built, and they were uploaded
+        lockfile = load(os.path.join(self.queue_folder, LOCKFILE))
+        self.assertEqual(lockfile.count('"modified": true'), 4)
+        client = TestClient(servers={"default": self.server})
+        client.save({LOCKFILE: lockfile})
+        client.run("install PkgD/0.1@user/channel --lockfile")
+        self.assertEqual(str(client.out).count("Downloaded package"), 4)
+
+    def failed_build_test(self):
+        with environment_append({"FAIL": "PkgB"}):
+            self.client.run("graph worker queue", assert_error=True)
+        self.assertIn("Failed to build PkgB/0.1@user/channel", self.client.out)
+        self.assertIn("PkgC/0.1@user/channel: Package", self.client.out)
+        self.assertIn("Some packages of the build queue failed:\n"
+                      "PkgB/0.1@user/channel: PkgB/0.1@user/channel: Error in build() method",
+                      self.client.out)
+        self.assertIn("PkgD/0.1@user/channel: Not built, a dependency failed", self.client.out)
+
+    def stale_claim_test(self):
+        # A worker killed while building PkgA, its claim is not updated anymore
+        queue = BuildQueue(self.queue_folder, claim_timeout=0)
+        node_id = queue.claim("killed")
+        self.assertEqual(queue.pref(node_id).ref.name, "PkgA")
+        self.assertIsNone(BuildQueue(self.queue_folder).claim("other"))
+
+        self.assertEqual(queue.claim("other"), node_id)
+        self.assertFalse(queue.heartbeat(node_id, "killed"))
+        self.assertTrue(queue.heartbeat(node_id, "other"))
+        with patch("time.time", return_value=0):
+            queue.heartbeat(node_id, "other")
+        self.client.run("graph worker queue")
+        self.assertIn("Building PkgA/0.1@user/channel from the build queue", self.client.out)
+        self.assertIn("PkgD/0.1@user/channel", str(self.client.out).splitlines()[-1])
+
+    def unexpected_error_test(self):
+        with patch("conans.client.cmd.build_worker.deps_install",
+                   side_effect=RuntimeError("Unexpected")):
+            self.client.run("graph worker queue", assert_error=True)
+        self.assertIn("Failed to build PkgA/0.1@user/channel: Unexpected", self.client.out)
+        self.assertIn("PkgD/0.1@user/channel: Not built, a dependency failed", self.client.out)
+
+    def interrupted_test(self):
+        with patch("conans.client.cmd.build_worker.deps_install",
+                   side_effect=KeyboardInterrupt()):
+            self.client.run("graph worker queue")
+        self.assertNotIn("Failed to build", self.client.out)
+        # The interrupted build is not a failure, other worker builds it
+        queue = BuildQueue(self.queue_folder)
+        self.assertEqual(queue.failures(), {})
+        self.client.run("graph worker queue")
+        self.assertIn("Building PkgA/0.1@user/channel from the build queue", self.client.out)
+        self.assertTrue(queue.finished())
+
+    def lost_claim_test(self):
+        queue = BuildQueue(self.queue_folder, claim_timeout=0)
+        node_id = queue.claim("slow")
+        self.assertEqual(queue.claim("other"), node_id)
+        # The worker whose claim was taken cannot report the result anymore
+        self.assertFalse(queue.failed(node_id, "slow", "error"))
+        self.assertFalse(queue.built(node_id, "slow", None))
+        queue.release(node_id, "slow")
+        self.assertEqual(queue.failures(), {})
+        queue.release(node_id, "other")
+        self.assertEqual(BuildQueue(self.queue_folder).claim("next"), node_id)
+
+    def lost_claim_worker_test(self):
+        from conans.client.cmd.build_worker import deps_install
+
+        def stolen_claim_install(app, ref_or_path, **kwargs):
+            deps_install(app, ref_or_path, **kwargs)
+            if ref_or_path.name == "PkgA":
+                # Other worker claimed it meanwhile, after claim_timeout, and built it
+                queue = BuildQueue(self.queue_folder)
+                queue._save_claim(node_id, "other")
+                self.assertTrue(queue.built(node_id, "other", kwargs["graph_info"].graph_lock))
+
+        node_id = BuildQueue(self.queue_folder)._order[0]
+        with patch("conans.client.cmd.build_worker.deps_install",
+                   side_effect=stolen_claim_install):
+            self.client.run("graph worker queue")
+        self.assertIn("The claim of PkgA/0.1@user/channel was taken by other worker, discarding "
+                      "its build", self.client.out)
+        self.assertNotIn("Uploading PkgA", self.client.out)
+        self.assertIn("PkgD/0.1@user/channel", str(self.client.out).splitlines()[-1])
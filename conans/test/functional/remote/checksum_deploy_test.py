@@ -0,0 +1,70 @@
+import os
+import unittest
+
+from mock import patch
+
+from conans import REVISIONS
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import PACKAGE_TGZ_NAME
+from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.test.utils.tools import GenConanfile, TestClient, TestServer
+
+
+class ChecksumDeployTest(unittest.TestCase):
+
+    def _upload_same_package_twice(self, server):
+        """Returns the number of files stored by the second upload"""
+        client = TestClient(servers={"default": server},
+                            users={"default": [("lasote", "mypass")]}, revisions_enabled=True)
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . lib/1.0@lasote/testing")
+        client.run("upload lib/1.0@lasote/testing --all")
+        client.run("copy lib/1.0@lasote/testing lasote/stable --all")
+        with patch.object(ServerDiskAdapter, "put_file",
+                          side_effect=ServerDiskAdapter.put_file, autospec=True) as put_file:
+            client.run("upload lib/1.0@lasote/stable --all")
+        client.run("remove * -f")
+        client.run("install lib/1.0@lasote/stable")
+        self.assertIn("lib/1.0@lasote/stable: Package installed", client.out)
+        return put_file.call_count
+
+    def upload_existing_files_test(self):
+        server = TestServer()
+        put_calls = self._upload_same_package_twice(server)
+        # None of the files is transferred again, they are linked to the existing ones
+        self.assertEqual(put_calls, 0)
+
+        package_files = []
+        for channel in ("testing", "stable"):
+            ref = ConanFileReference.loads("lib/1.0@lasote/%s" % channel)
+            ref = ref.copy_with_rev(server.server_store.get_last_revision(ref).revision)
+            pref = PackageReference(ref, "5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9")
+            prev = server.server_store.get_last_package_revision(pref).revision
+            pref = pref.copy_with_revs(ref.revision, prev)
+            path = server.server_store.get_package_file_path(pref, PACKAGE_TGZ_NAME)
+            package_files.append(path)
+        self.assertTrue(os.path.samefile(*package_files))
+
+    def not_readable_files_test(self):
+        # Other users can't reuse the files of a private reference knowing their sha1
+        server = TestServer(read_permissions=[("lib/1.0@private/*", "private"),
+                                              ("lib/1.0@lasote/*", "*")],
+                            write_permissions=[("lib/1.0@private/*", "private"),
+                                               ("lib/1.0@lasote/*", "lasote")],
+                            users={"private": "pass", "lasote": "mypass"})
+        client = TestClient(servers={"default": server},
+                            users={"default": [("private", "pass")]}, revisions_enabled=True)
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . lib/1.0@private/testing")
+        client.run("upload lib/1.0@private/testing --all")
+        client.run("copy lib/1.0@private/testing lasote/stable --all")
+        client.run("user lasote -p mypass -r default")
+        with patch.object(ServerDiskAdapter, "put_file",
+                          side_effect=ServerDiskAdapter.put_file, autospec=True) as put_file:
+            client.run("upload lib/1.0@lasote/stable --all")
+        self.assertEqual(put_file.call_count, 5)
+
+    def server_without_checksum_deploy_test(self):
+        server = TestServer(server_capabilities=[REVISIONS])
+        put_calls = self._upload_same_package_twice(server)
+        self.assertEqual(put_calls, 5)
@@ -0,0 +1,62 @@
+import os
+import time
+import unittest
+
+from mock import patch
+
+from conans.server.store.content_addressed_adapter import GC_GRACE_PERIOD
+from conans.test.utils.tools import GenConanfile, TestClient, TestServer
+
+
+class ContentAddressedStorageTest(unittest.TestCase):
+
+    def setUp(self):
+        with patch.dict("os.environ", {"CONAN_STORAGE_ADAPTER": "content_addressed"}):
+            self.server = TestServer()
+        self.client = TestClient(servers={"default": self.server},
+                                 users={"default": [("lasote", "mypass")]})
+
+    def upload_install_test(self):
+        conanfile = str(GenConanfile()) + "\n    exports_sources = '*.h'" \
+                                          "\n    def package(self):" \
+                                          "\n        self.copy('*.h')"
+        self.client.save({"conanfile.py": conanfile, "header.h": "// header"})
+        self.client.run("create . lib/1.0@lasote/testing")
+        self.client.run("upload lib/1.0@lasote/testing --all")
+        blobs_folder = os.path.join(self.server.server_store.store, ".blobs")
+        blobs = set(os.listdir(blobs_folder))
+
+        # The same package in other channel doesn't store the files again
+        self.client.run("copy lib/1.0@lasote/testing lasote/stable --all")
+        self.client.run("upload lib/1.0@lasote/stable --all")
+        self.assertEqual(blobs, set(os.listdir(blobs_folder)))
+
+        self.client.run("remove * -f")
+        self.client.run("install lib/1.0@lasote/stable")
+        self.assertIn("lib/1.0@lasote/stable: Package installed", self.client.out)
+        self.client.run("search lib/1.0@lasote/stable -r default")
+        self.assertIn("Package_ID: 5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9", self.client.out)
+
+    def remove_collect_garbage_test(self):
+        self.client.save({"conanfile.py": GenConanfile()})
+        self.client.run("create . lib/1.0@lasote/testing")
+        self.client.run("upload lib/1.0@lasote/testing --all")
+        self.client.run("copy lib/1.0@lasote/testing lasote/stable --all")
+        self.client.run("upload lib/1.0@lasote/stable --all")
+        blobs_folder = os.path.join(self.server.server_store.store, ".blobs")
+        blobs = [os.path.join(root, f) for root, _, files in os.walk(blobs_folder)
+                 for f in files]
+        self.assertTrue(blobs)
+        for blob in blobs:  # Older than the grace period of the uploads in progress
+            os.utime(blob, (time.time() - 2 * GC_GRACE_PERIOD, ) * 2)
+
+        # The blobs are still used by the other channel
+        self.client.run("remove lib/1.0@lasote/testing -r default -f")
+        self.assertEqual(self.server.server_store.collect_garbage(), 0)
+        self.client.run("remove * -f")
+        self.client.run("install lib/1.0@lasote/stable")
+        self.assertIn("lib/1.0@lasote/stable: Package installed", self.client.out)
+
+        self.client.run("remove lib/1.0@lasote/stable -r default -f")
+        self.assertEqual(self.server.server_store.collect_garbage(), len(blobs))
+        self.assertFalse(any(os.path.exists(blob) for blob in blobs))
@@ -0,0 +1,48 @@
+import os
+import textwrap
+import unittest
+
+from mock import patch
+
+from conans.client.rest.uploader_downloader import FileDownloader
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestClient, TestServer
+
+
+class DownloadCacheTest(unittest.TestCase):
+
+    def install_from_several_caches_test(self):
+        server = TestServer()
+        servers = {"default": server}
+        client = TestClient(servers=servers, users={"default": [("lasote", "mypass")]},
+                            revisions_enabled=True)
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                exports_sources = "*"
+            """)
+        client.save({"conanfile.py": conanfile, "source.txt": "source"})
+        client.run("create . lib/1.0@lasote/testing")
+        client.run("upload lib/1.0@lasote/testing --all")
+
+        download_cache = temp_folder()
+        downloads = []
+        for _ in range(2):
+            client = TestClient(servers=servers, revisions_enabled=True)
+            with patch.dict("os.environ", {"CONAN_DOWNLOAD_CACHE": download_cache}):
+                with patch.object(FileDownloader, "_download_file",
+                                  side_effect=FileDownloader._download_file,
+                                  autospec=True) as download_file:
+                    client.run("install lib/1.0@lasote/testing")
+                    self.assertIn("lib/1.0@lasote/testing: Package installed", client.out)
+                    client.run("remove * -f")
+                    client.run("install lib/1.0@lasote/testing --build")
+            self.assertIn("lib/1.0@lasote/testing: Created package", client.out)
+            downloads.append(sorted(os.path.basename(call[0][4])
+                                    for call in download_file.call_args_list if call[0][4]))
+
+        self.assertEqual(downloads[0], ["conan_package.tgz", "conan_sources.tgz", "conanfile.py",
+                                        "conaninfo.txt", "conanmanifest.txt",
+                                        "conanmanifest.txt"])
+        self.assertEqual(downloads[1], [])
+        self.assertTrue(os.listdir(os.path.join(download_cache, "data")))
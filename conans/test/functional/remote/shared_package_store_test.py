@@ -0,0 +1,83 @@
+import os
+import platform
+import stat
+import textwrap
+import unittest
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import NO_SETTINGS_PACKAGE_ID, TestClient, TestServer
+
+
+@unittest.skipIf(platform.system() == "Windows", "Symlinks in Windows need privileges")
+class SharedPackageStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TestServer()
+        client = TestClient(servers={"default": self.server},
+                            users={"default": [("lasote", "mypass")]}, revisions_enabled=True)
+        conanfile = textwrap.dedent("""
+            import os
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                exports_sources = "*.h"
+                def package(self):
+                    self.copy("*.h", dst="include")
+                    os.symlink("include", os.path.join(self.package_folder, "headers"))
+            """)
+        client.save({"conanfile.py": conanfile, "header.h": "header"})
+        client.run("create . lib/1.0@lasote/testing")
+        client.run("upload lib/1.0@lasote/testing --all")
+        self.store = temp_folder()
+        self.pref = PackageReference(ConanFileReference.loads("lib/1.0@lasote/testing"),
+                                     NO_SETTINGS_PACKAGE_ID)
+
+    def _install(self, read_only=False):
+        client = TestClient(servers={"default": self.server}, revisions_enabled=True)
+        client.run('config set general.shared_package_store="%s"' % self.store)
+        if read_only:
+            client.run("config set general.read_only_cache=True")
+        client.run("install lib/1.0@lasote/testing")
+        return client, client.cache.package_layout(self.pref.ref).package(self.pref)
+
+    def _store_package(self, client):
+        metadata = client.cache.package_layout(self.pref.ref).load_metadata()
+        return os.path.join(self.store, self.pref.ref.dir_repr(), metadata.recipe.revision,
+                            "package", self.pref.id, metadata.packages[self.pref.id].revision)
+
+    def copied_packages_test(self):
+        client, first_package = self._install()
+        self.assertIn("Downloading conan_package.tgz", client.out)
+        self.assertNotIn("from the shared package store", client.out)
+        # The store has a read-only copy, the package folder is not modified
+        first_header = os.path.join(first_package, "include", "header.h")
+        store_header = os.path.join(self._store_package(client), "include", "header.h")
+        self.assertFalse(os.path.samefile(first_header, store_header))
+        self.assertFalse(os.stat(store_header).st_mode & stat.S_IWRITE)
+        self.assertTrue(os.stat(first_header).st_mode & stat.S_IWRITE)
+
+        client, package = self._install()
+        self.assertNotIn("Downloading conan_package.tgz", client.out)
+        self.assertIn("lib/1.0@lasote/testing: Package installed %s from the shared package "
+                      "store" % NO_SETTINGS_PACKAGE_ID, client.out)
+        header = os.path.join(package, "include", "header.h")
+        self.assertFalse(os.path.samefile(header, store_header))
+        self.assertTrue(os.stat(header).st_mode & stat.S_IWRITE)
+        self.assertEqual(open(header).read(), "header")
+        self.assertEqual(os.readlink(os.path.join(package, "headers")), "include")
+        client.run("install lib/1.0@lasote/testing --update")
+        self.assertNotIn("Package installed", client.out)
+
+        client.run("remove * -f")
+        self.assertFalse(os.path.exists(package))
+        self.assertTrue(os.path.exists(os.path.join(first_package, "include", "header.h")))
+
+    def symlinked_read_only_package_test(self):
+        self._install()
+        client, package = self._install(read_only=True)
+        self.assertIn("from the shared package store", client.out)
+        self.assertTrue(os.path.islink(package))
+        self.assertTrue(os.path.exists(os.path.join(package, "include", "header.h")))
+        client.run("remove * -f")
+        self.assertFalse(os.path.lexists(package))
+        self.assertEqual(len(os.listdir(self.store)), 1)
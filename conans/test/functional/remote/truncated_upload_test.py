@@ -0,0 +1,55 @@
+import base64
+import hashlib
+import unittest
+
+from webtest.app import TestRequest
+
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import GenConanfile, TestClient, TestServer
+from conans.util.files import load
+
+
+class TruncatedUploadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TestServer()
+        client = TestClient(servers={"default": self.server},
+                            users={"default": [("lasote", "mypass")]})
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . lib/1.0@lasote/testing")
+        client.run("upload lib/1.0@lasote/testing")
+        ref = ConanFileReference.loads("lib/1.0@lasote/testing")
+        ref = ref.copy_with_rev(self.server.server_store.get_last_revision(ref).revision)
+        self.path = self.server.server_store.get_conanfile_file_path(ref, "conanfile.py")
+        self.contents = load(self.path)
+        self.url = "/v2/conans/lib/1.0/lasote/testing/revisions/%s/files/conanfile.py" \
+                   % ref.revision
+        basic = base64.b64encode(b"lasote:mypass").decode()
+        token = self.server.app.get("/v1/users/authenticate",
+                                    headers={"Authorization": "Basic %s" % basic}).text
+        self.headers = {"Authorization": "Bearer %s" % token}
+
+    def _put(self, body, content_length, sha1=None):
+        headers = dict(self.headers)
+        if sha1:
+            headers["X-Checksum-Sha1"] = sha1
+        request = TestRequest.blank(self.url, method="PUT", body=body, headers=headers)
+        request.environ["CONTENT_LENGTH"] = str(content_length)
+        return self.server.app.do_request(request, expect_errors=True)
+
+    def truncated_body_test(self):
+        # The client disconnected after sending 10 of the 1000 bytes
+        response = self._put(b"0123456789", 1000)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Incomplete request body", response.text)
+        self.assertEqual(load(self.path), self.contents)
+
+    def wrong_sha1_test(self):
+        response = self._put(b"0123456789", 10, sha1=hashlib.sha1(b"other").hexdigest())
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("don't match their sha1", response.text)
+        self.assertEqual(load(self.path), self.contents)
+
+        response = self._put(b"0123456789", 10, sha1=hashlib.sha1(b"0123456789").hexdigest())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(load(self.path), "0123456789")
@@ -89,6 +89,58 @@ class MyBuildInfo(unittest.TestCase):
                 for dep in module["dependencies"]:
                     self.assertTrue(dep["id"].startswith("Hello0/1.0@lasote/stable"))
 
+    def test_merge_traces(self):
+        files = cpp_hello_conan_files("Hello0", "1.0", deps=[], build=False)
+        self.client.save(files)
+        self.client.run("export . lasote/stable")
+        files = cpp_hello_conan_files("Hello1", "1.0", deps=["Hello0/1.0@lasote/stable"],
+                                      build=False)
+        self.client.save(files)
+        self.client.run("export . lasote/stable")
+        self.client.run("install Hello1/1.0@lasote/stable --build missing")
+        self.client.run("upload 'Hello0*' -c --all")
+        self.client.run("remove 'Hello0*' -f")
+
+        # One CI job gets the dependencies, other one uploads
+        folder = temp_folder()
+        install_trace = os.path.join(folder, "install_trace.log")
+        upload_trace = os.path.join(folder, "upload_trace.log")
+        with tools.environment_append({"CONAN_TRACE_FILE": install_trace}):
+            self.client.run("install Hello1/1.0@lasote/stable")
+        with tools.environment_append({"CONAN_TRACE_FILE": upload_trace}):
+            self.client.run("upload 'Hello1*' -c --all")
+
+        data = get_build_info(upload_trace).serialize()
+        self.assertEqual(0, len(_get_module(data, "Hello1/1.0@lasote/stable")["dependencies"]))
+        data = get_build_info([install_trace, upload_trace]).serialize()
+        self.assertEqual(len(data["modules"]), 2)
+        module = _get_module(data, "Hello1/1.0@lasote/stable")
+        self.assertEqual(3, len(module["dependencies"]))
+        self.assertEqual(3, len(module["artifacts"]))
+
+    def test_incremental_command(self):
+        from conans.build_info.command import run
+        folder = temp_folder()
+        output = os.path.join(folder, "build_info.json")
+        for name in ("Hello0", "Hello1"):
+            trace_file = os.path.join(folder, "%s_trace.log" % name)
+            with tools.environment_append({"CONAN_TRACE_FILE": trace_file}):
+                self.client.save(cpp_hello_conan_files(name, "1.0", deps=[], build=False))
+                self.client.run("create . lasote/stable")
+                self.client.run("upload %s* --all -c" % name)
+            sys.argv = ['conan_build_info', trace_file, '--output', output, '--incremental']
+            run()
+
+        modules = json.loads(load(output))["modules"]
+        self.assertEqual(len(modules), 4)
+        self.assertEqual(3, len(_get_module({"modules": modules},
+                                            "Hello0/1.0@lasote/stable")["artifacts"]))
+
+        # Adding the same traces again doesn't duplicate anything
+        sys.argv = ['conan_build_info', trace_file, '--output', output, '--incremental']
+        run()
+        self.assertEqual(json.loads(load(output))["modules"], modules)
+
     def test_invalid_tracer(self):
         trace_file = os.path.join(temp_folder(), "conan_trace.log")
         save(trace_file, "invalid contents")
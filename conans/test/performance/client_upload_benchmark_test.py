@@ -0,0 +1,88 @@
+import os
+import socket
+import time
+import unittest
+
+import requests
+from mock import patch
+from nose.plugins.attrib import attr
+
+from conans.client.rest.client_routes import ClientV2Router
+from conans.client.rest.rest_client_common import JWTAuth
+from conans.client.rest.uploader_downloader import FileUploader
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.server_launcher import TestServerLauncher
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestBufferConanOutput
+from conans.util.files import save
+from conans.util.log import logger
+
+MB = 1024 * 1024
+
+
+class _Requester(object):
+    retry = 0
+    retry_wait = 0
+
+    def __init__(self):
+        self._session = requests.Session()
+
+    def get(self, url, **kwargs):
+        return self._session.get(url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._session.put(url, **kwargs)
+
+
+def _free_port():
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+@attr("slow")
+@attr("performance")
+class ClientUploadBenchmarkTest(unittest.TestCase):
+    """Upload throughput of the client to a conan_server listening in the loopback interface.
+    The size of the uploaded file can be changed with CONAN_BENCHMARK_UPLOAD_MB"""
+
+    def upload_throughput_test(self):
+        size = int(os.getenv("CONAN_BENCHMARK_UPLOAD_MB", "8")) * MB
+        port = _free_port()
+        with patch.dict("os.environ", {"CONAN_SERVER_PORT": str(port)}):
+            server = TestServerLauncher(users={"demo": "demo"})
+        server.start()
+        try:
+            requester = _Requester()
+            router = ClientV2Router("http://127.0.0.1:%d" % port)
+            token = requester.get(router.common_authenticate(), auth=("demo", "demo")).text
+            auth = JWTAuth(token)
+
+            folder = temp_folder()
+            conanfile = os.path.join(folder, "conanfile.py")
+            save(conanfile, "from conans import ConanFile\nclass Pkg(ConanFile):\n    pass\n")
+            package = os.path.join(folder, "conan_package.tgz")
+            with open(package, "wb") as f:
+                block = os.urandom(MB)
+                for _ in range(size // MB):
+                    f.write(block)
+
+            ref = ConanFileReference.loads("lib/1.0@demo/testing#rrev")
+            output = TestBufferConanOutput()
+            FileUploader(requester, output, verify=False).upload(
+                router.recipe_file(ref, "conanfile.py"), conanfile, auth=auth)
+
+            for chunk_size in (1024, 64 * 1024, MB, 8 * MB):
+                pref = PackageReference(ref, "pkgid", "prev%d" % chunk_size)
+                url = router.package_file(pref, "conan_package.tgz")
+                uploader = FileUploader(requester, output, verify=False, chunk_size=chunk_size)
+                start = time.time()
+                response = uploader.upload(url, package, auth=auth)
+                elapsed = time.time() - start
+                self.assertEqual(response.status_code, 200)
+                logger.info("Upload %d MB, chunks of %d KB: %.1f MB/s"
+                            % (size // MB, chunk_size // 1024, size / MB / elapsed))
+        finally:
+            server.stop()
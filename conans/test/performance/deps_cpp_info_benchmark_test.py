@@ -0,0 +1,59 @@
+import os
+import time
+import unittest
+
+from nose.plugins.attrib import attr
+
+from conans.model.build_info import CppInfo, DepsCppInfo
+from conans.test.utils.test_files import temp_folder
+from conans.util.log import logger
+
+
+def _merge_lists(seq1, seq2):
+    """ The previous DepsCppInfo merge of every update """
+    return [s for s in seq1 if s not in seq2] + seq2
+
+
+class _OneByOneDepsCppInfo(object):
+    def __init__(self):
+        self.includedirs, self.libs, self.defines = [], [], []
+
+    def update(self, dep_cpp_info, _):
+        self.includedirs = _merge_lists(self.includedirs, dep_cpp_info.include_paths)
+        self.libs = _merge_lists(self.libs, dep_cpp_info.libs)
+        self.defines = _merge_lists(dep_cpp_info.defines, self.defines)
+
+
+@attr("slow")
+@attr("performance")
+class DepsCppInfoBenchmarkTest(unittest.TestCase):
+    """The aggregation of the cpp_info of every dependency, for every node of a graph where every
+    package depends on all the previous ones (the installer does it for the public closure
+    of every node). The number of packages can be changed with CONAN_BENCHMARK_DEPS"""
+
+    def aggregation_test(self):
+        num_deps = int(os.getenv("CONAN_BENCHMARK_DEPS", "200"))
+        cpp_infos = []
+        for i in range(num_deps):
+            folder = temp_folder()
+            cpp_info = CppInfo(folder)
+            cpp_info.includedirs = [os.path.join(folder, "include%d" % j) for j in range(10)]
+            cpp_info.filter_empty = False
+            cpp_info.libs = ["lib%d_%d" % (i, j) for j in range(10)] + ["pthread", "m"]
+            cpp_info.defines = ["DEFINE%d_%d" % (i, j) for j in range(10)] + ["NDEBUG"]
+            cpp_infos.append(("pkg%d" % i, cpp_info))
+
+        results = {}
+        for name, deps_cpp_info_class in (("one by one", _OneByOneDepsCppInfo),
+                                          ("merged once", DepsCppInfo)):
+            start = time.time()
+            for node in range(num_deps):
+                deps_cpp_info = deps_cpp_info_class()
+                for pkg_name, cpp_info in cpp_infos[:node]:
+                    deps_cpp_info.update(cpp_info, pkg_name)
+                result = (deps_cpp_info.includedirs, deps_cpp_info.libs, deps_cpp_info.defines)
+            results[name] = time.time() - start, result
+
+        self.assertEqual(results["one by one"][1], results["merged once"][1])
+        logger.info("%d packages: merging one by one %.2fs, merging once %.2fs"
+                    % (num_deps, results["one by one"][0], results["merged once"][0]))
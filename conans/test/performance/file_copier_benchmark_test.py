@@ -0,0 +1,60 @@
+import os
+import time
+import unittest
+
+from nose.plugins.attrib import attr
+
+from conans.client.file_copier import FileCopier
+from conans.test.utils.test_files import temp_folder
+from conans.util.log import logger
+
+
+def _build_tree(folder, num_files):
+    """A build folder like tree: 100 files per folder, 1 of each 50 files is a library"""
+    for i in range(num_files):
+        subfolder = os.path.join(folder, "module%d" % (i // 10000), "obj%d" % (i // 100))
+        if i % 100 == 0:
+            os.makedirs(subfolder)
+        ext = ".a" if i % 50 == 0 else ".o"
+        open(os.path.join(subfolder, "file%d%s" % (i, ext)), "w").close()
+    os.makedirs(os.path.join(folder, "include"))
+    for i in range(100):
+        open(os.path.join(folder, "include", "header%d.h" % i), "w").close()
+
+
+@attr("slow")
+@attr("performance")
+class FileCopierBenchmarkTest(unittest.TestCase):
+    """Repeated self.copy() calls of a package() method over a big build folder. The number
+    of files can be changed with CONAN_BENCHMARK_FILES"""
+
+    def repeated_copies_test(self):
+        num_files = int(os.getenv("CONAN_BENCHMARK_FILES", "200000"))
+        build_folder = temp_folder()
+        _build_tree(build_folder, num_files)
+        copies = [dict(pattern="*.h", dst="include", src="include"),
+                  dict(pattern="*.a", dst="lib", keep_path=False),
+                  dict(pattern="*.so", dst="lib", keep_path=False),
+                  dict(pattern="*.dylib", dst="lib", keep_path=False),
+                  dict(pattern="*.lib", dst="lib", keep_path=False),
+                  dict(pattern="*.dll", dst="bin", keep_path=False),
+                  dict(pattern="*.pdb", dst="bin", keep_path=False),
+                  dict(pattern="*.exe", dst="bin", keep_path=False),
+                  dict(pattern="*.cmake", dst="cmake"),
+                  dict(pattern="LICENSE*", dst="licenses")]
+
+        results = {}
+        for reuse in (False, True):
+            package_folder = temp_folder()
+            copier = FileCopier([build_folder], package_folder)
+            start = time.time()
+            for kwargs in copies:
+                if not reuse:  # A new copier walks the tree again in every call
+                    copier = FileCopier([build_folder], package_folder)
+                copier(**kwargs)
+            results[reuse] = time.time() - start
+            self.assertEqual(len(os.listdir(os.path.join(package_folder, "lib"))),
+                             num_files // 50)
+
+        logger.info("%d files, %d copies: walking every time %.2fs, walking once %.2fs"
+                    % (num_files, len(copies), results[False], results[True]))
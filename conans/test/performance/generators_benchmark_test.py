@@ -0,0 +1,77 @@
+import os
+import time
+import unittest
+
+from mock import patch
+from nose.plugins.attrib import attr
+
+from conans.client.conf import default_settings_yml
+from conans.client.generators import registered_generators, write_generators
+from conans.model.build_info import CppInfo
+from conans.model.conan_file import ConanFile
+from conans.model.env_info import EnvValues
+from conans.model.settings import Settings
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestBufferConanOutput
+from conans.util.log import logger
+
+
+@attr("slow")
+@attr("performance")
+class GeneratorsBenchmarkTest(unittest.TestCase):
+    """The time of every registered generator for a consumer of many dependencies, and of
+    all of them running serially and in parallel. The number of dependencies can be changed
+    with CONAN_BENCHMARK_DEPS"""
+
+    def setUp(self):
+        num_deps = int(os.getenv("CONAN_BENCHMARK_DEPS", "500"))
+        settings = Settings.loads(default_settings_yml)
+        settings.os = "Windows"
+        settings.arch = "x86_64"
+        settings.build_type = "Release"
+        settings.compiler = "Visual Studio"
+        settings.compiler.version = "15"
+        settings.compiler.runtime = "MD"
+        self.conanfile = ConanFile(TestBufferConanOutput(), None)
+        self.conanfile.initialize(Settings({}), EnvValues())
+        self.conanfile.settings = settings
+        folder = temp_folder()
+        for i in range(num_deps):
+            cpp_info = CppInfo(os.path.join(folder, "pkg%d" % i))
+            cpp_info.name = "pkg%d" % i
+            cpp_info.version = "1.0"
+            cpp_info.filter_empty = False
+            cpp_info.libs = ["lib%d_%d" % (i, j) for j in range(5)]
+            cpp_info.defines = ["DEFINE%d_%d" % (i, j) for j in range(5)]
+            cpp_info.cxxflags = ["-flag%d" % i]
+            cpp_info.public_deps = ["pkg%d" % (i - 1)] if i else []
+            self.conanfile.deps_cpp_info.update(cpp_info, cpp_info.name)
+            self.conanfile.deps_user_info["pkg%d" % i].var = "value"
+        # The deploy generator copies the files of the packages and virtualbuildenv needs an
+        # installed Visual Studio
+        self.generators = [name for name in registered_generators.available
+                           if name not in ("deploy", "virtualbuildenv")]
+
+    def generators_test(self):
+        times = {}
+        for name in self.generators:
+            generator = registered_generators[name](self.conanfile)
+            generator.output_path = temp_folder()
+            start = time.time()
+            generator.content
+            times[name] = time.time() - start
+        for name, seconds in sorted(times.items(), key=lambda item: item[1], reverse=True):
+            logger.info("%s: %.3fs" % (name, seconds))
+
+    def parallel_generators_test(self):
+        self.conanfile.generators = self.generators
+        results = {}
+        for jobs in (1, 4):
+            folder = temp_folder()
+            with patch.dict("os.environ", {"CONAN_GENERATORS_JOBS": str(jobs)}):
+                start = time.time()
+                write_generators(self.conanfile, folder, TestBufferConanOutput())
+            results[jobs] = time.time() - start, sorted(os.listdir(folder))
+        self.assertEqual(results[1][1], results[4][1])
+        logger.info("%d generators: serially %.2fs, in 4 threads %.2fs"
+                    % (len(self.generators), results[1][0], results[4][0]))
@@ -0,0 +1,61 @@
+import os
+import platform
+import time
+
+from nose.plugins.attrib import attr
+
+from conans.model.ref import ConanFileReference
+from conans.test.functional.graph.graph_manager_base import GraphManagerTest
+from conans.test.utils.tools import GenConanfile
+from conans.util.log import logger
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _max_rss():
+    """ The peak resident memory of the process, in MB
+    """
+    if not resource:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 1e6 if platform.system() == "Darwin" else max_rss / 1e3
+
+
+@attr("slow")
+@attr("performance")
+class GraphBuildBenchmarkTest(GraphManagerTest):
+    """The time and memory to build the dependency graph of a consumer of 2000 packages, in
+    layers of 50 packages that require 3 packages of the previous one. The number of packages
+    can be changed with CONAN_BENCHMARK_NODES"""
+
+    def graph_test(self):
+        num_nodes = int(os.getenv("CONAN_BENCHMARK_NODES", "2000"))
+        layer_size = 50
+        refs = []
+        for i in range(num_nodes):
+            ref = ConanFileReference.loads("pkg%d/1.0@user/testing" % i)
+            conanfile = GenConanfile().with_name("pkg%d" % i).with_version("1.0")
+            layer = i // layer_size
+            if layer:
+                previous_layer = refs[(layer - 1) * layer_size: layer * layer_size]
+                for j in range(3):
+                    conanfile.with_require(previous_layer[(i + j) % layer_size])
+            self._cache_recipe(ref, conanfile)
+            refs.append(ref)
+        consumer = GenConanfile().with_name("app").with_version("1.0")
+        for ref in refs[-layer_size:]:
+            consumer.with_require(ref)
+
+        rss = _max_rss()
+        start = time.time()
+        deps_graph = self.build_graph(consumer, install=False)
+        seconds = time.time() - start
+        rss = _max_rss() - rss
+
+        self.assertEqual(len(deps_graph.nodes), num_nodes + 1)
+        public_deps = sum(len(node.public_deps) for node in deps_graph.nodes)
+        logger.info("%d nodes: %.2fs, peak RSS increase %.1f MB, %d public_deps entries"
+                    % (len(deps_graph.nodes), seconds, rss, public_deps))
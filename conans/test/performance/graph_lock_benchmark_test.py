@@ -0,0 +1,48 @@
+import json
+import os
+import time
+import unittest
+
+from nose.plugins.attrib import attr
+
+from conans.model.graph_lock import GraphLockFile
+from conans.model.ref import ConanFileReference
+from conans.util.log import logger
+
+
+@attr("slow")
+@attr("performance")
+class GraphLockBenchmarkTest(unittest.TestCase):
+    """The time to load, query, update and save a lockfile of 3000 packages, each of them
+    requiring the previous 5. The number of packages can be changed with CONAN_BENCHMARK_NODES"""
+
+    def lockfile_test(self):
+        num_nodes = int(os.getenv("CONAN_BENCHMARK_NODES", "3000"))
+        nodes = {}
+        for i in range(num_nodes):
+            requires = {"pkg%d/1.0@user/testing" % j: str(j) for j in range(max(0, i - 5), i)}
+            nodes[str(i)] = {"pref": "pkg%d/1.0@user/testing#rrev:package_id#prev" % i,
+                             "options": "shared=False\nfPIC=True", "requires": requires}
+        text = json.dumps({"profile_host": "[settings]\nos=Linux\n",
+                           "graph_lock": {"nodes": nodes}, "version": "0.1"}, indent=True)
+
+        start = time.time()
+        graph_lock_file = GraphLockFile.loads(text, revisions_enabled=True)
+        graph_lock = graph_lock_file.graph_lock
+        load_time = time.time() - start
+
+        start = time.time()
+        for i in range(num_nodes):
+            ref = ConanFileReference.loads("pkg%d/1.0@user/testing#rrev" % i)
+            self.assertEqual(graph_lock.get_node(ref), str(i))
+        self.assertEqual(graph_lock.root_node_ref(),
+                         ConanFileReference.loads("pkg%d/1.0@user/testing#rrev" % (num_nodes - 1)))
+        graph_lock.update_exported_ref("0", ConanFileReference.loads("pkg0/1.0@user/testing#new"))
+        self.assertEqual(len(graph_lock._closure_affected()), num_nodes - 1)
+        query_time = time.time() - start
+
+        start = time.time()
+        graph_lock_file.dumps()
+        save_time = time.time() - start
+        logger.info("%d nodes: load %.2fs, %d get_node() and closure %.2fs, save %.2fs"
+                    % (num_nodes, load_time, num_nodes, query_time, save_time))
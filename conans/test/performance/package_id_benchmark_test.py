@@ -0,0 +1,63 @@
+import os
+import time
+import unittest
+
+from nose.plugins.attrib import attr
+
+from conans.model.info import ConanInfo
+from conans.model.options import OptionsValues
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.model.values import Values
+from conans.util.log import logger
+
+
+def _package_ids(num_nodes, shared_requirements):
+    """ The package IDs, computed bottom-up as the GraphBinariesAnalyzer does, of a chain of 300
+    packages, each one requiring the previous 3, and num_nodes packages that require the last 3
+    of the chain, so all of them have ~300 indirect requirements
+    """
+    settings = Values.loads("os=Linux\narch=x86_64\nbuild_type=Release")
+    options = OptionsValues.loads("shared=False\nfPIC=True")
+    chain, chain_infos = [], []
+    package_ids = []
+
+    def compute(name, direct, upstream_infos):
+        indirect = set()
+        for info in upstream_infos:
+            indirect.update(info.requires.refs())
+        indirect.difference_update(direct)
+        info = ConanInfo.create(settings, options, direct, indirect, "full_package_mode",
+                                shared_requirements=shared_requirements)
+        ref = ConanFileReference.loads("%s/1.0@user/testing#rrev" % name)
+        pref = PackageReference(ref, info.package_id(), "prev")
+        package_ids.append(pref.id)
+        return pref, info
+
+    for i in range(300):
+        pref, info = compute("chain%d" % i, chain[-3:], chain_infos[-3:])
+        chain.append(pref)
+        chain_infos.append(info)
+    for i in range(num_nodes):
+        compute("pkg%d" % i, chain[-3:], chain_infos[-3:])
+    return package_ids
+
+
+@attr("slow")
+@attr("performance")
+class PackageIDBenchmarkTest(unittest.TestCase):
+    """The time to compute the package IDs of a graph where every package has ~300 indirect
+    requirements, with and without sharing the requirements hashed for the upstream packages.
+    The number of packages can be changed with CONAN_BENCHMARK_NODES"""
+
+    def package_id_test(self):
+        num_nodes = int(os.getenv("CONAN_BENCHMARK_NODES", "500"))
+        results = {}
+        for name, shared in (("not shared", None), ("shared", {})):
+            start = time.time()
+            package_ids = _package_ids(num_nodes, shared)
+            results[name] = time.time() - start, package_ids
+
+        self.assertEqual(results["not shared"][1], results["shared"][1])
+        for name, (seconds, _) in results.items():
+            logger.info("%d package IDs, %s requirements: %.2fs"
+                        % (num_nodes + 300, name, seconds))
@@ -0,0 +1,50 @@
+import time
+import unittest
+from datetime import timedelta
+
+from nose.plugins.attrib import attr
+
+from conans.model.ref import ConanFileReference
+from conans.server.crypto.jwt.jwt_credentials_manager import JWTCredentialsManager
+from conans.server.rest.bottle_plugins.jwt_authentication import JWTAuthentication
+from conans.server.service.authorize import BasicAuthorizer
+from conans.util.log import logger
+
+
+def _per_call(func, repetitions):
+    start = time.time()
+    for _ in range(repetitions):
+        func()
+    return (time.time() - start) / repetitions
+
+
+@attr("slow")
+@attr("performance")
+class ServerAuthBenchmarkTest(unittest.TestCase):
+    """Measures the authentication + authorization overhead of a single server request"""
+
+    def auth_per_request_test(self):
+        read_perms = [("pkg%d/*@user/channel" % i, "user%d, other" % i) for i in range(500)]
+        read_perms.append(("*/*@*/*", "*"))
+        authorizer = BasicAuthorizer(read_perms, [])
+        ref = ConanFileReference.loads("pkg250/1.0@user/channel")
+
+        uncached = JWTAuthentication(JWTCredentialsManager("secret", timedelta(minutes=5),
+                                                           cache_size=0))
+        cached = JWTAuthentication(JWTCredentialsManager("secret", timedelta(minutes=5)))
+        token = cached.manager.get_token_for("user250")
+
+        def request(plugin):
+            username = plugin.parse_authorization_value(token)["auth_user"]
+            authorizer.check_read_conan(username, ref)
+            return username
+
+        self.assertEqual(request(uncached), "user250")
+        self.assertEqual(request(cached), "user250")
+
+        repetitions = 2000
+        without_cache = _per_call(lambda: request(uncached), repetitions)
+        with_cache = _per_call(lambda: request(cached), repetitions)
+        logger.info("Auth per request: %.2f us (verifying the token), "
+                    "%.2f us (verified tokens cache)"
+                    % (without_cache * 1e6, with_cache * 1e6))
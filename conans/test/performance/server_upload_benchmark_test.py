@@ -0,0 +1,55 @@
+import os
+import time
+import unittest
+from datetime import timedelta
+
+from bottle import BaseRequest
+from nose.plugins.attrib import attr
+
+from conans.server.crypto.jwt.jwt_updown_manager import JWTUpDownAuthManager
+from conans.server.rest.body_stream import get_body_stream
+from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.test.utils.test_files import temp_folder
+from conans.util.log import logger
+
+MB = 1024 * 1024
+
+
+class _GeneratedInput(object):
+    """WSGI input of 'size' bytes generated on the fly, so multi-GB uploads can be measured
+    without having them in memory or disk"""
+
+    def __init__(self, size):
+        self._remaining = size
+        self._block = os.urandom(MB)
+
+    def read(self, size=-1):
+        size = self._remaining if size is None or size < 0 else min(size, self._remaining)
+        self._remaining -= size
+        if size <= len(self._block):
+            return self._block[:size]
+        return (self._block * (size // len(self._block) + 1))[:size]
+
+
+@attr("slow")
+@attr("performance")
+class ServerUploadBenchmarkTest(unittest.TestCase):
+    """Upload throughput of the server: request body streamed to the storage adapter.
+    The size of the upload can be changed with CONAN_BENCHMARK_UPLOAD_MB"""
+
+    def upload_throughput_test(self):
+        size = int(os.getenv("CONAN_BENCHMARK_UPLOAD_MB", "8")) * MB
+        storage = temp_folder()
+        path = os.path.join(storage, "lib/1.0/_/_/rrev/package/id/prev/conan_package.tgz")
+        updown_manager = JWTUpDownAuthManager("secret", timedelta(seconds=200))
+        for buffer_size in (64 * 1024, MB, 8 * MB):
+            adapter = ServerDiskAdapter("http://fake", storage, updown_manager,
+                                        buffer_size=buffer_size)
+            request = BaseRequest({"wsgi.input": _GeneratedInput(size),
+                                   "REQUEST_METHOD": "PUT", "CONTENT_LENGTH": str(size)})
+            start = time.time()
+            checksums = adapter.put_file(path, get_body_stream(request))
+            elapsed = time.time() - start
+            self.assertEqual(checksums["size"], size)
+            logger.info("Upload %d MB, buffer %d KB: %.1f MB/s"
+                        % (size // MB, buffer_size // 1024, size / MB / elapsed))
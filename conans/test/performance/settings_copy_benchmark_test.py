@@ -0,0 +1,69 @@
+import os
+import time
+import unittest
+
+from nose.plugins.attrib import attr
+
+from conans.client.conf import default_settings_yml
+from conans.model.settings import Settings
+from conans.util.log import logger
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+
+def _full_copy(settings):
+    """ A copy of the whole settings tree, like the copies before they were copy-on-write """
+    result = settings.copy()
+    _own_all(result)
+    return result
+
+
+def _own_all(settings):
+    settings._own()
+    for item in settings._data.values():
+        item._own()
+        if not item.is_final:
+            for subsettings in item._definition.values():
+                _own_all(subsettings)
+
+
+@attr("slow")
+@attr("performance")
+class SettingsCopyBenchmarkTest(unittest.TestCase):
+    """The settings of every conanfile of a big graph: a copy of the profile settings, constrained
+    to the ones declared by the conanfile. The number of conanfiles can be changed with
+    CONAN_BENCHMARK_NODES"""
+
+    def copies_test(self):
+        num_nodes = int(os.getenv("CONAN_BENCHMARK_NODES", "1000"))
+        profile_settings = Settings.loads(default_settings_yml)
+        profile_settings.values_list = [("os", "Linux"), ("arch", "x86_64"),
+                                        ("compiler", "gcc"), ("compiler.version", "7"),
+                                        ("compiler.libcxx", "libstdc++11"),
+                                        ("build_type", "Release")]
+
+        results = {}
+        for name, copy in (("full copies", _full_copy), ("copy-on-write", Settings.copy)):
+            if tracemalloc:
+                tracemalloc.start()
+            start = time.time()
+            conanfiles_settings = []
+            for _ in range(num_nodes):
+                settings = copy(profile_settings)
+                settings.constraint(["os", "arch", "compiler", "build_type"])
+                settings.compiler.version.value  # Accesses modify the settings
+                conanfiles_settings.append(settings)
+            values = [s.values_list for s in conanfiles_settings]
+            seconds = time.time() - start
+            peak = tracemalloc.get_traced_memory()[1] / 1e6 if tracemalloc else 0
+            if tracemalloc:
+                tracemalloc.stop()
+            results[name] = seconds, peak, values
+
+        self.assertEqual(results["full copies"][2], results["copy-on-write"][2])
+        for name, (seconds, peak, _) in results.items():
+            logger.info("%d conanfiles, %s: %.2fs, peak memory %.1f MB"
+                        % (num_nodes, name, seconds, peak))
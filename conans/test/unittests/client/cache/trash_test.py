@@ -0,0 +1,49 @@
+import errno
+import os
+import unittest
+
+from mock import patch
+
+from conans.client.cache.trash import Trash
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+class TrashTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = temp_folder()
+        self.trash = Trash(os.path.join(self.folder, "trash"))
+
+    def _folder(self, name):
+        path = os.path.join(self.folder, name)
+        save(os.path.join(path, "sub", "file.txt"), "contents")
+        return path
+
+    def move_and_empty_test(self):
+        paths = [self._folder("folder%d" % i) for i in range(3)]
+        for path in paths:
+            self.trash.move(path)
+            self.assertFalse(os.path.exists(path))
+        self.trash.move(os.path.join(self.folder, "missing"))
+        self.assertEqual(len(self.trash.moved), 3)
+        self.assertEqual(sorted(os.listdir(self.trash.folder)),
+                         sorted(os.path.basename(p) for p in self.trash.moved))
+
+        self.assertEqual(self.trash.empty(self.trash.moved[:1], jobs=2), [])
+        self.assertEqual(len(os.listdir(self.trash.folder)), 2)
+        self.assertEqual(self.trash.empty(), [])
+        self.assertEqual(os.listdir(self.trash.folder), [])
+
+    def other_filesystem_test(self):
+        path = self._folder("folder")
+        with patch("os.rename", side_effect=OSError(errno.EXDEV, "Cross-device link")):
+            self.trash.move(path)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(self.trash.moved, [])
+
+    def not_removed_test(self):
+        self.trash.move(self._folder("folder"))
+        with patch("conans.client.cache.trash.rmdir", side_effect=OSError("busy")):
+            self.assertEqual(self.trash.empty(), self.trash.moved)
+        self.assertEqual(self.trash.empty(), [])
@@ -5,7 +5,7 @@ import unittest
 
 from conans.client.file_copier import FileCopier
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import load, save
+from conans.util.files import load, save, walk
 
 
 class FileCopierTest(unittest.TestCase):
@@ -200,3 +200,43 @@ class FileCopierTest(unittest.TestCase):
             copier("*", src=os.path.join(src_folder, "sub"))
 
         self.assertEqual(copy2_mock.call_count, len(src_folders))
+
+    def reuse_walked_tree_test(self):
+        src_folder = temp_folder()
+        save(os.path.join(src_folder, "include/hello.h"), "")
+        save(os.path.join(src_folder, "include/detail/impl.h"), "")
+        save(os.path.join(src_folder, "lib/hello.a"), "")
+        save(os.path.join(src_folder, "test/test.h"), "")
+
+        dst_folder = temp_folder()
+        copier = FileCopier([src_folder], dst_folder)
+        with mock.patch("conans.client.file_copier.walk", side_effect=walk) as walk_mock:
+            copier("*.h", dst="include", src="include")
+            copier("*.a", dst="lib", keep_path=False)
+            copier("*.h", excludes="test")
+            copier("*.h", dst="detail", src="include/detail")
+            self.assertEqual(walk_mock.call_count, 2)  # The subfolder first, then the root
+        self.assertEqual(sorted(os.listdir(os.path.join(dst_folder, "include"))),
+                         ["detail", "hello.h"])
+        self.assertEqual(os.listdir(os.path.join(dst_folder, "lib")), ["hello.a"])
+        self.assertEqual(os.listdir(os.path.join(dst_folder, "detail")), ["impl.h"])
+        self.assertFalse(os.path.exists(os.path.join(dst_folder, "test")))
+
+    def walked_tree_changes_test(self):
+        src_folder = temp_folder()
+        save(os.path.join(src_folder, "include/hello.h"), "")
+
+        dst_folder = temp_folder()
+        copier = FileCopier([src_folder], dst_folder)
+        copier("*.h")
+        # Files added, also in the same second than the previous walk
+        save(os.path.join(src_folder, "include/bye.h"), "")
+        save(os.path.join(src_folder, "include/detail/impl.h"), "")
+        copier("*.h", dst="other")
+        self.assertEqual(sorted(os.listdir(os.path.join(dst_folder, "other/include"))),
+                         ["bye.h", "detail", "hello.h"])
+
+        os.remove(os.path.join(src_folder, "include/bye.h"))
+        copier("*.h", dst="again")
+        self.assertEqual(sorted(os.listdir(os.path.join(dst_folder, "again/include"))),
+                         ["detail", "hello.h"])
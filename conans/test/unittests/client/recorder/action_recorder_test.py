@@ -97,3 +97,14 @@ class ActionRecorderTest(unittest.TestCase):
         self.assertTrue(third_installed["packages"][0]["built"])
         self.assertIsNone(third_installed["packages"][0]["remote"])
         self.assertEqual(str(third_installed["packages"][0]["id"]), "3")
+
+    def package_timing_test(self):
+        tracer = ActionRecorder()
+        tracer.recipe_fetched_from_cache(self.ref1)
+        tracer.package_fetched_from_cache(self.pref1)
+        tracer.package_timing(self.pref1, "package_info", 0.5)
+        tracer.package_timing(self.pref1, "package_info", 0.25)
+        tracer.package_timing(self.pref1, "install", 1)
+
+        package = tracer.get_info(False)["installed"][0]["packages"][0]
+        self.assertEqual(package["timing"], {"package_info": 0.75, "install": 1})
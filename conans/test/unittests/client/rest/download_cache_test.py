@@ -0,0 +1,186 @@
+import os
+import time
+import unittest
+
+import fasteners
+import six
+from mock import patch
+
+from conans.client.rest.download_cache import DownloadCache, checksum_key, url_key
+from conans.client.tools import net
+from conans.errors import ConanException
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestBufferConanOutput
+from conans.util.files import load, save, sha256sum
+
+
+class _Response(object):
+    ok = True
+    status_code = 200
+
+    def __init__(self, content):
+        self.content = content
+        self.headers = {"content-length": len(content)}
+
+    def iter_content(self, size):
+        for i in range(0, len(self.content), size):
+            yield self.content[i:i + size]
+
+    def close(self):
+        pass
+
+
+class _Requester(object):
+    retry = 0
+    retry_wait = 0
+
+    def __init__(self, content):
+        self.content = content
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return _Response(self.content)
+
+
+class DownloadCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = temp_folder()
+        self.cache = DownloadCache(os.path.join(self.folder, "cache"))
+        self.downloads = []
+
+    def _download_func(self, content):
+        def download(path):
+            self.downloads.append(path)
+            save(path, content)
+        return download
+
+    def keys_test(self):
+        self.assertEqual(checksum_key(md5="MD5", sha1="sha1"), "sha1-sha1")
+        self.assertEqual(checksum_key(md5="md5", sha256="sha256"), "sha256-sha256")
+        self.assertIsNone(checksum_key())
+        self.assertNotEqual(url_key("http://remote/file"), url_key("http://remote/file2"))
+
+    def hit_test(self):
+        key = url_key("http://remote/file")
+        first, second = os.path.join(self.folder, "first"), os.path.join(self.folder, "second")
+        self.cache.download(key, first, self._download_func("content"))
+        self.cache.download(key, second, self._download_func("other"))
+        self.assertEqual(self.downloads, [first])
+        self.assertEqual(load(second), "content")
+
+    def wrong_checksum_test(self):
+        path = os.path.join(self.folder, "file")
+        save(path, "content")
+        key = checksum_key(sha256=sha256sum(path))
+        os.remove(path)
+
+        self.cache.download(key, path, self._download_func("corrupted"))
+        os.remove(path)
+        self.cache.download(key, path, self._download_func("content"))
+        os.remove(path)
+        self.cache.download(key, path, self._download_func("content"))
+        self.assertEqual(len(self.downloads), 2)
+        self.assertEqual(load(path), "content")
+
+    def lru_eviction_test(self):
+        cache = DownloadCache(os.path.join(self.folder, "cache"), max_size=25)
+        paths = {}
+        for name in ("a", "b", "c"):
+            paths[name] = os.path.join(self.folder, name)
+            cache.download(url_key(name), paths[name], self._download_func(name * 10))
+            mtime = time.time() - 100 + len(paths)
+            os.utime(cache._path(url_key(name)), (mtime, mtime))
+        # The first file was removed to make room for the third one
+        self.assertFalse(os.path.exists(cache._path(url_key("a"))))
+        self.assertTrue(os.path.exists(cache._path(url_key("b"))))
+
+        # Using "b" makes "c" the least recently used one
+        os.remove(paths["b"])
+        cache.download(url_key("b"), paths["b"], self._download_func("b" * 10))
+        os.remove(paths["a"])
+        cache.download(url_key("a"), paths["a"], self._download_func("a" * 10))
+        self.assertFalse(os.path.exists(cache._path(url_key("c"))))
+        self.assertTrue(os.path.exists(cache._path(url_key("b"))))
+        self.assertEqual(len(self.downloads), 4)
+
+    def eviction_in_use_test(self):
+        for name in ("a", "b"):
+            self.cache.download(url_key(name), os.path.join(self.folder, name),
+                                self._download_func(name * 10))
+        cache = DownloadCache(os.path.join(self.folder, "cache"), max_size=15)
+        acquire = fasteners.InterProcessLock.acquire
+
+        def in_use(lock, blocking=True, *args, **kwargs):
+            # Every file is in use by other processes, the size counter is not
+            return acquire(lock, blocking, *args, **kwargs) if blocking else False
+
+        with patch("fasteners.InterProcessLock.acquire", in_use):
+            cache._evict()
+        self.assertTrue(os.path.exists(cache._path(url_key("a"))))
+        self.assertTrue(os.path.exists(cache._path(url_key("b"))))
+        cache._evict()
+        self.assertEqual(len([key for key in ("a", "b")
+                              if os.path.exists(cache._path(url_key(key)))]), 1)
+
+    def size_counter_test(self):
+        cache = DownloadCache(os.path.join(self.folder, "cache"), max_size=100)
+        with patch.object(cache, "_entries", wraps=cache._entries) as entries:
+            for name in ("a", "b", "c"):
+                cache.download(url_key(name), os.path.join(self.folder, name),
+                               self._download_func(name * 10))
+            # The size is only counted from the files the first time, not in every download
+            self.assertEqual(entries.call_count, 1)
+        self.assertEqual(load(os.path.join(self.folder, "cache", "size")), "30")
+
+        # A corrupted counter is counted again from the cached files
+        save(os.path.join(self.folder, "cache", "size"), "corrupted")
+        cache.download(url_key("d"), os.path.join(self.folder, "d"), self._download_func("d" * 10))
+        self.assertEqual(load(os.path.join(self.folder, "cache", "size")), "40")
+
+        # The eviction leaves room for the next downloads
+        cache = DownloadCache(os.path.join(self.folder, "cache"), max_size=45)
+        cache.download(url_key("e"), os.path.join(self.folder, "e"), self._download_func("e" * 10))
+        self.assertEqual(load(os.path.join(self.folder, "cache", "size")), "30")
+
+
+class ToolsDownloadCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = temp_folder()
+        self.requester = _Requester(b"archive content")
+        save(os.path.join(self.folder, "expected"), "archive content")
+        self.sha256 = sha256sum(os.path.join(self.folder, "expected"))
+        self.env = {"CONAN_DOWNLOAD_CACHE": os.path.join(self.folder, "cache")}
+
+    def _download(self, filename, **kwargs):
+        net.download("http://server/archive.tgz", os.path.join(self.folder, filename),
+                     out=TestBufferConanOutput(), requester=self.requester, **kwargs)
+
+    def checksum_test(self):
+        with patch.dict("os.environ", self.env):
+            self._download("file1", sha256=self.sha256)
+            self._download("file2", sha256=self.sha256.upper())
+        self.assertEqual(len(self.requester.urls), 1)
+        self.assertEqual(load(os.path.join(self.folder, "file2")), "archive content")
+
+    def no_checksum_test(self):
+        # The contents of an arbitrary URL can change, they are only cached by checksum
+        with patch.dict("os.environ", self.env):
+            self._download("file1")
+            self._download("file2")
+        self.assertEqual(len(self.requester.urls), 2)
+
+    def disabled_test(self):
+        self._download("file1", sha256=self.sha256)
+        self._download("file2", sha256=self.sha256)
+        self.assertEqual(len(self.requester.urls), 2)
+        self.assertFalse(os.path.exists(self.env["CONAN_DOWNLOAD_CACHE"]))
+
+    def wrong_checksum_test(self):
+        with patch.dict("os.environ", self.env):
+            for filename in ("file1", "file2"):
+                with six.assertRaisesRegex(self, ConanException, "sha256 signature failed"):
+                    self._download(filename, sha256="1234")
+        self.assertEqual(len(self.requester.urls), 2)
@@ -0,0 +1,34 @@
+# coding=utf-8
+
+import unittest
+
+from mock import patch
+
+from conans.client.rest.rest_client_v2 import RestV2Methods
+from conans.client.rest.uploader_downloader import FileDownloader
+from conans.model.ref import PackageReference
+from conans.paths import PACKAGE_TGZ_NAME
+from conans.test.utils.test_files import temp_folder
+
+
+class DownloadCacheKeyTestCase(unittest.TestCase):
+
+    def _cache_keys(self, pref):
+        v2 = RestV2Methods("http://some.url", token=None, custom_headers=None, output=None,
+                           requester=None, verify_ssl=None)
+        files = {"files": {PACKAGE_TGZ_NAME: {}, "conaninfo.txt": {}, "conanmanifest.txt": {}}}
+        with patch.object(RestV2Methods, "_get_file_list_json", return_value=files), \
+             patch.object(FileDownloader, "download") as download:
+            v2.get_package(PackageReference.loads(pref), temp_folder())
+        return [call[1]["cache_key"] for call in download.call_args_list]
+
+    def test_revisions(self):
+        keys = self._cache_keys("lib/1.0@user/channel#rrev:123#prev")
+        self.assertEqual(len(keys), 3)
+        self.assertTrue(all(keys))
+        self.assertEqual(len(set(keys)), 3)
+
+    def test_default_revision(self):
+        # The files of the revision "0" are overwritten by every upload without revisions
+        self.assertEqual(self._cache_keys("lib/1.0@user/channel#0:123#prev"), [None] * 3)
+        self.assertEqual(self._cache_keys("lib/1.0@user/channel#rrev:123#0"), [None] * 3)
@@ -1,13 +1,15 @@
+import hashlib
 import tempfile
 import unittest
 from collections import namedtuple
 
 import six
+from mock import patch
 
 from conans.client.rest.uploader_downloader import FileUploader
 from conans.errors import AuthenticationException, ForbiddenException
 from conans.test.utils.tools import TestBufferConanOutput
-from conans.util.files import save
+from conans.util.files import save, sha1sum
 
 
 class UploaderUnitTest(unittest.TestCase):
@@ -61,3 +63,51 @@ class UploaderUnitTest(unittest.TestCase):
         save(f, "some contents")
         with six.assertRaisesRegex(self, ForbiddenException, "tururu"):
             uploader.upload("fake_url", f, auth=auth)
+
+    def test_upload_chunks(self):
+        test = self
+
+        class MockRequester(object):
+            retry = 0
+            retry_wait = 0
+
+            def __init__(self):
+                self.requests = []
+
+            def put(self, url, data, headers, **kwargs):
+                chunks = []
+                if data:
+                    test.assertEqual(len(data), 2500)
+                    while True:
+                        chunk = data.read(8192)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                self.requests.append((dict(headers), chunks))
+                response = namedtuple("response", "status_code content raise_for_status")
+                return response(201 if data else 404, "", lambda: None)
+
+        out = TestBufferConanOutput()
+        f = tempfile.mktemp()
+        save(f, "a" * 2500)
+        sha1 = hashlib.sha1(b"a" * 2500).hexdigest()
+
+        requester = MockRequester()
+        uploader = FileUploader(requester, out, verify=False, chunk_size=1000)
+        with patch("conans.client.rest.uploader_downloader.sha1sum",
+                   side_effect=sha1sum) as sha1_mock:
+            uploader.upload("fake_url", f, dedup=True)
+        # The checksum is computed once for the checksum deploy and the upload
+        self.assertEqual(sha1_mock.call_count, 1)
+        (dedup_headers, dedup_chunks), (headers, chunks) = requester.requests
+        self.assertEqual(dedup_headers["X-Checksum-Sha1"], sha1)
+        self.assertEqual(dedup_chunks, [])
+        self.assertEqual(headers["X-Checksum-Sha1"], sha1)
+        self.assertEqual([len(c) for c in chunks], [1000, 1000, 500])
+
+        with patch.dict("os.environ", {"CONAN_UPLOAD_CHUNK_SIZE": "2000"}):
+            uploader = FileUploader(requester, out, verify=False)
+        self.assertEqual(uploader.chunk_size, 2000)
+        requester.requests = []
+        uploader.upload("fake_url", f)
+        self.assertEqual([len(c) for c in requester.requests[0][1]], [2000, 500])
@@ -28,7 +28,7 @@ class RunSCMTest(unittest.TestCase):
         conanfile.scm = {'type': 'git', 'url': 'auto', 'revision': 'auto'}
 
         # Mock functions called from inside _run_scm (tests will be here)
-        def merge_directories(src, dst, excluded=None):
+        def merge_directories(src, dst, excluded=None, strategies=None):
             self.assertEqual(src, local_sources_path)
             self.assertEqual(dst, self.src_folder)
 
@@ -88,7 +88,7 @@ class RunSCMTest(unittest.TestCase):
         conanfile.scm = {'type': 'git', 'url': 'auto', 'revision': 'auto'}
 
         # Mock functions called from inside _run_scm (tests will be here)
-        def merge_directories(src, dst, excluded=None):
+        def merge_directories(src, dst, excluded=None, strategies=None):
             src = os.path.normpath(src)
             dst = os.path.normpath(dst)
             self.assertEqual(src.replace('\\', '/'), local_sources_path)
@@ -3,7 +3,7 @@ import unittest
 from collections import defaultdict, namedtuple
 
 from conans.client.generators import TXTGenerator
-from conans.model.build_info import CppInfo, DepsCppInfo
+from conans.model.build_info import CppInfo, DepsCppInfo, merge_lists
 from conans.model.env_info import DepsEnvInfo, EnvInfo
 from conans.model.user_info import DepsUserInfo
 from conans.test.utils.test_files import temp_folder
@@ -181,3 +181,38 @@ VAR2=23
         deps_cpp_info = DepsCppInfo()
         deps_cpp_info.update(info, "myname")
         self.assertIn("MyName", deps_cpp_info["myname"].name)
+
+    def merge_lists_test(self):
+        def merge_one_by_one(seqs, append):
+            merged = []
+            for seq in seqs:
+                if append:
+                    merged = [s for s in merged if s not in seq] + seq
+                else:
+                    merged = [s for s in seq if s not in merged] + merged
+            return merged
+
+        seqs = [["a", "b", "a"], ["c", "b"], [], ["d", "a", "d"], ["b", "e"]]
+        for append in (True, False):
+            self.assertEqual(merge_lists(seqs, append), merge_one_by_one(seqs, append))
+        self.assertEqual(merge_lists(seqs), ["c", "d", "a", "d", "b", "e"])
+        self.assertEqual(merge_lists(seqs, append=False), ["e", "d", "d", "c", "a", "b", "a"])
+        # Unhashable values are merged too
+        self.assertEqual(merge_lists([[["a"]], [["b"], ["a"]]]), [["b"], ["a"]])
+
+    def deps_cpp_info_update_test(self):
+        deps_cpp_info = DepsCppInfo()
+        for name in ("zlib", "openssl", "curl"):
+            info = CppInfo(temp_folder())
+            info.libs = [name, "common"]
+            info.defines = ["%s_DEFINE" % name.upper(), "COMMON"]
+            info.debug.libs = ["%sd" % name]
+            deps_cpp_info.update(info, name)
+            if name == "zlib":
+                self.assertEqual(deps_cpp_info.libs, ["zlib", "common"])
+        self.assertEqual(deps_cpp_info.libs, ["zlib", "openssl", "curl", "common"])
+        self.assertEqual(deps_cpp_info.defines,
+                         ["CURL_DEFINE", "OPENSSL_DEFINE", "ZLIB_DEFINE", "COMMON"])
+        self.assertEqual(deps_cpp_info.debug.libs, ["zlibd", "openssld", "curld"])
+        deps_cpp_info.libs = ["other"]
+        self.assertEqual(deps_cpp_info.libs, ["other"])
@@ -145,3 +145,22 @@ class EnvInfoTest(unittest.TestCase):
         self.assertEqual(env.vars, {"foo": ["var", "var2", "new_value"],
                                      "foo2": "var4", "foo3": ["var3"],
                                      "foo63": "other"})
+
+    def update_all_test(self):
+        env_infos = []
+        for i, values in enumerate((["a", "b"], "c", ["b", "d"], "a", ["e"])):
+            env_info = EnvInfo()
+            env_info.PATH = values
+            env_info.NAME = "pkg%d" % i
+            env_infos.append((env_info, "pkg%d" % i))
+
+        env = DepsEnvInfo()
+        for env_info, pkg_name in env_infos:
+            env.update(env_info, pkg_name)
+        env_all = DepsEnvInfo()
+        env_all.update_all(env_infos)
+
+        self.assertEqual(env.vars, {"PATH": ["c", "b", "d", "a", "e"], "NAME": "pkg0"})
+        self.assertEqual(env_all.vars, env.vars)
+        self.assertEqual(env_all.deps, env.deps)
+        self.assertEqual(env_infos[0][0].vars["PATH"], ["a", "b"])
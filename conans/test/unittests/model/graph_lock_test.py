@@ -0,0 +1,61 @@
+import json
+import unittest
+
+import six
+
+from conans.errors import ConanException
+from conans.model.graph_lock import GraphLock, GraphLockFile
+from conans.model.profile import Profile
+from conans.model.ref import ConanFileReference
+
+
+class GraphLockTest(unittest.TestCase):
+
+    def setUp(self):
+        # app -> lib1 -> zlib/1.0, app -> lib2 -> zlib/1.0, app -> zlib/1.1 (private)
+        nodes = {"0": {"pref": None, "options": "", "path": "conanfile.txt",
+                       "requires": {"lib1/1.0@user/testing": "1", "lib2/1.0@user/testing": "2",
+                                    "zlib/1.1@user/testing": "4"}},
+                 "1": {"pref": "lib1/1.0@user/testing:id1", "options": "shared=True",
+                       "requires": {"zlib/1.0@user/testing": "3"}},
+                 "2": {"pref": "lib2/1.0@user/testing:id2", "options": "",
+                       "requires": {"zlib/1.0@user/testing": "3"}},
+                 "3": {"pref": "zlib/1.0@user/testing:id3", "options": ""},
+                 "4": {"pref": "zlib/1.1@user/testing:id4", "options": ""}}
+        self.graph_lock = GraphLock.from_dict({"nodes": nodes})
+
+    def get_node_test(self):
+        self.assertEqual(self.graph_lock.get_node(None), "0")
+        ref = ConanFileReference.loads("lib1/1.0@user/testing")
+        self.assertEqual(self.graph_lock.get_node(ref), "1")
+        # By name, if the version is not found
+        lib2 = ConanFileReference.loads("lib2/2.0@user/testing")
+        self.assertEqual(self.graph_lock.get_node(lib2), "2")
+        zlib = ConanFileReference.loads("zlib/2.0@user/testing")
+        with six.assertRaisesRegex(self, ConanException, "There are 2 binaries with name zlib"):
+            self.graph_lock.get_node(zlib)
+        other = ConanFileReference.loads("other/1.0@user/testing")
+        with six.assertRaisesRegex(self, ConanException, "Couldn't find 'other/1.0@user/testing'"):
+            self.graph_lock.get_node(other)
+
+        # The indexes are updated with the changes of the nodes
+        self.graph_lock.update_exported_ref("1", ref.copy_with_rev("rev1"))
+        self.assertEqual(self.graph_lock.get_node(ref.copy_with_rev("rev1")), "1")
+
+    def root_node_ref_test(self):
+        self.assertEqual(self.graph_lock.root_node_ref(), "conanfile.txt")
+
+    def closure_affected_test(self):
+        self.assertEqual(self.graph_lock._closure_affected(), set())
+        self.graph_lock.update_exported_ref("3", ConanFileReference.loads(
+            "zlib/1.0@user/testing#rev"))
+        self.assertEqual(self.graph_lock._closure_affected(), {"0", "1", "2"})
+
+    def lockfile_test(self):
+        lockfile = GraphLockFile(Profile(), self.graph_lock)
+        text = lockfile.dumps()
+        self.assertEqual(json.loads(text)["graph_lock"], self.graph_lock.as_dict())
+        graph_lock = GraphLockFile.loads(text, revisions_enabled=False).graph_lock
+        self.assertEqual(graph_lock.as_dict(), self.graph_lock.as_dict())
+        self.assertEqual(graph_lock._nodes["1"].options.dumps(), "shared=True")
+        self.assertEqual(graph_lock.as_dict(), self.graph_lock.as_dict())
@@ -505,3 +505,30 @@ os: [Windows, Linux]
 
         self.sut.compiler.arch.speed = "D"
         self.assertEqual(self.sut.compiler.arch.speed, "D")
+
+    def copy_on_write_test(self):
+        self.sut.compiler = "gcc"
+        self.sut.compiler.arch = "x86"
+        copied = self.sut.copy()
+        copied.compiler.version = "4.9"
+        copied.compiler.arch = "x64"
+        copied.compiler.arch.speed = "C"
+        copied.compiler.remove("Visual Studio")
+        del copied.os
+        self.assertEqual(copied.values_list, [("compiler", "gcc"), ("compiler.arch", "x64"),
+                                              ("compiler.arch.speed", "C"),
+                                              ("compiler.version", "4.9")])
+        self.assertEqual(copied.compiler.values_range, ["gcc"])
+
+        # The original settings didn't change
+        self.assertEqual(self.sut.values_list, [("compiler", "gcc"), ("compiler.arch", "x86")])
+        self.assertEqual(self.sut.compiler.values_range, ["Visual Studio", "gcc"])
+        self.assertEqual(self.sut.fields, ["compiler", "os"])
+
+        # Neither do the copies when the original is modified
+        other = self.sut.copy()
+        self.sut.compiler.arch.speed = "A"
+        self.sut.constraint({"compiler": {"gcc": None}})
+        self.assertEqual(other.values_list, [("compiler", "gcc"), ("compiler.arch", "x86")])
+        self.assertEqual(other.fields, ["compiler", "os"])
+        self.assertEqual(other.compiler.values_range, ["Visual Studio", "gcc"])
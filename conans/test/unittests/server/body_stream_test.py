@@ -0,0 +1,53 @@
+import unittest
+
+import six
+from bottle import BaseRequest
+
+from conans.errors import RequestErrorException
+from conans.server.rest.body_stream import RequestBodyStream, get_body_stream
+
+
+class BodyStreamTest(unittest.TestCase):
+
+    def _request(self, body, headers=None):
+        environ = {"wsgi.input": six.BytesIO(body), "REQUEST_METHOD": "PUT",
+                   "CONTENT_LENGTH": str(len(body))}
+        for name, value in (headers or {}).items():
+            environ["HTTP_%s" % name.upper().replace("-", "_")] = value
+        return BaseRequest(environ)
+
+    def stream_test(self):
+        request = self._request(b"0123456789")
+        # The input can contain more data than the body (keep-alive connections)
+        request.environ["wsgi.input"] = six.BytesIO(b"0123456789NEXTREQUEST")
+        stream = get_body_stream(request)
+        self.assertIsInstance(stream, RequestBodyStream)
+        self.assertEqual(stream.read(4), b"0123")
+        self.assertEqual(stream.read(), b"456789")
+        self.assertEqual(stream.read(4), b"")
+        # Nothing has been buffered by bottle
+        self.assertNotIn("bottle.request.body", request.environ)
+
+    def truncated_body_test(self):
+        request = self._request(b"0123456789")
+        request.environ["CONTENT_LENGTH"] = "1000"  # The client disconnected
+        stream = get_body_stream(request)
+        self.assertEqual(stream.read(), b"0123456789")
+        with six.assertRaisesRegex(self, RequestErrorException,
+                                   "Incomplete request body, 990 bytes missing"):
+            stream.read()
+
+    def already_read_body_test(self):
+        request = self._request(b"0123456789")
+        self.assertEqual(request.body.read(), b"0123456789")
+        request.body.seek(0)
+        stream = get_body_stream(request)
+        self.assertNotIsInstance(stream, RequestBodyStream)
+        self.assertEqual(stream.read(), b"0123456789")
+
+    def chunked_body_test(self):
+        request = self._request(b"4\r\n0123\r\n0\r\n\r\n", {"Transfer-Encoding": "chunked"})
+        del request.environ["CONTENT_LENGTH"]
+        stream = get_body_stream(request)
+        self.assertNotIsInstance(stream, RequestBodyStream)
+        self.assertEqual(stream.read(), b"0123")
@@ -4,6 +4,7 @@ from datetime import timedelta
 
 import jwt
 from jwt import DecodeError
+from mock import patch
 
 from conans.server.crypto.jwt.jwt_credentials_manager import JWTCredentialsManager
 from conans.server.crypto.jwt.jwt_manager import JWTManager
@@ -38,3 +39,33 @@ class JwtTest(unittest.TestCase):
         token = manager.get_token_for("lasote")
         self.assertEqual(manager.get_user(token), "lasote")
         self.assertRaises(DecodeError, manager.get_user, "invalid_user")
+
+    def jwt_verified_tokens_cache_test(self):
+        manager = JWTCredentialsManager(self.secret, self.expire_time)
+        token = manager.get_token_for("lasote")
+        with patch("jwt.decode", side_effect=jwt.decode) as decode:
+            self.assertEqual(manager.get_user(token), "lasote")
+            self.assertEqual(manager.get_user(token), "lasote")
+            self.assertEqual(decode.call_count, 1)
+
+            # Expired tokens are not served from the cache
+            time.sleep(2)
+            self.assertRaises(jwt.ExpiredSignature, manager.get_user, token)
+            self.assertEqual(decode.call_count, 2)
+
+    def jwt_verified_tokens_cache_size_test(self):
+        manager = JWTCredentialsManager(self.secret, timedelta(minutes=1))
+        manager._cache._max_size = 2
+        tokens = [manager.get_token_for(name) for name in ("a", "b", "c")]
+        for token in tokens:
+            manager.get_user(token)
+        self.assertEqual(len(manager._cache._entries), 2)
+        with patch("jwt.decode", side_effect=jwt.decode) as decode:
+            self.assertEqual(manager.get_user(tokens[2]), "c")
+            self.assertEqual(decode.call_count, 0)
+            self.assertEqual(manager.get_user(tokens[0]), "a")
+            self.assertEqual(decode.call_count, 1)
+
+        manager = JWTCredentialsManager(self.secret, timedelta(minutes=1))
+        self.assertRaises(DecodeError, manager.get_user, "invalid_user")
+        self.assertEqual(len(manager._cache._entries), 0)
@@ -193,3 +193,32 @@ class AuthorizerTest(unittest.TestCase):
         for u in ['user1','user2','user3']:
             authorizer.check_read_conan(u, self.openssl_ref)
 
+
+    def rules_order_test(self):
+        """The first rule that applies decides, no matter if it is indexed by name or not"""
+        read_perms = [("*/*@lasote/testing", "pepe"), ("openssl/*@*/*", "juan"),
+                      ("*/*@*/*", "*")]
+        authorizer = BasicAuthorizer(read_perms, [])
+        authorizer.check_read_conan("pepe", self.openssl_ref)
+        self.assertRaises(ForbiddenException,
+                          authorizer.check_read_conan, "juan", self.openssl_ref)
+        other_ref = ConanFileReference.loads("openssl/2.0.1@other/testing")
+        authorizer.check_read_conan("juan", other_ref)
+        self.assertRaises(ForbiddenException,
+                          authorizer.check_read_conan, "pepe", other_ref)
+        zlib_ref = ConanFileReference.loads("zlib/1.2.11@other/testing")
+        authorizer.check_read_conan("pepe", zlib_ref)
+
+        # An invalid rule is only reported when it is reached
+        read_perms = [("openssl/*@*/*", "pepe"), "invalid_reference"]
+        authorizer = BasicAuthorizer(read_perms, [])
+        authorizer.check_read_conan("pepe", self.openssl_ref)
+        self.assertRaises(InternalErrorException,
+                          authorizer.check_read_conan, "pepe", zlib_ref)
+
+    def update_permissions_test(self):
+        authorizer = BasicAuthorizer([("openssl/*@*/*", "pepe")], [])
+        self.assertRaises(ForbiddenException,
+                          authorizer.check_read_conan, "juan", self.openssl_ref)
+        authorizer.read_permissions = [("openssl/*@*/*", "juan")]
+        authorizer.check_read_conan("juan", self.openssl_ref)
@@ -265,3 +265,54 @@ class ConanServiceTest(unittest.TestCase):
         self.assertRaises(NotFoundException,
                           self.service.remove_conanfile,
                           ConanFileReference("Fake", "1.0", "lasote", "stable"))
+
+    def search_packages_index_test(self):
+        pref2 = PackageReference(self.ref, "12345587754", DEFAULT_REVISION_V1)
+        conan_vars = "[options]\n    use_Qt=%s\n"
+
+        save_files(self.server_store.package(self.pref), {CONANINFO: conan_vars % "True"})
+        self.server_store.update_last_package_revision(self.pref)
+        info = self.search_service.search_packages(self.ref, None)
+        self.assertEqual(list(info.keys()), ["123123123"])
+        index_path = os.path.join(self.server_store.base_folder(self.ref), "search_index.json")
+        self.assertTrue(os.path.exists(index_path))
+
+        # New packages found in the storage are added to the index
+        save_files(self.server_store.package(pref2), {CONANINFO: conan_vars % "False"})
+        self.server_store.update_last_package_revision(pref2)
+        info = self.search_service.search_packages(self.ref, "use_Qt=False")
+        self.assertEqual(list(info.keys()), ["12345587754"])
+
+        # An uploaded conaninfo.txt updates the index entry
+        pref3 = PackageReference(self.ref, "12345587754", "newprev")
+        save_files(self.server_store.package(pref3), {CONANINFO: conan_vars % "True"})
+        self.server_store.update_last_package_revision(pref3)
+        self.server_store.update_package_search_info(pref3)
+        info = self.search_service.search_packages(self.ref, "use_Qt=True")
+        self.assertEqual(sorted(info.keys()), ["123123123", "12345587754"])
+
+        # Removing the latest package revision goes back to the previous one
+        self.server_store.remove_package(pref3)
+        info = self.search_service.search_packages(self.ref, "use_Qt=True")
+        self.assertEqual(list(info.keys()), ["123123123"])
+
+        # Removed packages are removed from the index
+        self.service.remove_packages(self.ref, ["123123123"])
+        info = self.search_service.search_packages(self.ref, None)
+        self.assertEqual(list(info.keys()), ["12345587754"])
+        self.service.remove_packages(self.ref, [])
+        self.assertEqual(self.search_service.search_packages(self.ref, None), {})
+
+    def search_packages_index_v1_upload_test(self):
+        conan_vars = "[options]\n    use_Qt=%s\n"
+        save_files(self.server_store.package(self.pref), {CONANINFO: conan_vars % "True"})
+        self.server_store.update_last_package_revision(self.pref)
+        info = self.search_service.search_packages(self.ref, "use_Qt=True")
+        self.assertEqual(list(info.keys()), ["123123123"])
+
+        # APIv1 overwrites the conaninfo.txt of the "0" package revision
+        info_path = os.path.join(self.server_store.package(self.pref), CONANINFO)
+        save(info_path, conan_vars % "False")
+        self.server_store.update_package_search_info_from_path(info_path)
+        info = self.search_service.search_packages(self.ref, "use_Qt=True")
+        self.assertEqual(info, {})
@@ -0,0 +1,303 @@
+import hashlib
+import os
+import unittest
+from datetime import timedelta
+
+import six
+
+from conans.errors import ConanException, NotFoundException, RequestErrorException
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import CONANINFO
+from conans.server.crypto.jwt.jwt_updown_manager import JWTUpDownAuthManager
+from conans.server.store.content_addressed_adapter import ServerContentAddressedAdapter
+from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.server.store.server_store import ServerStore
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, md5, save
+
+
+class _StorageAdapterTests(object):
+    """Tests that every ServerStorageAdapter implementation has to pass"""
+
+    def _adapter(self, storage_folder):
+        raise NotImplementedError()
+
+    def setUp(self):
+        self.storage_folder = temp_folder()
+        self.adapter = self._adapter(self.storage_folder)
+
+    def _put(self, relative_path, contents):
+        path = os.path.join(self.storage_folder, relative_path)
+        self.adapter.put_file(path, six.BytesIO(contents))
+        return path
+
+    def put_file_test(self):
+        path = self._put("lib/1.0/user/channel/rrev/export/conanfile.py", b"contents")
+        self.assertTrue(self.adapter.path_exists(path))
+        self.assertEqual(load(self.adapter.get_local_path(path)), "contents")
+
+        # Replace the contents
+        checksums = self.adapter.put_file(path, six.BytesIO(b"new contents"))
+        self.assertEqual(load(self.adapter.get_local_path(path)), "new contents")
+        self.assertEqual(checksums, {"md5": md5("new contents"),
+                                     "sha1": hashlib.sha1(b"new contents").hexdigest(),
+                                     "size": len(b"new contents")})
+        # No temporary files left behind
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["conanfile.py"])
+
+    def put_file_error_test(self):
+        path = self._put("lib/1.0/user/channel/rrev/export/conanfile.py", b"contents")
+
+        class BrokenStream(object):
+            def read(self, _):
+                raise IOError("Connection closed")
+
+        self.assertRaises(IOError, self.adapter.put_file, path, BrokenStream())
+        # The previous contents are still there
+        self.assertEqual(load(self.adapter.get_local_path(path)), "contents")
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["conanfile.py"])
+
+    def put_file_checksums_test(self):
+        path = self._put("lib/1.0/user/channel/rrev/export/conanfile.py", b"contents")
+        sha1 = hashlib.sha1(b"new contents").hexdigest()
+        for size, expected_sha1 in ((1000, None), (len(b"new contents"), "0" * 40)):
+            self.assertRaises(RequestErrorException, self.adapter.put_file, path,
+                              six.BytesIO(b"new contents"), size, expected_sha1)
+            self.assertEqual(load(self.adapter.get_local_path(path)), "contents")
+            self.assertEqual(os.listdir(os.path.dirname(path)), ["conanfile.py"])
+            # The rejected contents are not reused by checksum
+            self.assertFalse(self.adapter.put_file_by_checksum(path + ".other", sha1))
+
+        self.adapter.put_file(path, six.BytesIO(b"new contents"), len(b"new contents"),
+                              sha1.upper())
+        self.assertEqual(load(self.adapter.get_local_path(path)), "new contents")
+
+    def put_file_by_checksum_test(self):
+        path = os.path.join(self.storage_folder,
+                            "lib/1.0/user/testing/rrev/package/id/prev/conan_package.tgz")
+        sha1 = self.adapter.put_file(path, six.BytesIO(b"binary"))["sha1"]
+        other = os.path.join(self.storage_folder,
+                             "lib/1.0/user/stable/rrev/package/id/prev/conan_package.tgz")
+        self.assertTrue(self.adapter.put_file_by_checksum(other, sha1))
+        self.assertEqual(load(self.adapter.get_local_path(other)), "binary")
+        self.assertEqual(self.adapter.get_snapshot(os.path.dirname(other)),
+                         {other: md5("binary")})
+        self.assertEqual(os.listdir(os.path.dirname(other)), ["conan_package.tgz"])
+        self.assertFalse(self.adapter.put_file_by_checksum(other, "0" * 40))
+        self.assertFalse(self.adapter.put_file_by_checksum(other, None))
+
+        # Replacing the contents of the first file doesn't affect the second one
+        self.adapter.put_file(path, six.BytesIO(b"new binary"))
+        self.assertEqual(load(self.adapter.get_local_path(other)), "binary")
+
+    def put_file_by_checksum_filter_test(self):
+        path = os.path.join(self.storage_folder,
+                            "lib/1.0/user/private/rrev/package/id/prev/conan_package.tgz")
+        sha1 = self.adapter.put_file(path, six.BytesIO(b"binary"))["sha1"]
+        other = os.path.join(self.storage_folder,
+                             "lib/1.0/user/stable/rrev/package/id/prev/conan_package.tgz")
+        sources = []
+
+        def source_filter(source):
+            sources.append(source)
+            return "private" not in source
+
+        self.assertFalse(self.adapter.put_file_by_checksum(other, sha1, source_filter))
+        self.assertEqual(sources, [path])
+        self.assertFalse(os.path.exists(other))
+        self.assertTrue(self.adapter.put_file_by_checksum(other, sha1, lambda _: True))
+
+        store = ServerStore(self.adapter)
+        self.assertEqual(store.ref_from_path(path),
+                         ConanFileReference.loads("lib/1.0@user/private"))
+        self.assertIsNone(store.ref_from_path(os.path.join(self.storage_folder, "lib")))
+
+    def snapshot_test(self):
+        folder = os.path.join(self.storage_folder, "lib/1.0/user/channel/rrev/export")
+        self._put("lib/1.0/user/channel/rrev/export/conanfile.py", b"conanfile")
+        self._put("lib/1.0/user/channel/rrev/export/conanmanifest.txt", b"manifest")
+
+        snapshot = self.adapter.get_snapshot(folder)
+        self.assertEqual(snapshot, {os.path.join(folder, "conanfile.py"): md5("conanfile"),
+                                    os.path.join(folder, "conanmanifest.txt"): md5("manifest")})
+        snapshot = self.adapter.get_snapshot(folder, files_subset=["conanfile.py"])
+        self.assertEqual(list(snapshot.keys()), [os.path.join(folder, "conanfile.py")])
+        self.assertEqual(sorted(self.adapter.get_file_list(folder)),
+                         [os.path.join(folder, "conanfile.py"),
+                          os.path.join(folder, "conanmanifest.txt")])
+        self.assertRaises(NotFoundException, self.adapter.get_snapshot,
+                          os.path.join(self.storage_folder, "missing"))
+        self.assertRaises(NotFoundException, self.adapter.get_file_list,
+                          os.path.join(self.storage_folder, "missing"))
+
+    def list_subdirs_test(self):
+        self._put("lib/1.0/user/channel/rrev/export/conanfile.py", b"conanfile")
+        self._put("lib/2.0/user/channel/rrev/export/conanfile.py", b"conanfile")
+        self._put("other/1.0/_/_/rrev/export/conanfile.py", b"conanfile")
+        self.assertEqual(sorted(self.adapter.list_subdirs(self.storage_folder, level=4)),
+                         ["lib/1.0/user/channel", "lib/2.0/user/channel", "other/1.0/_/_"])
+        self.assertEqual(self.adapter.list_subdirs(os.path.join(self.storage_folder, "missing"),
+                                                   level=1), [])
+
+    def delete_test(self):
+        path = self._put("lib/1.0/user/channel/rrev/export/conanfile.py", b"conanfile")
+        self._put("lib/1.0/user/channel/rrev/export/conanmanifest.txt", b"manifest")
+        self.adapter.delete_file(path)
+        self.assertFalse(self.adapter.path_exists(path))
+        self.assertRaises(NotFoundException, self.adapter.delete_file, path)
+
+        folder = os.path.join(self.storage_folder, "lib/1.0/user/channel/rrev")
+        self.adapter.delete_folder(folder)
+        self.assertFalse(self.adapter.path_exists(folder))
+        self.assertRaises(NotFoundException, self.adapter.delete_folder, folder)
+
+    def metadata_files_test(self):
+        path = os.path.join(self.storage_folder, "lib/1.0/user/channel/revisions.txt")
+        os.makedirs(os.path.dirname(path))
+        lock = path + ".lock"
+        self.assertFalse(self.adapter.compare_and_swap(path, "other", "first", lock))
+        self.assertTrue(self.adapter.compare_and_swap(path, None, "first", lock))
+        self.assertEqual(self.adapter.read_file(path, lock), "first")
+        self.assertFalse(self.adapter.compare_and_swap(path, None, "second", lock))
+        self.assertTrue(self.adapter.compare_and_swap(path, "first", "second", lock))
+        self.adapter.write_file(path, "third", lock)
+        self.assertEqual(self.adapter.read_file(path, lock), "third")
+
+        ret = self.adapter.update_file(path, lambda c: c + "-updated", lock)
+        self.assertEqual(ret, "third-updated")
+        ret = self.adapter.update_file(path, lambda c: None, lock)
+        self.assertEqual(ret, "third-updated")
+        self.assertEqual(self.adapter.read_file(path, lock), "third-updated")
+
+    def update_file_retries_test(self):
+        path = os.path.join(self.storage_folder, "revisions.txt")
+        lock = path + ".lock"
+        self.adapter.write_file(path, "1", lock)
+        calls = []
+
+        def update(contents):
+            if not calls:  # Another writer modifies it concurrently, the first time
+                self.adapter.write_file(path, "2", lock)
+            calls.append(contents)
+            return contents + "0"
+
+        self.assertEqual(self.adapter.update_file(path, update, lock), "20")
+        self.assertEqual(calls, ["1", "2"])
+
+    def server_store_test(self):
+        store = ServerStore(self.adapter)
+        ref = ConanFileReference.loads("lib/1.0@user/channel#rrev")
+        pref = PackageReference(ref, "pkgid", "prev")
+        store.put_file(store.get_conanfile_file_path(ref, "conanfile.py"), six.BytesIO(b"cf"))
+        store.update_last_revision(ref)
+        store.put_file(store.get_package_file_path(pref, CONANINFO),
+                       six.BytesIO(b"[options]\n    shared=True\n"))
+        store.update_last_package_revision(pref)
+
+        self.assertEqual(store.get_recipe_file_list(ref), ["conanfile.py"])
+        self.assertEqual(store.get_package_snapshot(pref),
+                         {CONANINFO: md5("[options]\n    shared=True\n")})
+        self.assertEqual(store.get_last_revision(ref.copy_clear_rev()).revision, "rrev")
+        self.assertEqual(store.get_last_package_revision(pref.copy_clear_prev()).revision,
+                         "prev")
+        infos = store.get_packages_infos(ref)
+        self.assertEqual(infos["pkgid"]["options"], {"shared": "True"})
+
+        store.remove_package(pref)
+        self.assertEqual(store.get_packages_infos(ref), {})
+
+
+class ServerDiskAdapterTest(_StorageAdapterTests, unittest.TestCase):
+
+    def _adapter(self, storage_folder):
+        return ServerDiskAdapter("http://fake", storage_folder,
+                                 JWTUpDownAuthManager("secret", timedelta(seconds=200)))
+
+    def put_file_by_checksum_modified_test(self):
+        export = os.path.join(self.storage_folder, "lib/1.0/user/%s/rrev/export")
+        path = os.path.join(export % "testing", "conan_sources.tgz")
+        sha1 = self.adapter.put_file(path, six.BytesIO(b"sources"))["sha1"]
+        other = os.path.join(export % "stable", "conan_sources.tgz")
+        self.adapter.put_file(path, six.BytesIO(b"other sources"))
+        self.assertFalse(self.adapter.put_file_by_checksum(other, sha1))
+        os.remove(path)
+        self.assertFalse(self.adapter.put_file_by_checksum(other, sha1))
+        self.assertFalse(os.path.exists(other))
+
+    def put_file_by_checksum_tampered_test(self):
+        export = os.path.join(self.storage_folder, "lib/1.0/user/%s/rrev/export")
+        path = os.path.join(export % "testing", "conan_sources.tgz")
+        sha1 = self.adapter.put_file(path, six.BytesIO(b"sources"))["sha1"]
+        stat = os.stat(path)
+        with open(path, "wb") as f:  # Same size and modification time
+            f.write(b"SOURCES")
+        os.utime(path, (stat.st_atime, stat.st_mtime))
+        other = os.path.join(export % "stable", "conan_sources.tgz")
+        self.assertFalse(self.adapter.put_file_by_checksum(other, sha1))
+        self.assertFalse(os.path.exists(other))
+
+
+class ServerContentAddressedAdapterTest(_StorageAdapterTests, unittest.TestCase):
+
+    def _adapter(self, storage_folder):
+        return ServerContentAddressedAdapter("http://fake", storage_folder,
+                                             JWTUpDownAuthManager("secret",
+                                                                  timedelta(seconds=200)),
+                                             buffer_size=3)
+
+    def deduplication_test(self):
+        path1 = self._put("lib/1.0/user/testing/rrev/package/id/prev/conan_package.tgz",
+                          b"binary")
+        path2 = self._put("lib/1.0/user/stable/rrev/package/id/prev/conan_package.tgz",
+                          b"binary")
+        self.assertEqual(self.adapter.get_local_path(path1), self.adapter.get_local_path(path2))
+        blobs = os.listdir(os.path.join(self.storage_folder, ".blobs"))
+        self.assertEqual(sorted(blobs), sorted([os.path.basename(os.path.dirname(
+            self.adapter.get_local_path(path1))), "tmp"]))
+        self.assertEqual(os.listdir(os.path.join(self.storage_folder, ".blobs", "tmp")), [])
+
+    def put_file_by_checksum_corrupted_blob_test(self):
+        path = self._put("lib/1.0/user/testing/rrev/export/conan_sources.tgz", b"sources")
+        sha1 = hashlib.sha1(b"sources").hexdigest()
+        save(self.adapter.get_local_path(path), "SOURCES")
+        other = os.path.join(self.storage_folder, "lib/1.0/user/stable/rrev/export",
+                             "conan_sources.tgz")
+        self.assertFalse(self.adapter.put_file_by_checksum(other, sha1))
+        self.assertFalse(os.path.exists(other))
+
+    def collect_garbage_test(self):
+        path1 = self._put("lib/1.0/user/testing/rrev/export/conanfile.py", b"one")
+        self._put("lib/1.0/user/testing/rrev/export/conanmanifest.txt", b"two")
+        blob = self.adapter.get_local_path(path1)
+        self.adapter.write_file(os.path.join(self.storage_folder, "lib/1.0/user/testing",
+                                             "revisions.txt"), '{"revisions": []}', None)
+        self.assertEqual(self.adapter.collect_garbage(grace_period=0), 0)
+        self.adapter.delete_file(path1)
+        self.assertTrue(os.path.exists(blob))
+        # Recent blobs can belong to an upload whose pointer is not written yet
+        self.assertEqual(self.adapter.collect_garbage(), 0)
+        self.assertTrue(os.path.exists(blob))
+        self.assertEqual(self.adapter.collect_garbage(grace_period=0), 1)
+        self.assertFalse(os.path.exists(blob))
+
+    def collect_garbage_aborted_uploads_test(self):
+        tmp_file = os.path.join(self.storage_folder, ".blobs", "tmp", "upload")
+        save(tmp_file, "half uploaded")
+        self.assertEqual(self.adapter.collect_garbage(grace_period=0), 0)
+        self.assertFalse(os.path.exists(tmp_file))
+
+    def collect_garbage_shared_blobs_test(self):
+        blobs_folder = temp_folder()
+        auth_manager = JWTUpDownAuthManager("secret", timedelta(seconds=200))
+        adapters = [ServerContentAddressedAdapter("http://fake", temp_folder(), auth_manager,
+                                                  blobs_path=blobs_folder) for _ in range(2)]
+        path = os.path.join(adapters[0]._store_folder, "lib/1.0/user/testing/rrev/export",
+                            "conanfile.py")
+        adapters[0].put_file(path, six.BytesIO(b"conanfile"))
+        blob = adapters[0].get_local_path(path)
+        # The other server doesn't know the pointers of the first one, it cannot collect them
+        with six.assertRaisesRegex(self, ConanException, "Cannot collect the garbage"):
+            adapters[1].collect_garbage(grace_period=0)
+        with six.assertRaisesRegex(self, ConanException, "Cannot collect the garbage"):
+            adapters[0].collect_garbage(grace_period=0)
+        self.assertTrue(os.path.exists(blob))
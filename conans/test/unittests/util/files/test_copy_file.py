@@ -0,0 +1,124 @@
+# coding=utf-8
+
+import errno
+import os
+import platform
+import stat
+import unittest
+
+import six
+from mock import patch
+
+from conans.client.file_copier import FileCopier, copy_strategies
+from conans.errors import ConanException
+from conans.test.utils.test_files import temp_folder
+from conans.util import files
+from conans.util.files import copy_file, copy_tree, link_tree, load, merge_directories, save
+
+
+class CopyFileTest(unittest.TestCase):
+
+    def setUp(self):
+        files._unsupported_copies.clear()
+        self.folder = temp_folder()
+        self.src = os.path.join(self.folder, "src", "file.txt")
+        save(self.src, "some content")
+        os.chmod(self.src, os.stat(self.src).st_mode | stat.S_IXUSR)
+        self.dst = os.path.join(self.folder, "dst", "file.txt")
+        os.makedirs(os.path.dirname(self.dst))
+
+    def _assert_copied(self, same_file):
+        self.assertEqual(load(self.dst), "some content")
+        self.assertEqual(os.stat(self.dst).st_mode, os.stat(self.src).st_mode)
+        self.assertEqual(os.path.samefile(self.src, self.dst), same_file)
+        self.assertEqual(os.listdir(os.path.dirname(self.dst)), ["file.txt"])
+
+    def test_copy(self):
+        copy_file(self.src, self.dst, allow_hardlink=True, strategies=("copy", ))
+        self._assert_copied(same_file=False)
+
+    def test_strategies(self):
+        with patch.dict("os.environ", {"CONAN_COPY_STRATEGY": ""}):
+            self.assertEqual(copy_strategies(), ("reflink", "copy"))
+        with patch.dict("os.environ", {"CONAN_COPY_STRATEGY": "hardlink , copy"}):
+            self.assertEqual(copy_strategies(), ("hardlink", "copy"))
+        with patch.dict("os.environ", {"CONAN_COPY_STRATEGY": "reflink, fast"}):
+            with six.assertRaisesRegex(self, ConanException, "Invalid copy strategy 'fast'"):
+                copy_strategies()
+
+    @unittest.skipIf(platform.system() == "Windows", "No reflinks in Windows")
+    def test_reflink(self):
+        def clone(dst_fd, _, src_fd):
+            os.write(dst_fd, os.read(src_fd, 1024))
+
+        with patch("fcntl.ioctl", side_effect=clone) as ioctl:
+            with patch("shutil.copy2") as copy2:
+                copy_file(self.src, self.dst, strategies=("reflink", "copy"))
+        self.assertEqual(ioctl.call_count, 1)
+        self.assertFalse(copy2.called)
+        self._assert_copied(same_file=False)
+
+    @unittest.skipIf(platform.system() == "Windows", "No reflinks in Windows")
+    def test_reflink_fallback(self):
+        error = IOError(errno.EOPNOTSUPP, "Operation not supported")
+        with patch("fcntl.ioctl", side_effect=error) as ioctl:
+            copy_file(self.src, self.dst)
+            self._assert_copied(same_file=False)
+            # The file system doesn't support it, it is not tried again
+            copy_file(self.src, self.dst + ".2")
+        self.assertEqual(ioctl.call_count, 1)
+        self.assertEqual(load(self.dst + ".2"), "some content")
+
+    def test_hardlink(self):
+        strategies = ("hardlink", "copy")
+        copy_file(self.src, self.dst, strategies=strategies)
+        self._assert_copied(same_file=False)
+        # Replacing the existing file
+        copy_file(self.src, self.dst, allow_hardlink=True, strategies=strategies)
+        self._assert_copied(same_file=True)
+
+    def test_hardlink_fallback(self):
+        error = OSError(errno.EXDEV, "Invalid cross-device link")
+        with patch("os.link", side_effect=error):
+            copy_file(self.src, self.dst, allow_hardlink=True, strategies=("hardlink", "copy"))
+        self._assert_copied(same_file=False)
+
+    def test_copy_tree(self):
+        save(os.path.join(self.folder, "src", "sub", "other.txt"), "other")
+        dst = os.path.join(self.folder, "tree")
+        strategies = ("hardlink", "copy")
+        copy_tree(os.path.dirname(self.src), dst, strategies=strategies)
+        merged = os.path.join(self.folder, "merged")
+        merge_directories(os.path.dirname(self.src), merged, strategies=strategies)
+        for folder in (dst, merged):
+            self.assertEqual(load(os.path.join(folder, "sub", "other.txt")), "other")
+            # Sources are modified in place by patches, they are never hardlinked
+            self.assertFalse(os.path.samefile(self.src, os.path.join(folder, "file.txt")))
+
+    @unittest.skipIf(platform.system() == "Windows", "Symlinks in Windows need privileges")
+    def test_link_tree(self):
+        src_folder = os.path.dirname(self.src)
+        os.symlink("file.txt", os.path.join(src_folder, "link.txt"))
+        save(os.path.join(src_folder, "sub", "other.txt"), "other")
+        dst = os.path.join(self.folder, "linked")
+        link_tree(src_folder, dst)
+        self.assertTrue(os.path.samefile(self.src, os.path.join(dst, "file.txt")))
+        self.assertEqual(os.readlink(os.path.join(dst, "link.txt")), "file.txt")
+        self.assertEqual(load(os.path.join(dst, "sub", "other.txt")), "other")
+
+        # Files in other devices are copied
+        with patch("os.link", side_effect=OSError(errno.EXDEV, "Invalid cross-device link")):
+            link_tree(src_folder, os.path.join(self.folder, "copied"))
+        self.assertEqual(load(os.path.join(self.folder, "copied", "file.txt")), "some content")
+
+    def test_file_copier_hardlinks(self):
+        src_folder = os.path.dirname(self.src)
+        with patch.dict("os.environ", {"CONAN_COPY_STRATEGY": "hardlink, copy"}):
+            FileCopier([src_folder], os.path.join(self.folder, "copy"))("*.txt")
+            copier = FileCopier([src_folder], os.path.join(self.folder, "link"), hardlinks=True)
+        # The strategies are resolved once for all the copies of the FileCopier
+        with patch("conans.client.file_copier.copy_strategies") as strategies:
+            copier("*.txt")
+        self.assertFalse(strategies.called)
+        self.assertFalse(os.path.samefile(self.src, os.path.join(self.folder, "copy/file.txt")))
+        self.assertTrue(os.path.samefile(self.src, os.path.join(self.folder, "link/file.txt")))
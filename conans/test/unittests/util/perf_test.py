@@ -0,0 +1,67 @@
+import json
+import os
+import unittest
+
+import six
+
+from conans.errors import ConanException
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestBufferConanOutput
+from conans.util.files import load
+from conans.util.perf import extract_trace_perf_arg, perf_span, perf_traced, start_perf_tracer, \
+    stop_perf_tracer
+
+
+@perf_traced("traced", "test")
+def _traced():
+    with perf_span("inner", "test", value=1):
+        pass
+
+
+class PerfTracerTest(unittest.TestCase):
+
+    def tearDown(self):
+        stop_perf_tracer()
+
+    def no_tracer_test(self):
+        with perf_span("span"):
+            _traced()
+        tracer = start_perf_tracer()
+        self.assertEqual(tracer.hotspots(), [])
+
+    def spans_test(self):
+        tracer = start_perf_tracer()
+        with perf_span("outer", "test"):
+            _traced()
+            _traced()
+        self.assertIs(stop_perf_tracer(), tracer)
+
+        hotspots = {name: (calls, total, self_time)
+                    for name, calls, total, self_time in tracer.hotspots()}
+        self.assertEqual(set(hotspots), {"outer", "traced", "inner"})
+        self.assertEqual(hotspots["traced"][0], 2)
+        outer_calls, outer_total, outer_self = hotspots["outer"]
+        self.assertAlmostEqual(outer_self, outer_total - hotspots["traced"][1])
+
+        trace_file = os.path.join(temp_folder(), "trace.json")
+        tracer.save(trace_file)
+        events = json.loads(load(trace_file))["traceEvents"]
+        self.assertEqual([e["name"] for e in events], ["outer", "traced", "inner", "traced",
+                                                      "inner"])
+        self.assertEqual(events[2]["args"], {"value": 1})
+        self.assertEqual(events[0]["ph"], "X")
+        self.assertEqual(len(set(e["tid"] for e in events)), 1)
+
+        output = TestBufferConanOutput()
+        tracer.print_hotspots(output)
+        self.assertIn("Performance hotspots:", output)
+        self.assertIn("traced        2", output)
+
+    def extract_arg_test(self):
+        self.assertEqual(extract_trace_perf_arg(["install", ".", "--trace-perf", "t.json"]),
+                         (["install", "."], "t.json"))
+        self.assertEqual(extract_trace_perf_arg(["--trace-perf=t.json", "install", "."]),
+                         (["install", "."], "t.json"))
+        self.assertEqual(extract_trace_perf_arg(["install", "."]), (["install", "."], None))
+        with six.assertRaisesRegex(self, ConanException, "--trace-perf requires a file argument"):
+            extract_trace_perf_arg(["install", "--trace-perf"])
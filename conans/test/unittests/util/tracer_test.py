@@ -0,0 +1,74 @@
+import json
+import os
+import unittest
+
+import six
+
+from conans.client.tools import environment_append
+from conans.errors import ConanException
+from conans.model.ref import ConanFileReference
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, md5, save
+from conans.util.tracer import ChecksumsCalculator, flush_traces, log_recipe_download, \
+    log_recipe_got_from_local_cache
+
+
+class TraceWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = temp_folder()
+        self.trace_file = os.path.join(self.folder, "trace.log")
+        self.ref = ConanFileReference.loads("pkg/0.1@user/testing")
+
+    def buffered_test(self):
+        save(self.trace_file, '{"previous": "trace"}\n')
+        with environment_append({"CONAN_TRACE_FILE": self.trace_file}):
+            for _ in range(3):
+                log_recipe_got_from_local_cache(self.ref)
+            self.assertEqual(len(load(self.trace_file).splitlines()), 1)
+            flush_traces()
+            lines = load(self.trace_file).splitlines()
+            self.assertEqual(len(lines), 4)
+            self.assertEqual(json.loads(lines[3])["_action"], "GOT_RECIPE_FROM_LOCAL_CACHE")
+
+            # Changing the trace file writes the traces of the previous one
+            other_file = os.path.join(self.folder, "other.log")
+            log_recipe_got_from_local_cache(self.ref)
+            with environment_append({"CONAN_TRACE_FILE": other_file}):
+                log_recipe_got_from_local_cache(self.ref)
+                self.assertEqual(len(load(self.trace_file).splitlines()), 5)
+                flush_traces()
+            self.assertEqual(len(load(other_file).splitlines()), 1)
+        self.assertFalse(os.path.exists(self.trace_file + ".lock"))
+
+    def invalid_test(self):
+        with environment_append({"CONAN_TRACE_FILE": self.folder}):
+            with six.assertRaisesRegex(self, ConanException, "CONAN_TRACE_FILE is a directory"):
+                log_recipe_got_from_local_cache(self.ref)
+
+    def transfer_checksums_test(self):
+        path = os.path.join(self.folder, "conanfile.py")
+        save(path, "contents")
+        with environment_append({"CONAN_TRACE_FILE": self.trace_file}):
+            # The checksums of the chunks transferred are used, the file is not read again
+            checksums = ChecksumsCalculator(path)
+            checksums.update(b"transferred")
+            checksums.save()
+            log_recipe_download(self.ref, 1, "remote", {"conanfile.py": path})
+            # They are used only once, or if the file didn't change
+            log_recipe_download(self.ref, 1, "remote", {"conanfile.py": path})
+            flush_traces()
+        first, second = [json.loads(line)["files"][0]
+                         for line in load(self.trace_file).splitlines()]
+        self.assertEqual(first["md5"], md5(b"transferred"))
+        self.assertEqual(second["md5"], md5(b"contents"))
+
+    def no_trace_test(self):
+        path = os.path.join(self.folder, "conanfile.py")
+        save(path, "contents")
+        checksums = ChecksumsCalculator(path)
+        checksums.update(b"contents")
+        checksums.save()
+        log_recipe_download(self.ref, 1, "remote", {"conanfile.py": path})
+        flush_traces()
+        self.assertFalse(os.path.exists(self.trace_file))
@@ -41,7 +41,10 @@ class TestServerLauncher(object):
                                                    server_config.authorize_timeout)
         base_url = base_url or server_config.public_url
         self.server_store = get_server_store(server_config.disk_storage_path,
-                                             base_url, updown_auth_manager)
+                                             base_url, updown_auth_manager,
+                                             storage_adapter=server_config.storage_adapter,
+                                             blobs_storage_path=server_config.blobs_storage_path,
+                                             buffer_size=server_config.upload_buffer_size)
 
         # Prepare some test users
         if not read_permissions:
@@ -39,6 +39,14 @@ def make_read_only(path):
             os.chmod(full_path, mode & ~ stat.S_IWRITE)
 
 
+def make_writable(path):
+    for root, _, files in walk(path):
+        for f in files:
+            full_path = os.path.join(root, f)
+            if not os.path.islink(full_path):
+                os.chmod(full_path, os.stat(full_path).st_mode | stat.S_IWRITE)
+
+
 _DIRTY_FOLDER = ".dirty"
 
 
@@ -174,6 +182,7 @@ def save(path, content, only_if_modified=False, encoding="utf-8"):
         content: contents to save in the file
         only_if_modified: file won't be modified if the content hasn't changed
         encoding: target file text encoding
+    Returns False if the file wasn't written because its content didn't change
     """
     try:
         os.makedirs(os.path.dirname(path))
@@ -185,10 +194,11 @@ def save(path, content, only_if_modified=False, encoding="utf-8"):
     if only_if_modified and os.path.exists(path):
         old_content = load(path, binary=True, encoding=encoding)
         if old_content == new_content:
-            return
+            return False
 
     with open(path, "wb") as handle:
         handle.write(new_content)
+    return True
 
 
 def mkdir_tmp():
@@ -244,6 +254,9 @@ def _change_permissions(func, path, exc_info):
 
 
 def rmdir(path):
+    if os.path.islink(path):  # e.g. a package folder linked to the shared package store
+        os.unlink(path)
+        return
     try:
         shutil.rmtree(path, onerror=_change_permissions)
     except OSError as err:
@@ -264,6 +277,108 @@ def remove(path):
         raise
 
 
+def replace_file(src, dst):
+    """Renames src to dst, replacing dst atomically if it exists (but in Windows with
+    Python 2, that has no os.replace())"""
+    if hasattr(os, "replace"):
+        os.replace(src, dst)
+    else:
+        if platform.system() == "Windows" and os.path.exists(dst):
+            os.unlink(dst)
+        os.rename(src, dst)
+
+
+COPY_STRATEGIES = ("reflink", "hardlink", "copy")
+DEFAULT_COPY_STRATEGIES = ("reflink", "copy")
+_FICLONE = 0x40049409  # Linux ioctl to clone the data blocks of a file (btrfs, XFS)
+# errno of the file systems not supporting a strategy, like reflinks in ext4
+_UNSUPPORTED_ERRNOS = set(getattr(errno, e) for e in ("EOPNOTSUPP", "ENOTSUP", "EXDEV", "EINVAL",
+                                                      "ENOTTY", "EPERM", "ENOSYS")
+                          if hasattr(errno, e))
+_unsupported_copies = set()  # (strategy, src device, dst device) known to fail
+
+
+def _reflink(src, dst):
+    import fcntl  # Not available in Windows, the ImportError makes it fall back
+    with open(src, "rb") as src_file:
+        with open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+    shutil.copystat(src, dst)
+
+
+def _hardlink(src, dst):
+    tmp = "%s.conan_link" % dst
+    os.link(src, tmp)
+    replace_file(tmp, dst)
+
+
+def copy_file(src, dst, allow_hardlink=False, strategies=DEFAULT_COPY_STRATEGIES):
+    """ copies the src file to the dst file path, like shutil.copy2(), with the first of the
+    strategies (as returned by file_copier.copy_strategies()) that works for them:
+      - reflink: dst shares the data blocks of src until any of them is modified
+      - hardlink: dst is the same file than src, only used if allow_hardlink, when none
+                  of them is going to be modified in place
+      - copy: a regular copy, always used if the others fail
+    """
+    for strategy in strategies:
+        if strategy == "copy":
+            break
+        if strategy == "hardlink" and not allow_hardlink:
+            continue
+        try:
+            devices = (strategy, os.stat(src).st_dev,
+                       os.stat(os.path.dirname(os.path.abspath(dst))).st_dev)
+        except OSError:
+            break
+        if devices in _unsupported_copies:
+            continue
+        try:
+            if strategy == "reflink":
+                _reflink(src, dst)
+            else:
+                _hardlink(src, dst)
+            return dst
+        except ImportError:
+            _unsupported_copies.add(devices)
+        except (IOError, OSError) as e:
+            if e.errno in _UNSUPPORTED_ERRNOS:
+                _unsupported_copies.add(devices)
+            logger.debug("Copy with %s failed %s -> %s: %s" % (strategy, src, dst, str(e)))
+    shutil.copy2(src, dst)
+    return dst
+
+
+def copy_tree(src, dst, strategies=DEFAULT_COPY_STRATEGIES):
+    """ shutil.copytree(src, dst, symlinks=True) using copy_file() for the files
+    """
+    if six.PY2:
+        return shutil.copytree(src, dst, symlinks=True)
+
+    def copy_function(src_file, dst_file):
+        return copy_file(src_file, dst_file, strategies=strategies)
+    return shutil.copytree(src, dst, symlinks=True, copy_function=copy_function)
+
+
+def link_tree(src, dst):
+    """ recreates the src folder tree in dst hardlinking its files, or copying them with
+    copy_file() if they can't be hardlinked (e.g. dst is in a different device). Symlinks
+    are recreated as they are
+    """
+    for root, dirs, files in walk(src):
+        dst_root = os.path.join(dst, os.path.relpath(root, src))
+        mkdir(dst_root)
+        for name in dirs + files:
+            src_path = os.path.join(root, name)
+            dst_path = os.path.join(dst_root, name)
+            if os.path.islink(src_path):
+                os.symlink(os.readlink(src_path), dst_path)
+            elif os.path.isfile(src_path):
+                try:
+                    os.link(src_path, dst_path)
+                except OSError:
+                    copy_file(src_path, dst_path)
+
+
 def mkdir(path):
     """Recursive mkdir, doesnt fail if already existing"""
     if os.path.exists(path):
@@ -376,7 +491,7 @@ def exception_message_safe(exc):
         return decode_text(repr(exc))
 
 
-def merge_directories(src, dst, excluded=None):
+def merge_directories(src, dst, excluded=None, strategies=DEFAULT_COPY_STRATEGIES):
     src = os.path.normpath(src)
     dst = os.path.normpath(dst)
     excluded = excluded or []
@@ -428,5 +543,5 @@ def merge_directories(src, dst, excluded=None):
             if os.path.islink(src_file):
                 link_to_rel(src_file)
             else:
-                shutil.copy2(src_file, dst_file)
+                copy_file(src_file, dst_file, strategies=strategies)
 
@@ -0,0 +1,182 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+from conans.errors import ConanException
+from conans.util.files import save
+
+TRACE_PERF_ARG = "--trace-perf"
+
+
+class _Span(object):
+    """ A timed region of a PerfTracer, the time of the spans opened inside it, in the same
+    thread, is discounted from its self time
+    """
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start", "_children_time")
+
+    def __init__(self, tracer, name, category, args):
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+
+    def __enter__(self):
+        self._children_time = 0
+        self._tracer._stack().append(self)
+        self._start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = time.time() - self._start
+        stack = self._tracer._stack()
+        stack.pop()
+        if stack:
+            stack[-1]._children_time += duration
+        self._tracer._events.append((self._name, self._category, self._start, duration,
+                                     duration - self._children_time,
+                                     threading.current_thread().ident, self._args))
+
+
+class _NoSpan(object):
+    """ What perf_span() returns when there is no tracer, so the instrumented code costs nothing
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+class PerfTracer(object):
+    """ Records the spans of a conan command, to be exported as Chrome trace events, that can be
+    opened in chrome://tracing or https://ui.perfetto.dev, and summarized as a table of the
+    spans with more self time
+    """
+
+    def __init__(self):
+        self._events = []  # [(name, category, start, duration, self_time, thread_id, args)]
+        self._local = threading.local()
+
+    def _stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def span(self, name, category, args=None):
+        return _Span(self, name, category, args)
+
+    def chrome_trace(self):
+        pid = os.getpid()
+        events = []
+        for name, category, start, duration, _, thread_id, args in self._events:
+            event = {"name": name, "cat": category, "ph": "X", "pid": pid, "tid": thread_id,
+                     "ts": int(start * 1e6), "dur": int(duration * 1e6)}
+            if args:
+                event["args"] = args
+            events.append(event)
+        events.sort(key=lambda e: (e["ts"], -e["dur"]))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path):
+        save(path, json.dumps(self.chrome_trace()))
+
+    def hotspots(self, top=10):
+        """ returns [(name, calls, total_time, self_time)] of the spans with the same name, with
+        more self time first
+        """
+        result = defaultdict(lambda: [0, 0, 0])
+        for name, _, _, duration, self_time, _, _ in self._events:
+            item = result[name]
+            item[0] += 1
+            item[1] += duration
+            item[2] += self_time
+        result = [(name, calls, total, self_time)
+                  for name, (calls, total, self_time) in result.items()]
+        result.sort(key=lambda item: item[3], reverse=True)
+        return result[:top]
+
+    def print_hotspots(self, output, top=10):
+        hotspots = self.hotspots(top)
+        if not hotspots:
+            return
+        width = max(len(name) for name, _, _, _ in hotspots)
+        output.writeln("")
+        output.highlight("Performance hotspots:")
+        output.writeln("%-*s %8s %10s %10s" % (width, "span", "calls", "total (s)", "self (s)"))
+        for name, calls, total, self_time in hotspots:
+            output.writeln("%-*s %8d %10.3f %10.3f" % (width, name, calls, total, self_time))
+
+
+_tracer = None
+
+
+def start_perf_tracer():
+    global _tracer
+    _tracer = PerfTracer()
+    return _tracer
+
+
+def stop_perf_tracer():
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def perf_span(name, category="conan", **args):
+    """ a context manager to time a region of code, only if a PerfTracer has been started:
+        with perf_span("load recipe", "recipe", path=conanfile_path):
+    """
+    if _tracer is None:
+        return _NO_SPAN
+    return _tracer.span(name, category, args)
+
+
+def perf_record(name, category, start, duration, thread_id, **args):
+    """ records a span timed somewhere else, like the build of a package in a forked process,
+    in its own thread_id track of the trace
+    """
+    if _tracer is not None:
+        _tracer._events.append((name, category, start, duration, duration, thread_id, args))
+
+
+def perf_traced(name, category="conan"):
+    """ decorator to time every call of a function as a perf_span()
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with _tracer.span(name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def extract_trace_perf_arg(args):
+    """ removes the --trace-perf <file> argument, valid for all the commands, from the command
+    line args, returns (args, trace_file)
+    """
+    result = []
+    trace_file = None
+    args_iter = iter(args)
+    for arg in args_iter:
+        if arg == TRACE_PERF_ARG:
+            trace_file = next(args_iter, None)
+            if not trace_file:
+                raise ConanException("%s requires a file argument" % TRACE_PERF_ARG)
+        elif arg.startswith(TRACE_PERF_ARG + "="):
+            trace_file = arg.split("=", 1)[1]
+        else:
+            result.append(arg)
+    return result, trace_file
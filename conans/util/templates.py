@@ -2,7 +2,18 @@
 
 from jinja2 import Template
 
+_templates = {}
+
+
+def _template(content):
+    """ the compiled Template for the content, compiled only once per process
+    """
+    template = _templates.get(content)
+    if template is None:
+        template = _templates[content] = Template(content)
+    return template
+
 
 def render_layout_file(content, ref=None, settings=None, options=None):
-    t = Template(content)
+    t = _template(content)
     return t.render(reference=ref, settings=settings, options=options)
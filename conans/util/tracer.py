@@ -1,14 +1,14 @@
+import atexit
 import copy
+import hashlib
 import json
 import os
+import threading
 import time
 from os.path import isdir
 
-import fasteners
-
 from conans.errors import ConanException
 from conans.model.ref import ConanFileReference, PackageReference
-from conans.util.files import md5sum, sha1sum
 from conans.util.log import logger
 
 
@@ -31,50 +31,187 @@ def _validate_action(action_name):
         raise ConanException("Unknown action %s" % action_name)
 
 
-def _get_tracer_file():
+def _validate_tracer_file(trace_path):
+    """
+    CONAN_TRACE_FILE has to be a file in an existing dir, it will be created if needed
+    """
+    if not os.path.isabs(trace_path):
+        raise ConanException("Bad CONAN_TRACE_FILE value. The specified "
+                             "path has to be an absolute path to a file.")
+    if not os.path.exists(os.path.dirname(trace_path)):
+        raise ConanException("Bad CONAN_TRACE_FILE value. The specified "
+                             "path doesn't exist: '%s'" % os.path.dirname(trace_path))
+    if isdir(trace_path):
+        raise ConanException("CONAN_TRACE_FILE is a directory. Please, specify a file path")
+
+
+class _TraceWriter(object):
+    """ Keeps the traces in memory and appends them to the file with a single write() of a file
+    opened with O_APPEND, so the traces of different processes are not mixed, without locking
+    the file. They are written when they reach MAX_BUFFER, at the end of every API call and
+    when the process finishes
     """
-    If CONAN_TRACE_FILE is a file in an existing dir will log to it creating the file if needed
-    Otherwise won't log anything
+    MAX_BUFFER = 64 * 1024
+
+    def __init__(self, path):
+        _validate_tracer_file(path)
+        self.path = path
+        self._lines = []
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def write(self, obj):
+        line = json.dumps(obj, sort_keys=True) + "\n"
+        with self._lock:
+            self._lines.append(line)
+            self._size += len(line)
+            if self._size >= self.MAX_BUFFER:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._lines:
+            return
+        data = "".join(self._lines).encode("utf-8")
+        self._lines = []
+        self._size = 0
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+
+_writer = None
+
+
+def _get_trace_writer():
+    """ the _TraceWriter of the current CONAN_TRACE_FILE, None if there is no trace file
     """
+    global _writer
     trace_path = os.environ.get("CONAN_TRACE_FILE", None)
-    if trace_path is not None:
-        if not os.path.isabs(trace_path):
-            raise ConanException("Bad CONAN_TRACE_FILE value. The specified "
-                                 "path has to be an absolute path to a file.")
-        if not os.path.exists(os.path.dirname(trace_path)):
-            raise ConanException("Bad CONAN_TRACE_FILE value. The specified "
-                                 "path doesn't exist: '%s'" % os.path.dirname(trace_path))
-        if isdir(trace_path):
-            raise ConanException("CONAN_TRACE_FILE is a directory. Please, specify a file path")
-    return trace_path
-
-
-def _append_to_log(obj):
-    """Add a new line to the log file locking the file to protect concurrent access"""
-    if _get_tracer_file():
-        filepath = _get_tracer_file()
-        with fasteners.InterProcessLock(filepath + ".lock", logger=logger):
-            with open(filepath, "a") as logfile:
-                logfile.write(json.dumps(obj, sort_keys=True) + "\n")
+    if _writer is not None and _writer.path != trace_path:
+        _writer.flush()
+        _writer = None
+    if trace_path is not None and _writer is None:
+        _writer = _TraceWriter(trace_path)
+    return _writer
+
+
+def flush_traces():
+    """ writes the traces kept in memory, before reading the trace file or forking the process
+    """
+    if _writer is not None:
+        _writer.flush()
+
+
+atexit.register(flush_traces)
+
+
+def tracing():
+    return os.environ.get("CONAN_TRACE_FILE", None) is not None
 
 
 def _append_action(action_name, props):
     """Validate the action_name and append to logs"""
     _validate_action(action_name)
-    props["_action"] = action_name
-    props["time"] = time.time()
-    _append_to_log(props)
+    writer = _get_trace_writer()
+    if writer:
+        props["_action"] = action_name
+        props["time"] = time.time()
+        writer.write(props)
 
 
-# ############## LOG METHODS ######################
+# The checksums of the files computed while they were transferred, so they are not read again
+# for their traces {path: (size, mtime, md5, sha1)}
+_checksums = {}
+
+
+def _save_checksums(path, md5, sha1):
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    _checksums[path] = st.st_size, st.st_mtime, md5, sha1
+    return md5, sha1
 
-def _file_document(name, path):
-    return {"name": name, "path": path, "md5": md5sum(path), "sha1": sha1sum(path)}
 
+def _compute_checksums(path):
+    md5, sha1 = hashlib.md5(), hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            md5.update(chunk)
+            sha1.update(chunk)
+    return md5.hexdigest(), sha1.hexdigest()
+
+
+def trace_file_checksums(path):
+    """ the md5 and sha1 of the file, computed reading it only once, kept for its trace
+    """
+    return _save_checksums(path, *_compute_checksums(path))
+
+
+class ChecksumsCalculator(object):
+    """ Computes the checksums of the trace of a file from its chunks, while it is transferred.
+    Nothing is computed if there is no trace file
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._hashes = (hashlib.md5(), hashlib.sha1()) if tracing() else None
+
+    def update(self, chunk):
+        if self._hashes:
+            for h in self._hashes:
+                h.update(chunk)
+
+    def reader(self, file_handler):
+        """ a file object that updates the checksums with what is read from the file_handler
+        """
+        calculator = self
+
+        class _Reader(object):
+            def read(self, size=-1):
+                chunk = file_handler.read(size)
+                calculator.update(chunk)
+                return chunk
+
+        return _Reader()
+
+    def save(self):
+        """ to be called when the whole file has been transferred and closed
+        """
+        if self._hashes:
+            _save_checksums(self._path, *(h.hexdigest() for h in self._hashes))
+
+
+def _file_checksums(path):
+    cached = _checksums.pop(os.path.abspath(path), None)
+    if cached:
+        st = os.stat(path)
+        if cached[:2] == (st.st_size, st.st_mtime):
+            return cached[2:]
+    return _compute_checksums(path)
+
+
+def _file_documents(files):
+    """ the documents of the {name: path} files, only computed if there is a trace file
+    """
+    if not files or not tracing():
+        return []
+    result = []
+    for name, path in files.items():
+        md5, sha1 = _file_checksums(path)
+        result.append({"name": name, "path": path, "md5": md5, "sha1": sha1})
+    return result
+
+
+# ############## LOG METHODS ######################
 
 def log_recipe_upload(ref, duration, files_uploaded, remote_name):
-    files_uploaded = files_uploaded or {}
-    files_uploaded = [_file_document(name, path) for name, path in files_uploaded.items()]
+    files_uploaded = _file_documents(files_uploaded)
     _append_action("UPLOADED_RECIPE", {"_id": repr(ref.copy_clear_rev()),
                                        "duration": duration,
                                        "files": files_uploaded,
@@ -83,8 +220,7 @@ def log_recipe_upload(ref, duration, files_uploaded, remote_name):
 
 def log_package_upload(pref, duration, files_uploaded, remote):
     """files_uploaded is a dict with relative path as keys and abs path as values"""
-    files_uploaded = files_uploaded or {}
-    files_uploaded = [_file_document(name, path) for name, path in files_uploaded.items()]
+    files_uploaded = _file_documents(files_uploaded)
     _append_action("UPLOADED_PACKAGE", {"_id": repr(pref.copy_clear_revs()),
                                         "duration": duration,
                                         "files": files_uploaded,
@@ -93,8 +229,7 @@ def log_package_upload(pref, duration, files_uploaded, remote):
 
 def log_recipe_download(ref, duration, remote_name, files_downloaded):
     assert(isinstance(ref, ConanFileReference))
-    files_downloaded = files_downloaded or {}
-    files_downloaded = [_file_document(name, path) for name, path in files_downloaded.items()]
+    files_downloaded = _file_documents(files_downloaded)
     _append_action("DOWNLOADED_RECIPE", {"_id": repr(ref.copy_clear_rev()),
                                          "duration": duration,
                                          "remote": remote_name,
@@ -103,8 +238,7 @@ def log_recipe_download(ref, duration, remote_name, files_downloaded):
 
 def log_recipe_sources_download(ref, duration, remote_name, files_downloaded):
     assert(isinstance(ref, ConanFileReference))
-    files_downloaded = files_downloaded or {}
-    files_downloaded = [_file_document(name, path) for name, path in files_downloaded.items()]
+    files_downloaded = _file_documents(files_downloaded)
     _append_action("DOWNLOADED_RECIPE_SOURCES", {"_id": repr(ref.copy_clear_rev()),
                                                  "duration": duration,
                                                  "remote": remote_name,
@@ -112,8 +246,7 @@ def log_recipe_sources_download(ref, duration, remote_name, files_downloaded):
 
 
 def log_package_download(pref, duration, remote, files_downloaded):
-    files_downloaded = files_downloaded or {}
-    files_downloaded = [_file_document(name, path) for name, path in files_downloaded.items()]
+    files_downloaded = _file_documents(files_downloaded)
     _append_action("DOWNLOADED_PACKAGE", {"_id": repr(pref.copy_clear_revs()),
                                           "duration": duration,
                                           "remote": remote.name,
@@ -168,6 +301,5 @@ def log_uncompressed_file(src_path, duration, dest_folder):
 
 
 def log_compressed_files(files, duration, tgz_path):
-    files = files or {}
-    files_compressed = [_file_document(name, path) for name, path in files.items()]
+    files_compressed = _file_documents(files)
     _append_action("ZIP", {"src": files_compressed, "dst": tgz_path, "duration": duration})